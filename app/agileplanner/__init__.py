@@ -1,12 +1,37 @@
 from .src.epic import Epic, EpicType
 from .src.feature import Feature, Features
-from .src.holiday import HolidaySchedulePort
+from .src.holiday import HolidaySchedulePort, CachingHolidaySchedule
 from .src.person import Person
-from .src.scheduler import ScheduleResult, EpicScheduleStatus, TeamScheduler
-from .src.team import Team, Organization
+from .src.scheduler import (
+    ScheduleResult,
+    EpicScheduleStatus,
+    TeamScheduler,
+    CapacityAuditLog,
+    CapacityConsumption,
+    schedule_in_order
+)
+from .src.cumulativescheduler import CumulativeTeamScheduler
+from .src.portfolioscheduler import PortfolioScheduler, PortfolioScheduleResult
+from .src.scenariorunner import run_scenarios
+from .src.workqueue import order_epics
+from .src.forecast import BatchScheduleSimulator, EpicForecast, forecast_schedule
+from .src.capacitybuckets import CapacityBuckets, Granularity, schedule_at_granularity
+from .src.team import Team, Organization, load_team_file
 from .src.teamcapacity import TeamCapacity
+from .src.capacitycache import CapacityCache
+from .src.capacityquery import CapacityQuery, CapacityIndex
+from .src.instrumentation import Instrumentation, NULL_INSTRUMENTATION, JsonLinesSink, logging_sink
 from .src.timeperiod import TimePeriod
 from .src.capacitytocsv import (
+    CapacitySheetLayout,
+    ExportFormat,
     generate_capacity_sheet_for_team,
-    generate_capacity_sheet_for_org
+    generate_capacity_sheet_for_org,
+    stream_capacity_sheet_for_team,
+    stream_capacity_sheet_for_org,
+    capacity_to_long_df,
+    schedule_results_to_df,
+    generate_capacity_export_for_team,
+    generate_capacity_export_for_org,
+    generate_schedule_export
 )
\ No newline at end of file
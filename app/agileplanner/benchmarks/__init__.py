@@ -0,0 +1 @@
+"""Benchmarks for capacity calculation, scheduling and export."""
@@ -0,0 +1,45 @@
+"""Runs the benchmarks, e.g. python -m agileplanner.benchmarks --persons 500 --baseline baseline.json"""
+import argparse
+import sys
+from .suite import find_regressions, load_baseline, run_benchmarks, save_baseline
+
+
+def main() -> int:
+    """Runs the benchmarks and returns 1 if any regressed against the baseline."""
+    parser = argparse.ArgumentParser(prog='python -m agileplanner.benchmarks', description=__doc__)
+    parser.add_argument('--persons', type=int, default=50)
+    parser.add_argument('--days', type=int, default=91)
+    parser.add_argument('--epics', type=int, default=200)
+    parser.add_argument('--out-of-office-density', type=float, default=0.05)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='a JSON baseline to compare the results against, run with its parameters')
+    parser.add_argument('--save-baseline', help='saves the results as a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='the fraction slower or bigger than the baseline allowed (default 0.2)')
+    args = parser.parse_args()
+    parameters = {
+        'persons': args.persons,
+        'days': args.days,
+        'epics': args.epics,
+        'out_of_office_density': args.out_of_office_density,
+        'seed': args.seed,
+    }
+    if args.baseline:
+        baseline_parameters, baseline = load_baseline(args.baseline)
+        parameters = baseline_parameters
+    results = run_benchmarks(repeats=args.repeats, **parameters)
+    for result in results:
+        print(result)
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline, parameters)
+    if args.baseline:
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION: {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Functions for generating synthetic teams and backlogs of any size for benchmarking."""
+import random
+from datetime import date, timedelta
+from ..src.epic import Epic, EpicType
+from ..src.feature import Feature, Features
+from ..src.holiday import HolidaySchedulePort
+from ..src.person import Person
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+
+LOCATIONS = ('US', 'UK', 'IN')
+
+# The share of persons with each skill, roughly that of a typical product team.
+DEFAULT_SKILL_MIX = {
+    EpicType.FRONTEND: 0.5,
+    EpicType.BACKEND: 0.6,
+    EpicType.QE: 0.3,
+    EpicType.DEVOPS: 0.2,
+    EpicType.DOCUMENTATION: 0.1,
+}
+
+
+class SyntheticHolidaySchedule(HolidaySchedulePort):
+    """HolidaySchedulePort implementation with a fixed share of holidays per location."""
+
+    def __init__(self, holiday_density: float = 0.03, seed: int = 0) -> None:
+        self.holiday_density = holiday_density
+        self.seed = seed
+
+    # overriding abstract method
+    def falls_on_holiday(self, some_date: date, location: str) -> bool:
+        return random.Random(f'{self.seed}:{location}:{some_date}').random() < self.holiday_density
+
+
+def generate_time_period(days: int, start_date: date = date(2024, 1, 1)) -> TimePeriod:
+    """Generates a time period of the given number of days."""
+    return TimePeriod(f'{days}_days', start_date, start_date + timedelta(days=days - 1))
+
+
+def generate_team(
+        name: str,
+        persons: int,
+        time_period: TimePeriod,
+        skill_mix: dict[EpicType, float] | None = None,
+        out_of_office_density: float = 0.05,
+        seed: int = 0) -> Team:
+    # pylint: disable=too-many-arguments
+    """
+    Generates a team of persons with random skills, locations and out of office dates.
+
+    Args:
+        name (str): The name of the team, which prefixes the name of each person.
+        persons (int): The number of persons.
+        time_period (TimePeriod): The time period out of office dates fall in.
+        skill_mix (dict[EpicType, float] | None): The chance a person has each skill.
+            Defaults to DEFAULT_SKILL_MIX. Every person has at least one skill.
+        out_of_office_density (float): The share of days each person is out of office.
+        seed (int): Seeds the random choices so the same team is generated each time.
+
+    Returns:
+        Team: The generated team.
+    """
+    rnd = random.Random(seed)
+    skill_mix = DEFAULT_SKILL_MIX if skill_mix is None else skill_mix
+    days = (time_period.end_date - time_period.start_date).days + 1
+    team = Team(name, f'{name}.yaml')
+    for i in range(persons):
+        skills = {epic_type: rnd.random() < skill_mix.get(epic_type, 0.0) for epic_type in EpicType}
+        if not any(skills.values()):
+            skills[rnd.choice(list(EpicType))] = True
+        out_of_office_dates = frozenset(
+            time_period.start_date + timedelta(days=day)
+            for day in range(days) if rnd.random() < out_of_office_density)
+        team.add_person(Person(
+            name=f'{name} Person {i}',
+            start_date=time_period.start_date - timedelta(days=rnd.randint(0, 365)),
+            end_date=time_period.end_date + timedelta(days=rnd.randint(-days // 10, 365)),
+            front_end=skills[EpicType.FRONTEND],
+            back_end=skills[EpicType.BACKEND],
+            qe=skills[EpicType.QE],
+            devops=skills[EpicType.DEVOPS],
+            documentation=skills[EpicType.DOCUMENTATION],
+            reserve_capacity=rnd.choice((0.0, 0.1, 0.25, 0.5)),
+            location=rnd.choice(LOCATIONS),
+            out_of_office_dates=out_of_office_dates,
+        ))
+    return team
+
+
+def generate_features(
+        epics: int,
+        epics_per_feature: int = 5,
+        skill_mix: dict[EpicType, float] | None = None,
+        max_size: int = 40,
+        seed: int = 0) -> Features:
+    # pylint: disable=too-many-arguments
+    """
+    Generates a backlog of features with epics of random types and sizes.
+
+    Args:
+        epics (int): The number of epics.
+        epics_per_feature (int): The number of epics in each feature.
+        skill_mix (dict[EpicType, float] | None): The relative weight of each epic type.
+            Defaults to DEFAULT_SKILL_MIX.
+        max_size (int): The largest estimated size of an epic.
+        seed (int): Seeds the random choices so the same backlog is generated each time.
+
+    Returns:
+        Features: The generated features.
+    """
+    rnd = random.Random(seed)
+    skill_mix = DEFAULT_SKILL_MIX if skill_mix is None else skill_mix
+    epic_types = list(skill_mix)
+    weights = [skill_mix[epic_type] for epic_type in epic_types]
+    features = Features('features.yaml')
+    feature = None
+    for i in range(epics):
+        if i % epics_per_feature == 0:
+            feature = Feature(f'FEAT-{i // epics_per_feature}')
+            features.add_feature(feature)
+        feature.add_epic(Epic(f'EPIC-{i}', rnd.randint(1, max_size), rnd.choices(epic_types, weights)[0]))
+    return features
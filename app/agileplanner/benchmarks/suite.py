@@ -0,0 +1,146 @@
+"""Functions for running the benchmarks and comparing them against a stored baseline."""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, NamedTuple
+from ..src.scheduler import TeamScheduler
+from ..src.teamcapacity import TeamCapacity
+from .generators import SyntheticHolidaySchedule, generate_features, generate_team, generate_time_period
+
+
+class BenchmarkResult(NamedTuple):
+    """Class representing the fastest time and the peak memory of a benchmark."""
+    name: str
+    seconds: float
+    peak_memory_bytes: int
+
+    def __str__(self) -> str:
+        return f'{self.name:<16} {self.seconds:10.4f}s {self.peak_memory_bytes / 2**20:10.1f}MiB'
+
+
+def measure(name: str, setup: Callable[[], Any], benchmark: Callable[[Any], Any], repeats: int = 3) -> BenchmarkResult:
+    """
+    Measures a benchmark, calling setup before each run so that only the
+    benchmark itself is measured.
+
+    Args:
+        name (str): The name of the benchmark.
+        setup (Callable[[], Any]): Returns the argument passed to the benchmark.
+        benchmark (Callable[[Any], Any]): The code to measure.
+        repeats (int): The number of timed runs, of which the fastest is reported.
+
+    Returns:
+        BenchmarkResult: The fastest time of the timed runs and the peak memory
+            allocated by a separate run traced with tracemalloc.
+    """
+    seconds = float('inf')
+    for _ in range(repeats):
+        argument = setup()
+        start = time.perf_counter()
+        benchmark(argument)
+        seconds = min(seconds, time.perf_counter() - start)
+    argument = setup()
+    tracemalloc.start()
+    try:
+        benchmark(argument)
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, seconds, peak_memory_bytes)
+
+
+def run_benchmarks(
+        persons: int = 50,
+        days: int = 91,
+        epics: int = 200,
+        out_of_office_density: float = 0.05,
+        repeats: int = 3,
+        seed: int = 0) -> list[BenchmarkResult]:
+    # pylint: disable=too-many-arguments
+    """
+    Benchmarks calculating the capacity of a synthetic team, scheduling a
+    synthetic backlog against it and exporting the capacity to CSV.
+
+    Args:
+        persons (int): The number of persons in the team.
+        days (int): The number of days in the time period.
+        epics (int): The number of epics in the backlog.
+        out_of_office_density (float): The share of days each person is out of office.
+        repeats (int): The number of timed runs of each benchmark.
+        seed (int): Seeds the synthetic data.
+
+    Returns:
+        list[BenchmarkResult]: The result of each benchmark.
+    """
+    time_period = generate_time_period(days)
+    team = generate_team('Synthetic', persons, time_period, out_of_office_density=out_of_office_density, seed=seed)
+    assigned_epics = generate_features(epics, seed=seed).get_epics()
+    holiday_schedule = SyntheticHolidaySchedule(seed=seed)
+
+    def new_team_capacity() -> TeamCapacity:
+        return TeamCapacity(team, time_period, holiday_schedule)
+
+    def calculated_team_capacity() -> TeamCapacity:
+        team_capacity = new_team_capacity()
+        team_capacity.calculate()
+        return team_capacity
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'capacity.csv')
+        return [
+            measure('calculate', new_team_capacity, TeamCapacity.calculate, repeats),
+            measure('build_schedule',
+                    lambda: TeamScheduler(calculated_team_capacity(), assigned_epics),
+                    TeamScheduler.build_schedule, repeats),
+            measure('capacity_csv', calculated_team_capacity,
+                    lambda team_capacity: team_capacity.get_df().to_csv(csv_path), repeats),
+        ]
+
+
+def save_baseline(results: list[BenchmarkResult], file_path: str, parameters: dict[str, Any]) -> None:
+    """Saves benchmark results, and the parameters they were run with, as a JSON baseline."""
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump({
+            'parameters': parameters,
+            'results': [result._asdict() for result in results],
+        }, file, indent=2)
+
+
+def load_baseline(file_path: str) -> tuple[dict[str, Any], list[BenchmarkResult]]:
+    """Loads the parameters and benchmark results of a JSON baseline."""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    return data['parameters'], [BenchmarkResult(**result) for result in data['results']]
+
+
+def find_regressions(
+        results: list[BenchmarkResult],
+        baseline: list[BenchmarkResult],
+        tolerance: float = 0.2) -> list[str]:
+    """
+    Compares benchmark results against a baseline.
+
+    Args:
+        results (list[BenchmarkResult]): The results to check.
+        baseline (list[BenchmarkResult]): The results to compare them against.
+        tolerance (float): How much slower or bigger, as a fraction of the baseline,
+            a result may be before it is a regression.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    baseline_by_name = {result.name: result for result in baseline}
+    regressions: list[str] = []
+    for result in results:
+        expected = baseline_by_name.get(result.name)
+        if expected is None:
+            continue
+        if result.seconds > expected.seconds * (1 + tolerance):
+            regressions.append(f'{result.name} took {result.seconds:.4f}s against {expected.seconds:.4f}s')
+        if result.peak_memory_bytes > expected.peak_memory_bytes * (1 + tolerance):
+            regressions.append(
+                f'{result.name} peaked at {result.peak_memory_bytes} bytes against {expected.peak_memory_bytes} bytes')
+    return regressions
@@ -0,0 +1,160 @@
+"""Functions for scheduling against capacity summed into buckets of days, such as weeks or sprints."""
+from collections.abc import Iterable
+from enum import Enum
+import numpy as np
+from .teamcapacity import TeamCapacity
+from .epic import Epic
+from .cumulativescheduler import CAPACITY_EPSILON
+from .scheduler import CapacityAuditLog, EpicScheduleStatus, ScheduleResult, TeamScheduler
+
+
+class Granularity(Enum):
+    """Class representing the size of the buckets capacity is summed into."""
+    DAY = 1
+    WORKING_DAY = 2
+    WEEK = 3
+    SPRINT = 4
+
+
+class CapacityBuckets:
+    # pylint: disable=too-many-instance-attributes
+    """Class representing the capacity of a team summed into buckets of days.
+
+    A bucket is named after its first day and has the same attributes as
+    TeamCapacity that schedulers use, so TeamScheduler and
+    CumulativeTeamScheduler schedule a bucket at a time when given buckets
+    instead of the daily capacity. Working days are the days other than
+    weekends, weeks start on a Monday, and sprints are sprint_days long from
+    the start of the time period."""
+
+    def __init__(self, team_capacity: TeamCapacity, granularity: Granularity, sprint_days: int = 14) -> None:
+        if sprint_days < 1:
+            raise ValueError('A sprint must be at least one day long')
+        self.team_capacity = team_capacity
+        self.granularity = granularity
+        self.team = team_capacity.team
+        self.person_index = team_capacity.person_index
+        self.epic_type_index = team_capacity.epic_type_index
+        self.skills = team_capacity.skills
+        # Days are counted from 1970-01-01, which was a Thursday.
+        days = team_capacity.days.astype(np.int64)
+        if granularity == Granularity.WORKING_DAY:
+            self.bucket_days = np.flatnonzero((days + 3) % 7 < 5)
+            bucket_starts = np.arange(len(self.bucket_days))
+        else:
+            self.bucket_days = np.arange(len(days))
+            if granularity == Granularity.WEEK:
+                buckets = (days + 3) // 7
+            elif granularity == Granularity.SPRINT:
+                buckets = (days - team_capacity.calendar_days[:1].astype(np.int64)) // sprint_days
+            else:
+                buckets = days
+            bucket_starts = np.flatnonzero(np.diff(buckets, prepend=np.iinfo(np.int64).min) != 0)
+        # The days of bucket i are bucket_days[bucket_bounds[i]:bucket_bounds[i+1]].
+        self.bucket_bounds = np.append(bucket_starts, len(self.bucket_days))
+        self.daily_column_headings = [
+            team_capacity.daily_column_headings[self.bucket_days[i]] for i in bucket_starts.tolist()]
+        self.day_index = {day: i for i, day in enumerate(self.daily_column_headings)}
+        if len(bucket_starts) > 0:
+            self.daily_capacity = np.add.reduceat(
+                team_capacity.daily_capacity[:, self.bucket_days], bucket_starts, axis=1)
+        else:
+            self.daily_capacity = np.zeros((len(self.team.person_list), 0))
+
+    def days_in_bucket(self, bucket_index: int) -> np.ndarray:
+        """Returns the indexes of the days of the time period in the given bucket."""
+        return self.bucket_days[self.bucket_bounds[bucket_index]:self.bucket_bounds[bucket_index+1]]
+
+    def get_daily_capacity_by_day(self) -> list[list[float]]:
+        """Returns the capacity as a list holding the capacity per person for each bucket."""
+        return self.daily_capacity.T.tolist()
+
+    def refine_schedule(self, schedule_results: list[ScheduleResult], audit_log: CapacityAuditLog) -> list[ScheduleResult]:
+        """
+        Replaces the start and end buckets of the scheduled epics with the days
+        they start and end on.
+
+        Within a bucket, the capacity of each person is taken to be used up day
+        by day in the order the epics consumed it, so an epic starts on the first
+        day it used anyone's capacity in its first bucket and ends on the last
+        day it used anyone's capacity in its last bucket. Only those two buckets
+        of each epic are looked at day by day.
+
+        Args:
+            schedule_results (list[ScheduleResult]): The results of scheduling the buckets.
+            audit_log (CapacityAuditLog): The capacity consumed while scheduling them.
+
+        Returns:
+            list[ScheduleResult]: The results with exact start and end dates.
+        """
+        boundary_buckets = {
+            result.epic_key: (self.day_index.get(result.start_date), self.day_index.get(result.end_date))
+            for result in schedule_results
+        }
+        capacity_by_day = self.team_capacity.get_daily_capacity_by_day()
+        consumed_before: dict[tuple[int, int], float] = {}
+        first_days: dict[str, int] = {}
+        last_days: dict[str, int] = {}
+        for entry in audit_log.entries:
+            bucket_index, person_index = self.day_index[entry.day], self.person_index[entry.person_name]
+            before = consumed_before.get((bucket_index, person_index), 0.0)
+            consumed_before[(bucket_index, person_index)] = before + entry.capacity
+            start_bucket, end_bucket = boundary_buckets.get(entry.epic_key, (None, None))
+            if bucket_index not in (start_bucket, end_bucket):
+                continue
+            days_in_bucket = self.days_in_bucket(bucket_index).tolist()
+            first_day, last_day = None, days_in_bucket[-1]
+            cumulative_capacity = 0.0
+            for day in days_in_bucket:
+                cumulative_capacity += capacity_by_day[day][person_index]
+                if first_day is None and cumulative_capacity > before + CAPACITY_EPSILON:
+                    first_day = day
+                if cumulative_capacity >= before + entry.capacity - CAPACITY_EPSILON:
+                    last_day = day
+                    break
+            first_day = last_day if first_day is None else first_day
+            if bucket_index == start_bucket:
+                first_days[entry.epic_key] = min(first_days.get(entry.epic_key, first_day), first_day)
+            if bucket_index == end_bucket:
+                last_days[entry.epic_key] = max(last_days.get(entry.epic_key, last_day), last_day)
+        days = self.team_capacity.daily_column_headings
+        return [
+            result._replace(
+                start_date=days[first_days[result.epic_key]] if result.epic_key in first_days else result.start_date,
+                end_date=days[last_days[result.epic_key]]
+                if result.epic_key in last_days and result.epic_schedule_status == EpicScheduleStatus.OK
+                else result.end_date)
+            for result in schedule_results
+        ]
+
+
+def schedule_at_granularity(
+        team_capacity: TeamCapacity,
+        epics: Iterable[Epic],
+        granularity: Granularity,
+        sprint_days: int = 14,
+        refine: bool = True) -> list[ScheduleResult]:
+    """
+    Schedules epics a bucket of days at a time rather than a day at a time.
+
+    An epic that depends on another starts no earlier than the bucket after
+    the one the other ends in, which with weeks or sprints is later than when
+    scheduling a day at a time.
+
+    Args:
+        team_capacity (TeamCapacity): The calculated capacity of the team.
+        epics (Iterable[Epic]): The epics to schedule.
+        granularity (Granularity): The size of the buckets.
+        sprint_days (int): The number of days in a sprint.
+        refine (bool): Whether to report the days epics start and end on rather
+            than the first day of the bucket they start and end in.
+
+    Returns:
+        list[ScheduleResult]: The results in the order the epics were scheduled.
+    """
+    capacity_buckets = CapacityBuckets(team_capacity, granularity, sprint_days)
+    team_scheduler = TeamScheduler(capacity_buckets, epics, audit=refine)
+    schedule_results = team_scheduler.build_schedule()
+    if refine:
+        schedule_results = capacity_buckets.refine_schedule(schedule_results, team_scheduler.audit_log)
+    return schedule_results
@@ -0,0 +1,117 @@
+"""CapacityCache."""
+import hashlib
+import os
+import shutil
+import tempfile
+import numpy as np
+from .person import Person
+
+# Bump whenever the way capacity is calculated changes so that stale entries are ignored.
+CACHE_VERSION = 1
+
+# The arrays stored for each entry, one .npy file each.
+CACHED_ARRAYS = ('daily_capacity', 'availability')
+
+
+def person_fingerprint(person: Person) -> str:
+    """Returns a representation of everything about a person that affects their capacity."""
+    return repr(person._replace(out_of_office_dates=tuple(sorted(person.out_of_office_dates))))
+
+
+class CapacityCache:
+    """Class storing calculated daily capacity on disk so it can be reused by later runs.
+
+    Each entry is a directory of .npy files, named by the fingerprint of the
+    persons, the time period and the holidays that the capacity was
+    calculated from. Entries are memory mapped copy-on-write when loaded, so
+    loading is quick and changing the loaded capacity never changes the entry.
+    The least recently used entries are removed once the entries take up more
+    than max_bytes."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def fingerprint(self, persons: list[Person], days: np.ndarray, holiday_masks: dict[str, np.ndarray]) -> str:
+        """Returns the fingerprint of the inputs to a capacity calculation.
+
+        Args:
+            persons (list[Person]): The persons on the team, in order.
+            days (np.ndarray): The days of the time period.
+            holiday_masks (dict[str, np.ndarray]): The holidays in the time
+                period for each location of the persons.
+        """
+        fingerprint = hashlib.sha256(f'{CACHE_VERSION}\n'.encode('utf-8'))
+        for person in persons:
+            fingerprint.update(person_fingerprint(person).encode('utf-8') + b'\n')
+        if len(days) > 0:
+            fingerprint.update(f'{days[0]}..{days[-1]}\n'.encode('utf-8'))
+        for location in sorted(holiday_masks):
+            fingerprint.update(location.encode('utf-8') + b'\n' + np.packbits(holiday_masks[location]).tobytes())
+        return fingerprint.hexdigest()
+
+    def entry_dir(self, fingerprint: str) -> str:
+        """Returns the directory holding the entry with the given fingerprint."""
+        return os.path.join(self.cache_dir, fingerprint)
+
+    def load(self, fingerprint: str, shape: tuple[int, int]) -> dict[str, np.ndarray] | None:
+        """Returns the arrays of the entry with the given fingerprint, or None if
+        there is no usable entry."""
+        entry_dir = self.entry_dir(fingerprint)
+        try:
+            arrays = {
+                name: np.load(os.path.join(entry_dir, name + '.npy'), mmap_mode='c', allow_pickle=False)
+                for name in CACHED_ARRAYS
+            }
+            os.utime(entry_dir)
+        except (OSError, ValueError):
+            return None
+        if any(array.shape != shape for array in arrays.values()):
+            return None
+        return arrays
+
+    def store(self, fingerprint: str, arrays: dict[str, np.ndarray]) -> None:
+        """Stores the arrays as the entry with the given fingerprint and evicts
+        the least recently used entries if the cache has grown too big.
+
+        Readers never see a partially written entry."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temporary_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.')
+        try:
+            for name in CACHED_ARRAYS:
+                np.save(os.path.join(temporary_dir, name + '.npy'), arrays[name], allow_pickle=False)
+            os.replace(temporary_dir, self.entry_dir(fingerprint))
+        except OSError:
+            # Another process stored the same entry first.
+            shutil.rmtree(temporary_dir, ignore_errors=True)
+        self.evict()
+
+    def entry_sizes(self) -> list[tuple[float, int, str]]:
+        """Returns the time each entry was last used, its size and its directory."""
+        entries = []
+        with os.scandir(self.cache_dir) as entry_dirs:
+            for entry_dir in entry_dirs:
+                if entry_dir.name.startswith('.') or not entry_dir.is_dir():
+                    continue
+                try:
+                    size = sum(os.path.getsize(os.path.join(entry_dir.path, name + '.npy')) for name in CACHED_ARRAYS)
+                    entries.append((entry_dir.stat().st_mtime, size, entry_dir.path))
+                except OSError:
+                    continue
+        return entries
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the entries take up no
+        more than max_bytes."""
+        entries = sorted(self.entry_sizes())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for _, _, entry_dir in self.entry_sizes():
+            shutil.rmtree(entry_dir, ignore_errors=True)
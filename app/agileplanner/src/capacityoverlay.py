@@ -0,0 +1,29 @@
+"""CapacityOverlay."""
+
+
+class CapacityOverlay:
+    """Class representing a copy-on-write view of the daily capacity of a team.
+
+    Days are read from the base capacity, which is shared and never modified.
+    The first time capacity is consumed on a day, the day is copied into the
+    overlay and only the copy is changed from then on."""
+
+    def __init__(self, base: list[list[float]]) -> None:
+        self.base = base
+        self.changed_days: dict[int, list[float]] = {}
+
+    def day(self, day_index: int) -> list[float]:
+        """Returns the capacity per person for the given day."""
+        changed_day = self.changed_days.get(day_index)
+        return self.base[day_index] if changed_day is None else changed_day
+
+    def get(self, day_index: int, person_index: int) -> float:
+        """Returns the capacity for the given person on the given day."""
+        return self.day(day_index)[person_index]
+
+    def subtract(self, day_index: int, person_index: int, capacity: float) -> None:
+        """Subtracts capacity from the given person on the given day."""
+        changed_day = self.changed_days.get(day_index)
+        if changed_day is None:
+            changed_day = self.changed_days[day_index] = list(self.base[day_index])
+        changed_day[person_index] -= capacity
@@ -0,0 +1,125 @@
+"""CapacityQuery."""
+from collections.abc import Iterable
+from datetime import date
+from typing import NamedTuple
+import numpy as np
+from .person import Person
+
+
+class CapacityQuery(NamedTuple):
+    """Class representing a query for the total capacity between two dates
+    inclusive, optionally only for a person, an epic type or a location.
+
+    A missing start or end date means the start or end of the time period."""
+    start_date: date | str | None = None
+    end_date: date | str | None = None
+    person: str | None = None
+    epic_type: str | None = None
+    location: str | None = None
+
+
+class CapacityIndex:
+    """Class answering range sums of capacity from cumulative sums over the days.
+
+    There is a row of cumulative capacity for each person, and for each
+    combination of epic type and location, including any epic type and any
+    location, so any query is the difference of two entries of one row.
+    Sums agree with summing the daily capacity up to floating point rounding.
+
+    The days are those capacity is stored for, and the calendar days, if
+    given, are every day of the time period, of which the days are a subset."""
+
+    def __init__(
+            self,
+            days: np.ndarray,
+            persons: list[Person],
+            skills: np.ndarray,
+            daily_capacity: np.ndarray,
+            epic_type_index: dict[str, int],
+            calendar_days: np.ndarray | None = None) -> None:
+        # pylint: disable=too-many-arguments
+        self.days = days
+        self.calendar_days = days if calendar_days is None else calendar_days
+        self.persons = persons
+        self.skills = skills
+        self.epic_type_index = epic_type_index
+        self.person_index = {person.name: i for i, person in enumerate(persons)}
+        self.location_index = {location: i for i, location in enumerate(sorted({person.location for person in persons}))}
+        person_locations = np.array([self.location_index[person.location] for person in persons], dtype=np.int64)
+        in_epic_type = np.ones((len(epic_type_index) + 1, len(persons)), dtype=bool)
+        in_epic_type[1:] = skills.T
+        in_location = np.ones((len(self.location_index) + 1, len(persons)), dtype=bool)
+        in_location[1:] = person_locations == np.arange(len(self.location_index))[:, np.newaxis]
+        in_group = (in_epic_type[:, np.newaxis, :] & in_location[np.newaxis, :, :]).reshape(-1, len(persons))
+        capacity = np.vstack([
+            in_group.astype(float) @ daily_capacity,
+            daily_capacity,
+            np.zeros((1, len(days)))
+        ])
+        self.cumulative_capacity = np.zeros((capacity.shape[0], len(days) + 1))
+        np.cumsum(capacity, axis=1, out=self.cumulative_capacity[:, 1:])
+        self.first_person_row = in_group.shape[0]
+        self.no_capacity_row = capacity.shape[0] - 1
+
+    def row_for(self, person: str | None = None, epic_type: str | None = None, location: str | None = None) -> int:
+        """Returns the row of cumulative capacity for a person, epic type and location.
+
+        Raises:
+            ValueError: If the person, epic type or location is unknown.
+        """
+        if epic_type is not None and epic_type not in self.epic_type_index:
+            raise ValueError(f'Unknown epic type {epic_type}')
+        if location is not None and location not in self.location_index:
+            raise ValueError(f'Unknown location {location}')
+        if person is not None:
+            person_index = self.person_index.get(person)
+            if person_index is None:
+                raise ValueError(f'Unknown person {person}')
+            if epic_type is not None and not self.skills[person_index, self.epic_type_index[epic_type]]:
+                return self.no_capacity_row
+            if location is not None and self.persons[person_index].location != location:
+                return self.no_capacity_row
+            return self.first_person_row + person_index
+        epic_type_row = 0 if epic_type is None else self.epic_type_index[epic_type] + 1
+        location_row = 0 if location is None else self.location_index[location] + 1
+        return epic_type_row * (len(self.location_index) + 1) + location_row
+
+    def day_bounds(self, start_dates: list, end_dates: list) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the index of the first day on or after each start date and of
+        the day after the last day on or before each end date."""
+        if len(self.days) == 0:
+            return np.zeros(len(start_dates), dtype=np.int64), np.zeros(len(end_dates), dtype=np.int64)
+        start_dates = np.array([self.days[0] if d is None else d for d in start_dates], dtype='datetime64[D]')
+        end_dates = np.array([self.days[-1] if d is None else d for d in end_dates], dtype='datetime64[D]')
+        starts = np.searchsorted(self.days, start_dates, side='left')
+        ends = np.searchsorted(self.days, end_dates, side='right')
+        return starts, np.maximum(starts, ends)
+
+    def totals(self, queries: Iterable[CapacityQuery]) -> np.ndarray:
+        """Returns the total capacity for each query."""
+        queries = list(queries)
+        rows = np.array([self.row_for(q.person, q.epic_type, q.location) for q in queries], dtype=np.int64)
+        starts, ends = self.day_bounds([q.start_date for q in queries], [q.end_date for q in queries])
+        return self.cumulative_capacity[rows, ends] - self.cumulative_capacity[rows, starts]
+
+    def total(self, query: CapacityQuery) -> float:
+        """Returns the total capacity for a query."""
+        return float(self.totals([query])[0])
+
+    def weekly_totals(
+            self,
+            person: str | None = None,
+            epic_type: str | None = None,
+            location: str | None = None) -> dict[str, float]:
+        """Returns the total capacity for each week, keyed by the first day of the
+        week in the time period. Weeks start on a Monday."""
+        row = self.cumulative_capacity[self.row_for(person, epic_type, location)]
+        # 1970-01-01 was a Thursday, so weeks counted from this way start on a Monday.
+        weeks = (self.calendar_days.astype(np.int64) + 3) // 7
+        week_start_days = self.calendar_days[np.flatnonzero(np.diff(weeks, prepend=np.iinfo(np.int64).min) != 0)]
+        # The weeks are of the calendar, so a week without any stored days has no capacity.
+        week_starts = np.searchsorted(self.days, week_start_days, side='left')
+        week_ends = np.append(week_starts[1:], len(self.days))
+        return dict(zip(
+            week_start_days.astype(str).tolist(),
+            (row[week_ends] - row[week_starts]).tolist()))
@@ -1,12 +1,33 @@
 """Functions for generating capacity sheets for teams and organizations."""
+import csv
+import os
+from enum import Enum
+import numpy as np
+import pandas as pd
 from .team import Team, Organization
 from .teamcapacity import TeamCapacity
+from .capacitycache import CapacityCache
 from .timeperiod import TimePeriod
 from .holiday import HolidaySchedulePort
+from .epic import EpicType
+from .scheduler import ScheduleResult, EpicScheduleStatus
+
+class CapacitySheetLayout(Enum):
+    """Class representing the supported layouts of a streamed capacity sheet."""
+    WIDE = 1
+    LONG = 2
+
+class ExportFormat(Enum):
+    """Class representing the supported columnar export formats.
+
+    Both need the optional pyarrow package."""
+    PARQUET = 1
+    FEATHER = 2
 
 def generate_capacity_sheet_for_team(
         team: Team, time_period: TimePeriod,
-        holiday_schedule: HolidaySchedulePort) -> TeamCapacity:
+        holiday_schedule: HolidaySchedulePort,
+        cache_dir: str | None = None) -> TeamCapacity:
     """
     Generates a capacity sheet for a given team and time period.
 
@@ -14,6 +35,8 @@ def generate_capacity_sheet_for_team(
         team (Team): The team for which to generate the capacity sheet.
         time_period (TimePeriod): The time period for which to generate the capacity sheet.
         holiday_schedule (HolidaySchedulePort): The holiday schedule to use .
+        cache_dir (str | None): A directory to cache the calculated capacity in
+            between runs, if any.
 
     Returns:
         TeamCapacity: The generated capacity sheet.
@@ -22,6 +45,7 @@ def generate_capacity_sheet_for_team(
         team,
         time_period,
         holiday_schedule=holiday_schedule,
+        cache=CapacityCache(cache_dir) if cache_dir else None,
     )
     team_capacity.calculate()
     df = team_capacity.get_df()
@@ -33,10 +57,206 @@ def generate_capacity_sheet_for_org(
         org_name: str,
         teams: list[Team],
         time_period: TimePeriod,
-        holiday_schedule: HolidaySchedulePort) -> TeamCapacity:
+        holiday_schedule: HolidaySchedulePort,
+        cache_dir: str | None = None) -> TeamCapacity:
     """ Generates a capacity sheet for a given organization and time period."""
     org = Organization(org_name)
     org_team = org.generate_team(teams)
     return generate_capacity_sheet_for_team(
-        org_team, time_period, holiday_schedule=holiday_schedule
+        org_team, time_period, holiday_schedule=holiday_schedule, cache_dir=cache_dir
+    )
+
+def stream_capacity_sheet_for_team(
+        team: Team, time_period: TimePeriod,
+        holiday_schedule: HolidaySchedulePort,
+        layout: CapacitySheetLayout = CapacitySheetLayout.WIDE) -> str:
+    """
+    Writes a capacity sheet for a given team and time period a person at a time.
+
+    Only one person's capacity is held in memory at once, rather than the whole
+    sheet. The wide layout is identical to the sheet written by
+    generate_capacity_sheet_for_team. The long layout has one row per person
+    and day with Person, Date and Capacity columns.
+
+    Args:
+        team (Team): The team for which to generate the capacity sheet.
+        time_period (TimePeriod): The time period for which to generate the capacity sheet.
+        holiday_schedule (HolidaySchedulePort): The holiday schedule to use.
+        layout (CapacitySheetLayout): The layout of the capacity sheet.
+
+    Returns:
+        str: The name of the CSV file written.
+    """
+    team_capacity = TeamCapacity(
+        team,
+        time_period,
+        holiday_schedule=holiday_schedule,
     )
+    csv_name: str = team.name + "_" + time_period.name + ".csv"
+    if layout == CapacitySheetLayout.LONG:
+        csv_name = team.name + "_" + time_period.name + "_long.csv"
+    with open(csv_name, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, lineterminator=os.linesep)
+        if layout == CapacitySheetLayout.LONG:
+            _write_long_capacity_sheet(writer, team_capacity)
+        else:
+            _write_wide_capacity_sheet(writer, team_capacity)
+    return csv_name
+
+def _write_wide_capacity_sheet(writer, team_capacity: TeamCapacity) -> None:
+    """Writes the capacity sheet with a column per day and a total row."""
+    # Days nobody is available on are written as integer zeros, as in the
+    # DataFrame, which takes a first pass over the availability of everyone.
+    # The availability is kept a bit per person and day for the second pass.
+    day_count = len(team_capacity.calendar_days)
+    packed_availability = [
+        np.packbits(team_capacity.availability_for_person(person)) for person in team_capacity.team.person_list]
+    someone_available = np.zeros(day_count, dtype=bool)
+    for packed_available in packed_availability:
+        someone_available |= np.unpackbits(packed_available, count=day_count).astype(bool)
+    someone_available_list = someone_available.tolist()
+    anyone_available = bool(someone_available.any())
+    writer.writerow([''] +
+                    team_capacity.leading_static_column_headings +
+                    team_capacity.calendar_column_headings +
+                    team_capacity.trailing_static_column_headings)
+    daily_totals = np.zeros(len(team_capacity.calendar_days))
+    team_total = 0
+    for row_number, person in enumerate(team_capacity.team.person_list):
+        available = np.unpackbits(packed_availability[row_number], count=day_count).astype(bool)
+        capacity = team_capacity.capacity_for_availability(person, available)
+        leading_static_columns = team_capacity.leading_static_columns_for_person(person)
+        total = np.add.accumulate(capacity)[-1] if available.any() else 0
+        daily_totals += capacity
+        team_total += total
+        writer.writerow(
+            [row_number] +
+            [leading_static_columns[heading] for heading in team_capacity.leading_static_column_headings] +
+            [value if someone_available_list[i] else 0 for i, value in enumerate(capacity.tolist())] +
+            [float(total) if anyone_available else total])
+    writer.writerow(
+        [len(team_capacity.team.person_list)] +
+        [team_capacity.team.name if heading == 'Team' else 'Total' if heading == 'Person' else '-'
+         for heading in team_capacity.leading_static_column_headings] +
+        [value if someone_available_list[i] else 0 for i, value in enumerate(daily_totals.tolist())] +
+        [float(team_total) if anyone_available else team_total])
+
+def _write_long_capacity_sheet(writer, team_capacity: TeamCapacity) -> None:
+    """Writes the capacity sheet with a row per person and day."""
+    writer.writerow(['Person', 'Date', 'Capacity'])
+    for person in team_capacity.team.person_list:
+        capacity, _ = team_capacity.daily_capacity_for_person(person)
+        writer.writerows(zip(
+            [person.name] * len(capacity),
+            team_capacity.calendar_column_headings,
+            capacity.tolist()))
+
+def stream_capacity_sheet_for_org(
+        org_name: str,
+        teams: list[Team],
+        time_period: TimePeriod,
+        holiday_schedule: HolidaySchedulePort,
+        layout: CapacitySheetLayout = CapacitySheetLayout.WIDE) -> str:
+    """Writes a capacity sheet for a given organization and time period a person at a time."""
+    org = Organization(org_name)
+    org_team = org.generate_team(teams)
+    return stream_capacity_sheet_for_team(
+        org_team, time_period, holiday_schedule=holiday_schedule, layout=layout
+    )
+
+def capacity_to_long_df(team_capacity: TeamCapacity) -> pd.DataFrame:
+    """Returns the calculated capacity with a row per person and day, and typed
+    Team, Person, Location, Date and Capacity columns."""
+    person_list = team_capacity.team.person_list
+    day_count = len(team_capacity.calendar_days)
+    return pd.DataFrame({
+        'Team': pd.Categorical([team_capacity.team.name] * (len(person_list) * day_count)),
+        'Person': pd.Categorical(np.repeat([person.name for person in person_list], day_count)),
+        'Location': pd.Categorical(np.repeat([person.location for person in person_list], day_count)),
+        'Date': np.tile(team_capacity.calendar_days, len(person_list)),
+        'Capacity': team_capacity.calendar_daily_capacity().ravel(),
+    })
+
+def schedule_results_to_df(schedule_results: list[ScheduleResult]) -> pd.DataFrame:
+    """Returns the schedule results with typed columns. Epics that will not start
+    or complete in time have no start or end date."""
+    return pd.DataFrame({
+        'epic_key': [result.epic_key for result in schedule_results],
+        'epic_type': pd.Categorical(
+            [result.epic_type.name for result in schedule_results],
+            categories=[epic_type.name for epic_type in EpicType]),
+        'epic_schedule_status': pd.Categorical(
+            [result.epic_schedule_status.name for result in schedule_results],
+            categories=[status.name for status in EpicScheduleStatus]),
+        'epic_estimated_size': np.array([result.epic_estimated_size for result in schedule_results], dtype=float),
+        'start_date': pd.to_datetime([result.start_date for result in schedule_results], format='%Y-%m-%d', errors='coerce'),
+        'end_date': pd.to_datetime([result.end_date for result in schedule_results], format='%Y-%m-%d', errors='coerce'),
+        'epic_remaining': np.array([result.epic_remaining for result in schedule_results], dtype=float),
+    })
+
+def export_df(df: pd.DataFrame, name: str, export_format: ExportFormat, compression: str | None = None) -> str:
+    """
+    Writes a DataFrame as a Parquet or Feather file.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        name (str): The name of the file without its extension.
+        export_format (ExportFormat): The format to write.
+        compression (str | None): The compression codec, e.g. 'snappy', 'zstd' or 'lz4'.
+            Files are uncompressed by default, which lets Feather files be memory mapped.
+
+    Returns:
+        str: The name of the file written.
+    """
+    if export_format == ExportFormat.FEATHER:
+        file_name = name + ".feather"
+        df.to_feather(file_name, compression=compression or 'uncompressed')
+    else:
+        file_name = name + ".parquet"
+        df.to_parquet(file_name, compression=compression, index=False)
+    return file_name
+
+def generate_capacity_export_for_team(
+        team: Team, time_period: TimePeriod,
+        holiday_schedule: HolidaySchedulePort,
+        export_format: ExportFormat = ExportFormat.PARQUET,
+        compression: str | None = None,
+        cache_dir: str | None = None) -> TeamCapacity:
+    # pylint: disable=too-many-arguments
+    """Generates the capacity for a given team and time period and writes it in
+    a long layout as a Parquet or Feather file."""
+    team_capacity = TeamCapacity(
+        team,
+        time_period,
+        holiday_schedule=holiday_schedule,
+        cache=CapacityCache(cache_dir) if cache_dir else None,
+    )
+    team_capacity.calculate()
+    export_df(capacity_to_long_df(team_capacity), team.name + "_" + time_period.name, export_format, compression)
+    return team_capacity
+
+def generate_capacity_export_for_org(
+        org_name: str,
+        teams: list[Team],
+        time_period: TimePeriod,
+        holiday_schedule: HolidaySchedulePort,
+        export_format: ExportFormat = ExportFormat.PARQUET,
+        compression: str | None = None,
+        cache_dir: str | None = None) -> TeamCapacity:
+    # pylint: disable=too-many-arguments
+    """Generates the capacity for a given organization and time period and writes
+    it in a long layout as a Parquet or Feather file."""
+    org = Organization(org_name)
+    org_team = org.generate_team(teams)
+    return generate_capacity_export_for_team(
+        org_team, time_period, holiday_schedule=holiday_schedule,
+        export_format=export_format, compression=compression, cache_dir=cache_dir
+    )
+
+def generate_schedule_export(
+        name: str,
+        schedule_results: list[ScheduleResult],
+        export_format: ExportFormat = ExportFormat.PARQUET,
+        compression: str | None = None) -> str:
+    """Writes the schedule results as a Parquet or Feather file and returns its name."""
+    return export_df(schedule_results_to_df(schedule_results), name, export_format, compression)
@@ -0,0 +1,136 @@
+"""CumulativeTeamScheduler."""
+from collections.abc import Iterable
+import numpy as np
+from .teamcapacity import TeamCapacity
+from .epic import Epic
+from .scheduler import (
+    EpicScheduleStatus, ScheduleResult, WILL_NOT_START, WILL_NOT_COMPLETE, schedule_in_order)
+
+# Capacity left over below this is rounding noise from partially consumed days.
+CAPACITY_EPSILON = 1e-9
+
+
+class CumulativeTeamScheduler:
+    """Class for scheduling epics given the capacity for a team using prefix sums.
+
+    Remaining capacity is kept per day and person, and summed per day and epic
+    type into running totals. The start and end day of an epic are found by
+    binary search over the running totals, and the capacity consumed is
+    cleared with a range update, so the cost of scheduling an epic does not
+    depend on how many epics were scheduled before it. Results agree with
+    TeamScheduler up to floating point rounding."""
+
+    def __init__(self, team_capacity: TeamCapacity, assigned_epics: Iterable[Epic]):
+        self.days = team_capacity.daily_column_headings
+        self.day_index = team_capacity.day_index
+        self.epic_type_index = team_capacity.epic_type_index
+        self.skills = team_capacity.skills
+        self.remaining_capacity = team_capacity.daily_capacity.T.copy()
+        self.capacity_by_epic_type = self.remaining_capacity @ self.skills
+        self.cumulative_capacity = np.cumsum(self.capacity_by_epic_type, axis=0)
+        self.assigned_epics = assigned_epics
+
+    def build_schedule(self) -> list[ScheduleResult]:
+        """Builds a schedule for the assigned epics in priority and dependency order."""
+        return schedule_in_order(self.assigned_epics, self.schedule_epic, self.day_index)
+
+    def find_start_day(self, epic_type_index: int, from_day: int = 0) -> int:
+        """Returns the index of the first day on or after from_day with capacity for the epic type."""
+        if from_day >= len(self.days):
+            return len(self.days)
+        cumulative_capacity = self.cumulative_capacity[:, epic_type_index]
+        capacity_before = cumulative_capacity[from_day-1] if from_day > 0 else 0.0
+        return int(np.searchsorted(cumulative_capacity, capacity_before, side='right'))
+
+    def find_end_day(self, epic_type_index: int, start_day: int, epic_size: float) -> int:
+        """Returns the index of the first day by which the epic type has epic_size
+        capacity available from start_day onwards, allowing for the running
+        totals falling a rounding error short of it."""
+        cumulative_capacity = self.cumulative_capacity[:, epic_type_index]
+        capacity_before_start = cumulative_capacity[start_day-1] if start_day > 0 else 0.0
+        end_day = int(np.searchsorted(
+            cumulative_capacity, capacity_before_start + epic_size - CAPACITY_EPSILON, side='left'))
+        return max(end_day, start_day)
+
+    def estimate_days(self, epic: Epic, from_day: int = 0) -> tuple[int, int]:
+        """Returns the indexes of the days the epic would start and end on if it
+        were scheduled now, without consuming any capacity. A day index of
+        len(self.days) means the epic would not start or complete in time."""
+        epic_type_index = self.epic_type_index[epic.epic_type.name]
+        start_day = self.find_start_day(epic_type_index, from_day)
+        if start_day >= len(self.days):
+            return start_day, start_day
+        end_day = self.find_end_day(epic_type_index, start_day, epic.estimated_size)
+        return start_day, min(end_day, len(self.days))
+
+    def capacity_between(self, epic_type_index: int, from_day: int, to_day: int) -> float:
+        """Returns the capacity for the epic type from from_day up to but excluding to_day."""
+        cumulative_capacity = self.cumulative_capacity[:, epic_type_index]
+        capacity_before = cumulative_capacity[from_day-1] if from_day > 0 else 0.0
+        return cumulative_capacity[to_day-1] - capacity_before
+
+    def consume_days(self, epic_type_index: int, from_day: int, to_day: int) -> None:
+        """Consumes all capacity for the epic type from from_day up to but excluding to_day."""
+        self.remaining_capacity[from_day:to_day, self.skills[:, epic_type_index]] = 0
+
+    def consume_day(self, epic_type_index: int, day: int, epic_remaining: float) -> float:
+        """Consumes capacity for the epic type on the given day a person at a time."""
+        remaining_capacity_for_day = self.remaining_capacity[day]
+        for person_index in np.flatnonzero(self.skills[:, epic_type_index]):
+            if epic_remaining < CAPACITY_EPSILON:
+                break
+            person_has_available = remaining_capacity_for_day[person_index]
+            if person_has_available > 0:
+                subtract_capacity = min(epic_remaining, person_has_available)
+                epic_remaining -= subtract_capacity
+                remaining_capacity_for_day[person_index] -= subtract_capacity
+                if remaining_capacity_for_day[person_index] < CAPACITY_EPSILON:
+                    remaining_capacity_for_day[person_index] = 0
+        return epic_remaining
+
+    def update_cumulative_capacity(self, from_day: int, to_day: int) -> None:
+        """Recalculates the running totals after capacity from from_day up to and
+        including to_day was consumed."""
+        self.capacity_by_epic_type[from_day:to_day+1] = (
+            self.remaining_capacity[from_day:to_day+1] @ self.skills)
+        capacity_before = self.cumulative_capacity[from_day-1] if from_day > 0 else 0.0
+        self.cumulative_capacity[from_day:] = capacity_before + np.cumsum(
+            self.capacity_by_epic_type[from_day:], axis=0)
+
+    def schedule_epic(self, epic: Epic, from_day: int = 0) -> ScheduleResult:
+        """Schedules an epic to start no earlier than the given day."""
+        epic_type_index = self.epic_type_index[epic.epic_type.name]
+        epic_remaining = epic.estimated_size
+        epic_start_date = WILL_NOT_START
+        epic_end_date = WILL_NOT_COMPLETE
+        epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_START
+        start_day = self.find_start_day(epic_type_index, from_day)
+        if start_day < len(self.days):
+            epic_start_date = self.days[start_day]
+            epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_COMPLETE
+            day = self.find_end_day(epic_type_index, start_day, epic_remaining)
+            if day > start_day:
+                epic_remaining -= float(
+                    self.capacity_between(epic_type_index, start_day, min(day, len(self.days))))
+                self.consume_days(epic_type_index, start_day, day)
+            # The binary search may land a day early when the running totals
+            # round differently to consuming a person at a time, in which case
+            # the remainder is consumed from the days that follow.
+            while day < len(self.days):
+                epic_remaining = self.consume_day(epic_type_index, day, epic_remaining)
+                if epic_remaining < CAPACITY_EPSILON:
+                    epic_remaining = 0
+                    epic_end_date = self.days[day]
+                    epic_schedule_status = EpicScheduleStatus.OK
+                    break
+                day += 1
+            self.update_cumulative_capacity(start_day, min(day, len(self.days)-1))
+        return ScheduleResult(
+            epic_schedule_status=epic_schedule_status,
+            epic_key=epic.key,
+            epic_type=epic.epic_type,
+            epic_estimated_size=epic.estimated_size,
+            start_date=epic_start_date,
+            end_date=epic_end_date,
+            epic_remaining=epic_remaining
+        )
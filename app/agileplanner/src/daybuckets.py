@@ -0,0 +1,34 @@
+"""DayBuckets."""
+from bisect import bisect_left, insort
+
+
+class DayBuckets:
+    """Class tracking, for each category of work, the days on which someone with
+    the skill still has capacity, as sorted lists of day indexes.
+
+    Schedulers use the buckets to jump straight to the next usable day rather
+    than scanning weekends, holidays and days that are already fully consumed."""
+
+    def __init__(self, days_by_category: dict[str, list[int]]) -> None:
+        self.days_by_category = days_by_category
+
+    def next_day(self, category_of_work: str, from_day_index: int) -> int | None:
+        """Returns the first day on or after the given day with capacity for the
+        category of work, or None if there is none."""
+        days = self.days_by_category[category_of_work]
+        i = bisect_left(days, from_day_index)
+        return days[i] if i < len(days) else None
+
+    def add(self, category_of_work: str, day_index: int) -> None:
+        """Records that there is capacity for the category of work on the given day."""
+        days = self.days_by_category[category_of_work]
+        i = bisect_left(days, day_index)
+        if i == len(days) or days[i] != day_index:
+            insort(days, day_index)
+
+    def discard(self, category_of_work: str, day_index: int) -> None:
+        """Records that there is no capacity left for the category of work on the given day."""
+        days = self.days_by_category[category_of_work]
+        i = bisect_left(days, day_index)
+        if i < len(days) and days[i] == day_index:
+            del days[i]
@@ -11,15 +11,33 @@ class EpicType(Enum):
     DOCUMENTATION = 5
 
 class Epic(NamedTuple):
-    """Class representing an epic."""
+    """Class representing an epic.
+
+    Epics with a lower priority value are scheduled first. An epic does not
+    start until the epics whose keys are in depends_on have ended. The
+    estimated size is the most likely size; min_size and max_size optionally
+    bound it when forecasting."""
     key: str
     estimated_size: int
     epic_type: EpicType
+    priority: int = 0
+    depends_on: tuple[str, ...] = ()
+    min_size: float | None = None
+    max_size: float | None = None
 
     def to_yaml(self) -> dict[str, Any]:
         """Converts the epic to a yaml object."""
-        return {
+        data: dict[str, Any] = {
             'key': self.key,
             'estimated_size': self.estimated_size,
             'epic_type' : self.epic_type.name
         }
+        if self.priority:
+            data['priority'] = self.priority
+        if self.depends_on:
+            data['depends_on'] = list(self.depends_on)
+        if self.min_size is not None:
+            data['min_size'] = self.min_size
+        if self.max_size is not None:
+            data['max_size'] = self.max_size
+        return data
@@ -1,7 +1,20 @@
 """Feature."""
+from collections.abc import Iterator
 from typing import Any
 import yaml
 from .epic import Epic, EpicType
+from .yamlloader import load_yaml, load_cached
+
+def parse_depends_on(epic_key: str, depends_on: Any) -> tuple[str, ...]:
+    """Parses the keys of the epics an epic depends on, which are either a list
+    of keys or a single key."""
+    if depends_on is None:
+        return ()
+    if isinstance(depends_on, str):
+        return (depends_on,)
+    if not isinstance(depends_on, list):
+        raise ValueError(f'Epic {epic_key} depends_on must be an epic key or a list of epic keys')
+    return tuple(str(key) for key in depends_on)
 
 class Feature:
     """Class representing a feature."""
@@ -9,10 +22,13 @@ class Feature:
     def __init__(self, key:str) -> None:
         self.key = key
         self.epic_list: list[Epic] = []
+        self._features: 'Features | None' = None
 
     def add_epic(self, epic: Epic) -> None:
         """Adds an epic to the feature."""
         self.epic_list.append(epic)
+        if self._features is not None:
+            self._features.invalidate_epic_index()
 
     def to_yaml(self) -> dict[str, Any]:
         """Converts the feature to a yaml."""
@@ -27,22 +43,36 @@ class Features:
     def __init__(self, file_path: str) -> None:
         self.feature_list: list[Feature] = []
         self.file_path = file_path
+        self._epic_index: dict[str, tuple[Feature, Epic]] | None = None
 
     def add_feature(self, feature: Feature) -> None:
         """Adds a feature to the list."""
         self.feature_list.append(feature)
+        feature._features = self  # pylint: disable=protected-access
+        self.invalidate_epic_index()
 
-    def load_from_yaml_as_string(self, yaml_string:str) -> 'Features':
+    def load_from_yaml_as_string(self, yaml_string:str | bytes) -> 'Features':
         """Loads features from a yaml string."""
-        data = yaml.safe_load(yaml_string)
+        data = load_yaml(yaml_string)
         return self.load_yaml(data)
 
-    def load_from_yaml_file(self) -> 'Features':
-        """Loads features from a yaml file."""
+    def load_from_yaml_file(self, cache_dir: str | None = None) -> 'Features':
+        """Loads features from a yaml file.
+
+        If a cache directory is given, the features and epics parsed from the
+        file are cached there and reused until the file changes."""
+        if cache_dir is not None:
+            for feature in load_cached(self.file_path, cache_dir, self.parse_models):
+                self.add_feature(feature)
+            return self
         with open(self.file_path, 'r', encoding="utf-8") as file:
-            data = yaml.safe_load(file)
+            data = load_yaml(file)
             return self.load_yaml(data)
 
+    def parse_models(self, content: bytes) -> list[Feature]:
+        """Parses the features and their epics from yaml."""
+        return Features(self.file_path).load_from_yaml_as_string(content).feature_list
+
     def load_yaml(self,data:Any) -> 'Features':
         """Loads features from a yaml."""
         for feature_data in data['features']:
@@ -51,17 +81,59 @@ class Features:
                 epic = Epic(
                     epic_data['key'], 
                     epic_data['estimated_size'],
-                    EpicType[epic_data['epic_type']])
+                    EpicType[epic_data['epic_type']],
+                    int(epic_data.get('priority', 0)),
+                    parse_depends_on(epic_data['key'], epic_data.get('depends_on')),
+                    epic_data.get('min_size'),
+                    epic_data.get('max_size'))
                 feature.add_epic(epic)
-            self.feature_list.append(feature)
+            self.add_feature(feature)
         return self
 
     def get_epics(self) -> list[Epic]:
         """Gets a list of all epics in the features."""
-        l:list[Epic] = []
+        return list(self.iter_epics())
+
+    def iter_epics(self, epic_type: EpicType | None = None, feature_key: str | None = None) -> Iterator[Epic]:
+        """Iterates over the epics in the features in order, optionally only
+        those of the given type and/or belonging to the given feature."""
+        for feature in self.feature_list:
+            if feature_key is not None and feature.key != feature_key:
+                continue
+            for epic in feature.epic_list:
+                if epic_type is None or epic.epic_type == epic_type:
+                    yield epic
+
+    @property
+    def epic_index(self) -> dict[str, tuple[Feature, Epic]]:
+        """The feature and epic for each epic key. The index is rebuilt after
+        features or epics are added with add_feature or Feature.add_epic."""
+        if self._epic_index is None:
+            self._epic_index = self.build_epic_index()
+        return self._epic_index
+
+    def invalidate_epic_index(self) -> None:
+        """Rebuilds the epic index on next use, such as after changing the
+        feature list or the epic list of a feature directly."""
+        self._epic_index = None
+
+    def build_epic_index(self) -> dict[str, tuple[Feature, Epic]]:
+        """Builds the index of the feature and epic for each epic key."""
+        index: dict[str, tuple[Feature, Epic]] = {}
         for feature in self.feature_list:
-            l = l + feature.epic_list
-        return l
+            for epic in feature.epic_list:
+                if epic.key in index:
+                    raise ValueError(f'Duplicate epic {epic.key} in features {index[epic.key][0].key} and {feature.key}')
+                index[epic.key] = (feature, epic)
+        return index
+
+    def get_epic(self, epic_key: str) -> Epic:
+        """Gets the epic with the given key."""
+        return self.epic_index[epic_key][1]
+
+    def get_feature_for_epic(self, epic_key: str) -> Feature:
+        """Gets the feature the epic with the given key belongs to."""
+        return self.epic_index[epic_key][0]
 
     def to_yaml(self):
         """Writes the features to yaml file."""
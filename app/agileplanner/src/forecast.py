@@ -0,0 +1,199 @@
+"""Functions for forecasting schedules by simulating many possible epic sizes."""
+from collections.abc import Iterable
+from typing import NamedTuple
+import numpy as np
+from .teamcapacity import TeamCapacity
+from .epic import Epic
+from .workqueue import order_epics
+from .cumulativescheduler import CAPACITY_EPSILON
+from .scheduler import WILL_NOT_START, WILL_NOT_COMPLETE
+
+PERCENTILES = (50, 85, 95)
+
+
+class EpicForecast(NamedTuple):
+    """Class representing the forecast start and end dates of an epic at each percentile."""
+    epic_key: str
+    start_dates: dict[int, str]
+    end_dates: dict[int, str]
+    completion_probability: float
+
+
+def sample_epic_sizes(epics: list[Epic], simulations: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Samples the size of each epic for each simulation from a triangular
+    distribution between its min_size and max_size with its estimated size
+    as the mode. Epics without a range always have their estimated size.
+
+    Args:
+        epics (list[Epic]): The epics to size.
+        simulations (int): The number of simulations.
+        rng (np.random.Generator): The random number generator to sample with.
+
+    Returns:
+        np.ndarray: The sizes, one row per simulation and one column per epic.
+
+    Raises:
+        ValueError: If an epic's estimated size is outside its range.
+    """
+    sizes = np.empty((simulations, len(epics)))
+    for i, epic in enumerate(epics):
+        min_size = epic.estimated_size if epic.min_size is None else epic.min_size
+        max_size = epic.estimated_size if epic.max_size is None else epic.max_size
+        if not min_size <= epic.estimated_size <= max_size:
+            raise ValueError(f'Epic {epic.key} has an estimated size outside {min_size}..{max_size}')
+        if min_size == max_size:
+            sizes[:, i] = epic.estimated_size
+        else:
+            sizes[:, i] = rng.triangular(min_size, epic.estimated_size, max_size, simulations)
+    return sizes
+
+
+class BatchScheduleSimulator:
+    """Class for scheduling the same epics with many different sizes at once.
+
+    Each simulation has its own copy of the remaining capacity, and each epic
+    is scheduled in every simulation with the same array operations. Within an
+    epic, the capacity of the skilled persons is laid out day by day, person by
+    person, and the epic consumes the prefix of it that covers its size, which
+    is what TeamScheduler does a day and a person at a time. Results agree with
+    CumulativeTeamScheduler up to floating point rounding."""
+
+    def __init__(self, team_capacity: TeamCapacity, epics: Iterable[Epic]):
+        self.days = team_capacity.daily_column_headings
+        self.epics = order_epics(epics, ignore_unknown_dependencies=True)
+        self.daily_capacity = team_capacity.daily_capacity.T
+        self.persons_by_epic_type = {
+            epic_type_name: np.flatnonzero(team_capacity.skills[:, i])
+            for epic_type_name, i in team_capacity.epic_type_index.items()
+        }
+        position_by_key = {epic.key: position for position, epic in enumerate(self.epics)}
+        self.dependencies = [
+            [position_by_key[key] for key in epic.depends_on if key in position_by_key] for epic in self.epics]
+        # An epic that depends on an epic that is not being scheduled never starts.
+        self.blocked = [any(key not in position_by_key for key in epic.depends_on) for epic in self.epics]
+
+    def simulate(self, sizes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Schedules the epics once for each row of sizes.
+
+        Args:
+            sizes (np.ndarray): The size of each epic, in the order of self.epics,
+                one row per simulation.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The index of the start and end day of
+                each epic in each simulation, len(self.days) meaning the epic did
+                not start or complete.
+        """
+        simulations = sizes.shape[0]
+        remaining_capacity = np.repeat(self.daily_capacity[:, :, np.newaxis], simulations, axis=2)
+        start_days = np.empty(sizes.shape, dtype=np.int64)
+        end_days = np.empty(sizes.shape, dtype=np.int64)
+        for position, epic in enumerate(self.epics):
+            from_days = np.full(simulations, len(self.days) if self.blocked[position] else 0, dtype=np.int64)
+            for dependency in self.dependencies[position]:
+                from_days = np.maximum(from_days, end_days[:, dependency] + 1)
+            start_days[:, position], end_days[:, position] = self.schedule_epic(
+                remaining_capacity, self.persons_by_epic_type[epic.epic_type.name],
+                sizes[:, position], np.minimum(from_days, len(self.days)))
+        return start_days, end_days
+
+    def schedule_epic(
+            self,
+            remaining_capacity: np.ndarray,
+            persons: np.ndarray,
+            sizes: np.ndarray,
+            from_days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Schedules an epic in every simulation, consuming the capacity of the
+        given persons from each simulation's from day onwards. The remaining
+        capacity is indexed by day, person and simulation."""
+        day_count = len(self.days)
+        if day_count == 0 or len(persons) == 0:
+            return np.full(len(sizes), day_count), np.full(len(sizes), day_count)
+        sizes = np.maximum(sizes, 0)
+        can_work = np.arange(day_count)[:, np.newaxis] >= from_days
+        capacity_by_day = remaining_capacity[:, persons].sum(axis=1) * can_work
+        cumulative_capacity = np.cumsum(capacity_by_day, axis=0)
+        has_capacity = capacity_by_day > 0
+        started = has_capacity.any(axis=0)
+        start_days = np.where(started, has_capacity.argmax(axis=0), day_count)
+        done = cumulative_capacity >= sizes - CAPACITY_EPSILON
+        completed = started & done.any(axis=0)
+        end_days = np.where(completed, np.maximum(done.argmax(axis=0), start_days), day_count)
+        if started.any():
+            # only the days between the earliest start and the latest end are consumed
+            first_day = start_days.min()
+            last_day = np.where(completed, end_days, day_count - 1).max() + 1
+            self.consume(remaining_capacity, persons, sizes, can_work, first_day, last_day)
+        return start_days, end_days
+
+    def consume(
+            self,
+            remaining_capacity: np.ndarray,
+            persons: np.ndarray,
+            sizes: np.ndarray,
+            can_work: np.ndarray,
+            first_day: int,
+            last_day: int) -> None:
+        # pylint: disable=too-many-arguments
+        """Consumes the capacity of the given persons from first_day up to but
+        excluding last_day, a day and a person at a time, until each simulation's
+        size is covered."""
+        days = slice(first_day, last_day)
+        available = remaining_capacity[days, persons] * can_work[days, np.newaxis, :]
+        available = available.reshape(-1, len(sizes))
+        capacity_before = np.cumsum(available, axis=0) - available
+        consumed = np.minimum(np.maximum(sizes - capacity_before, 0), available)
+        capacity_left = remaining_capacity[days, persons] - consumed.reshape(-1, len(persons), len(sizes))
+        capacity_left[capacity_left < CAPACITY_EPSILON] = 0
+        remaining_capacity[days, persons] = capacity_left
+
+
+def forecast_schedule(
+        team_capacity: TeamCapacity,
+        epics: Iterable[Epic],
+        simulations: int = 10000,
+        percentiles: Iterable[int] = PERCENTILES,
+        batch_size: int = 1000,
+        seed: int | None = None) -> list[EpicForecast]:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """
+    Forecasts the start and end dates of epics by scheduling them many times
+    with sizes sampled from their ranges.
+
+    Args:
+        team_capacity (TeamCapacity): The calculated capacity of the team.
+        epics (Iterable[Epic]): The epics to schedule.
+        simulations (int): The number of simulations to run.
+        percentiles (Iterable[int]): The percentiles to report dates for.
+        batch_size (int): The number of simulations run at once, which bounds
+            memory use to batch_size copies of the daily capacity.
+        seed (int | None): Seeds the random sizes so forecasts can be repeated.
+
+    Returns:
+        list[EpicForecast]: The forecast for each epic in the order they are scheduled.
+    """
+    percentiles = tuple(percentiles)
+    simulator = BatchScheduleSimulator(team_capacity, epics)
+    sizes = sample_epic_sizes(simulator.epics, simulations, np.random.default_rng(seed))
+    batches = [simulator.simulate(sizes[i:i+batch_size]) for i in range(0, simulations, batch_size)]
+    start_days = np.concatenate([start_days for start_days, _ in batches])
+    end_days = np.concatenate([end_days for _, end_days in batches])
+
+    def dates_at(day_indexes: np.ndarray, not_scheduled: str) -> dict[int, str]:
+        days = np.quantile(day_indexes, [percentile / 100 for percentile in percentiles], method='inverted_cdf')
+        return {
+            percentile: simulator.days[int(day)] if day < len(simulator.days) else not_scheduled
+            for percentile, day in zip(percentiles, days)
+        }
+
+    return [
+        EpicForecast(
+            epic_key=epic.key,
+            start_dates=dates_at(start_days[:, position], WILL_NOT_START),
+            end_dates=dates_at(end_days[:, position], WILL_NOT_COMPLETE),
+            completion_probability=float(np.mean(end_days[:, position] < len(simulator.days)))
+        )
+        for position, epic in enumerate(simulator.epics)
+    ]
@@ -1,12 +1,48 @@
 """HolidaySchedulePort."""
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 class HolidaySchedulePort(ABC):
-    # pylint: disable=too-few-public-methods
     """Interface for a holiday schedule. A holiday schedule is a list of dates that 
     are holidays for a given location."""
 
     @abstractmethod
     def falls_on_holiday(self,some_date: date,location: str) -> bool:
         """Returns true if the date falls on a holiday for the given location."""
+
+    def holidays_between(self, location: str, start_date: date, end_date: date) -> frozenset[date]:
+        """Returns the holidays for the given location from start_date to end_date inclusive.
+
+        Adapters backed by a calendar source should override this to fetch the
+        whole range at once rather than a day at a time."""
+        days = (start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1))
+        return frozenset(some_date for some_date in days if self.falls_on_holiday(some_date,location))
+
+class CachingHolidaySchedule(HolidaySchedulePort):
+    """Holiday schedule that remembers the answers of another holiday schedule.
+
+    The most recently used lookups are kept, up to maxsize of each kind, so the
+    same date or date range is only resolved once per location. Unless the other
+    schedule looks up date ranges in bulk, a range is resolved a date at a time
+    through the remembered dates, so overlapping ranges share their lookups."""
+
+    def __init__(self, holiday_schedule: HolidaySchedulePort, maxsize: int = 4096) -> None:
+        self.holiday_schedule = holiday_schedule
+        self.bulk_lookups = type(holiday_schedule).holidays_between is not HolidaySchedulePort.holidays_between
+        self._falls_on_holiday = lru_cache(maxsize=maxsize)(holiday_schedule.falls_on_holiday)
+        self._holidays_between = lru_cache(maxsize=maxsize)(holiday_schedule.holidays_between)
+
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return self._falls_on_holiday(some_date,location)
+
+    def holidays_between(self, location: str, start_date: date, end_date: date) -> frozenset[date]:
+        if not self.bulk_lookups:
+            return super().holidays_between(location,start_date,end_date)
+        return self._holidays_between(location,start_date,end_date)
+
+    def cache_clear(self) -> None:
+        """Forgets all remembered lookups."""
+        self._falls_on_holiday.cache_clear()
+        self._holidays_between.cache_clear()
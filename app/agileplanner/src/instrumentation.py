@@ -0,0 +1,91 @@
+"""Instrumentation."""
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+Sink = Callable[[dict[str, Any]], None]
+
+
+class Instrumentation:
+    """Class collecting the time spent in each phase of a run and counters of the
+    work done, and emitting them to sinks.
+
+    Instrumentation is opt-in: pass an Instrumentation to TeamCapacity or
+    TeamScheduler to collect it. A sink is any callable taking the emitted
+    record, such as list.append, logging_sink() or a JsonLinesSink."""
+
+    def __init__(self, sinks: list[Sink] | None = None) -> None:
+        self.sinks: list[Sink] = list(sinks or [])
+        self.timings: dict[str, float] = defaultdict(float)
+        self.counters: dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Adds the time spent in the with block to the timing for the phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Adds n to the counter."""
+        self.counters[name] += n
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns the timings, in seconds, and counters collected so far."""
+        return {'timings': dict(self.timings), 'counters': dict(self.counters)}
+
+    def emit(self, event: str) -> None:
+        """Sends the timings and counters collected so far to every sink."""
+        record = {'event': event, **self.snapshot()}
+        for sink in self.sinks:
+            sink(record)
+
+    def reset(self) -> None:
+        """Clears the timings and counters."""
+        self.timings.clear()
+        self.counters.clear()
+
+
+class NullInstrumentation(Instrumentation):
+    """Instrumentation that collects and emits nothing, used when instrumentation is off."""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        yield
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def emit(self, event: str) -> None:
+        pass
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+def logging_sink(logger: logging.Logger | None = None, level: int = logging.INFO) -> Sink:
+    """Returns a sink that logs each record as JSON, with the record itself in the
+    log record's instrumentation attribute for structured log handlers."""
+    logger = logger or logging.getLogger('agileplanner.instrumentation')
+
+    def sink(record: dict[str, Any]) -> None:
+        logger.log(level, json.dumps(record), extra={'instrumentation': record})
+
+    return sink
+
+
+class JsonLinesSink:
+    """Sink appending each record to a file as a line of JSON."""
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def __call__(self, record: dict[str, Any]) -> None:
+        with open(self.file_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record) + '\n')
@@ -1,9 +1,41 @@
 """Person class."""""
+from bisect import bisect_right
+from collections.abc import Collection
 from datetime import date
 from typing import Any, NamedTuple
 
+OUT_OF_OFFICE_RANGE_SEPARATOR = '..'
+
+def parse_out_of_office_dates(
+        entries: list[str]) -> tuple[frozenset[date], tuple[tuple[date, date], ...]]:
+    """Parses out of office entries into a set of dates and a sorted tuple of
+    non-overlapping (start, end) date ranges. An entry is either a single date
+    such as '2023-10-03' or an inclusive range such as '2023-10-03..2023-12-22'."""
+    dates: set[date] = set()
+    ranges: list[tuple[date, date]] = []
+    for entry in entries:
+        if OUT_OF_OFFICE_RANGE_SEPARATOR in entry:
+            start, end = entry.split(OUT_OF_OFFICE_RANGE_SEPARATOR)
+            start_date, end_date = date.fromisoformat(start.strip()), date.fromisoformat(end.strip())
+            if start_date > end_date:
+                raise ValueError(f'Invalid out of office range {entry}')
+            ranges.append((start_date, end_date))
+        else:
+            dates.add(date.fromisoformat(entry))
+    merged_ranges: list[tuple[date, date]] = []
+    for start_date, end_date in sorted(ranges):
+        if merged_ranges and start_date <= merged_ranges[-1][1]:
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], end_date))
+        else:
+            merged_ranges.append((start_date, end_date))
+    return frozenset(dates), tuple(merged_ranges)
+
 class Person(NamedTuple):
-    """Class representing a person."""
+    """Class representing a person.
+
+    out_of_office_dates can be any collection of dates, a set being the fastest
+    to look up. out_of_office_ranges must be sorted and non-overlapping, as
+    returned by parse_out_of_office_dates."""
     name: str
     start_date: date
     end_date: date
@@ -14,11 +46,17 @@ class Person(NamedTuple):
     documentation: bool
     reserve_capacity: float
     location: str
-    out_of_office_dates: list[date]
+    out_of_office_dates: Collection[date]
+    out_of_office_ranges: tuple[tuple[date, date], ...] = ()
 
     def is_out_of_office(self,some_date: date) -> bool:
         """Returns true if the person is out of office on the given date."""
-        return some_date in self.out_of_office_dates
+        return some_date in self.out_of_office_dates or self.is_in_out_of_office_range(some_date)
+
+    def is_in_out_of_office_range(self, some_date: date) -> bool:
+        """Returns true if the given date falls in one of the out of office ranges."""
+        i = bisect_right(self.out_of_office_ranges, (some_date, date.max)) - 1
+        return i >= 0 and some_date <= self.out_of_office_ranges[i][1]
     
     def is_not_active(self, some_date: date) -> bool:
         """Returns true if the person is not active on the given date."""
@@ -41,7 +79,10 @@ class Person(NamedTuple):
             'documentation': self.documentation,
             'reserve_capacity': self.reserve_capacity,
             'location': self.location,
-            'out_of_office_dates': [d.isoformat() for d in self.out_of_office_dates],
+            'out_of_office_dates': [d.isoformat() for d in sorted(self.out_of_office_dates)] + [
+                start.isoformat() + OUT_OF_OFFICE_RANGE_SEPARATOR + end.isoformat()
+                for start, end in self.out_of_office_ranges
+            ],
         }
 
     def __str__(self) -> str:
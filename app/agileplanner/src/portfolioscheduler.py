@@ -0,0 +1,86 @@
+"""PortfolioScheduler."""
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import NamedTuple
+from .teamcapacity import TeamCapacity
+from .epic import Epic
+from .cumulativescheduler import CumulativeTeamScheduler
+from .scheduler import EpicScheduleStatus, ScheduleResult, schedule_in_order
+
+
+class PortfolioScheduleResult(NamedTuple):
+    """Class representing the result of scheduling an epic and the team it was assigned to.
+    The team name is None if no team could start the epic or it was blocked."""
+    team_name: str | None
+    schedule_result: ScheduleResult
+
+
+class PortfolioScheduler:
+    """Class for scheduling a backlog of epics across several teams.
+
+    Each epic, in priority and dependency order, is assigned to the team that
+    would complete it earliest, or failing that start it earliest, with ties
+    going to the team listed first. Each team keeps its own remaining capacity
+    in a CumulativeTeamScheduler, so evaluating a team is a pair of binary
+    searches over its running totals and does not consume any capacity.
+
+    Days are indexed by the calendar of the time period, so teams whose
+    capacity is sparse, and only stores the days someone is available, can be
+    scheduled alongside each other and alongside teams that store every day."""
+
+    def __init__(self, team_capacities: list[TeamCapacity], backlog: Iterable[Epic]):
+        if not team_capacities:
+            raise ValueError('At least one team capacity is required')
+        self.days = team_capacities[0].calendar_column_headings
+        self.day_index = team_capacities[0].calendar_day_index
+        self.team_schedulers: dict[str, CumulativeTeamScheduler] = {}
+        # The calendar index of each day a team stores, followed by the number
+        # of days in the calendar for the day after the last one.
+        self.calendar_days_by_team: dict[str, list[int]] = {}
+        for team_capacity in team_capacities:
+            if team_capacity.calendar_column_headings != self.days:
+                raise ValueError(f'Team {team_capacity.team.name} has capacity for a different time period')
+            if team_capacity.team.name in self.team_schedulers:
+                raise ValueError(f'Duplicate team {team_capacity.team.name}')
+            self.team_schedulers[team_capacity.team.name] = CumulativeTeamScheduler(team_capacity, [])
+            self.calendar_days_by_team[team_capacity.team.name] = team_capacity.stored_days.tolist() + [len(self.days)]
+        self.backlog = backlog
+
+    def build_schedule(self) -> list[PortfolioScheduleResult]:
+        """Builds a schedule for the backlog, assigning each epic to a team."""
+        team_names: list[str | None] = []
+
+        def schedule_epic(epic: Epic, from_day: int) -> ScheduleResult:
+            team_name = self.choose_team(epic, from_day)
+            team_names.append(team_name)
+            team_name = team_name or next(iter(self.team_schedulers))
+            return self.team_schedulers[team_name].schedule_epic(epic, self.team_day(team_name, from_day))
+
+        schedule_results = schedule_in_order(self.backlog, schedule_epic, self.day_index)
+        chosen_team_names = iter(team_names)
+        return [
+            PortfolioScheduleResult(
+                None if result.epic_schedule_status == EpicScheduleStatus.BLOCKED_BY_DEPENDENCY
+                else next(chosen_team_names),
+                result)
+            for result in schedule_results
+        ]
+
+    def choose_team(self, epic: Epic, from_day: int = 0) -> str | None:
+        """Returns the name of the team that would complete the epic earliest,
+        or start it earliest if no team can complete it, or None if no team can start it."""
+        best_team_name = None
+        best_days = (len(self.days), len(self.days))
+        for team_name, team_scheduler in self.team_schedulers.items():
+            calendar_days = self.calendar_days_by_team[team_name]
+            start_day, end_day = team_scheduler.estimate_days(epic, self.team_day(team_name, from_day))
+            start_day, end_day = calendar_days[start_day], calendar_days[end_day]
+            if (end_day, start_day) < best_days:
+                best_team_name, best_days = team_name, (end_day, start_day)
+        return best_team_name
+
+    def team_day(self, team_name: str, calendar_day: int) -> int:
+        """Returns the index, among the days the team stores, of the first day
+        on or after the given day of the calendar."""
+        calendar_days = self.calendar_days_by_team[team_name]
+        return bisect_left(calendar_days, calendar_day, hi=len(calendar_days) - 1)
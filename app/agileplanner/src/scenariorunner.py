@@ -0,0 +1,51 @@
+"""Functions for scheduling what-if scenarios against the same team capacity in parallel."""
+from concurrent.futures import ProcessPoolExecutor
+from .teamcapacity import TeamCapacity
+from .epic import Epic
+from .scheduler import TeamScheduler, ScheduleResult
+
+# The team capacity shipped to each worker process by _initialize_worker.
+_worker_team_capacity: TeamCapacity | None = None
+
+
+def _initialize_worker(team_capacity: TeamCapacity) -> None:
+    """Stores the team capacity for the scenarios scheduled by this worker."""
+    global _worker_team_capacity  # pylint: disable=global-statement
+    _worker_team_capacity = team_capacity
+
+
+def _schedule_scenario(epics: list[Epic], scheduler_class: type) -> list[ScheduleResult]:
+    """Schedules the epics of a scenario against the team capacity of this worker."""
+    return scheduler_class(_worker_team_capacity, epics).build_schedule()
+
+
+def run_scenarios(
+        team_capacity: TeamCapacity,
+        scenarios: dict[str, list[Epic]],
+        max_workers: int | None = None,
+        scheduler_class: type = TeamScheduler) -> dict[str, list[ScheduleResult]]:
+    """
+    Schedules each scenario against the same team capacity across a pool of processes.
+
+    Args:
+        team_capacity (TeamCapacity): The calculated capacity shared by all scenarios.
+        scenarios (dict[str, list[Epic]]): The epics to schedule, in order, keyed by scenario name.
+        max_workers (int | None): The number of processes to use. Defaults to the number of CPUs.
+        scheduler_class (type): The scheduler used for each scenario, e.g. TeamScheduler
+            or CumulativeTeamScheduler.
+
+    Returns:
+        dict[str, list[ScheduleResult]]: The schedule for each scenario keyed by scenario name.
+    """
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(team_capacity,)) as executor:
+        futures = {
+            scenario_name: executor.submit(_schedule_scenario, epics, scheduler_class)
+            for scenario_name, epics in scenarios.items()
+        }
+        return {
+            scenario_name: future.result()
+            for scenario_name, future in futures.items()
+        }
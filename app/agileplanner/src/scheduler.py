@@ -1,10 +1,16 @@
 """Scheduler."""
-import copy
+from collections.abc import Callable, Iterable
 from typing import NamedTuple
 from enum import Enum
 from .teamcapacity import TeamCapacity
+from .capacityoverlay import CapacityOverlay
+from .daybuckets import DayBuckets
 from .epic import EpicType, Epic
+from .workqueue import order_epics
+from .instrumentation import Instrumentation, NULL_INSTRUMENTATION
 
+WILL_NOT_START = "WILL NOT START"
+WILL_NOT_COMPLETE = "WILL NOT COMPLETE IN TIME"
 
 class EpicStateDuringScheduling(Enum):
     """Class representing the various states of an epic during scheduling."""
@@ -18,6 +24,7 @@ class EpicScheduleStatus(Enum):
     NO_CAPACITY_TO_START = 1
     NO_CAPACITY_TO_COMPLETE = 2
     OK = 3
+    BLOCKED_BY_DEPENDENCY = 4
 
 
 class ScheduleResult(NamedTuple):
@@ -35,70 +42,197 @@ class ScheduleResult(NamedTuple):
         return f'{self.epic_key} {self.epic_estimated_size} {self.epic_type} {self.epic_schedule_status}: starts {self.start_date} and ends {self.end_date} with {self.epic_remaining} remaining'
 
 
+def schedule_in_order(
+        epics: Iterable[Epic],
+        schedule_epic: Callable[[Epic, int], ScheduleResult],
+        day_index: dict[str, int]) -> list[ScheduleResult]:
+    """
+    Schedules epics by priority such that no epic starts before the day after
+    all the epics it depends on have ended. An epic that depends on an epic
+    that did not complete, or that is not among the epics, is blocked and not
+    scheduled.
+
+    Args:
+        epics (Iterable[Epic]): The epics to schedule.
+        schedule_epic (Callable[[Epic, int], ScheduleResult]): Schedules an epic
+            starting no earlier than the given day index.
+        day_index (dict[str, int]): The index of each day in the time period.
+
+    Returns:
+        list[ScheduleResult]: The results in the order the epics were scheduled.
+    """
+    schedule_results: list[ScheduleResult] = []
+    end_day_by_key: dict[str, int | None] = {}
+    for epic in order_epics(epics, ignore_unknown_dependencies=True):
+        end_days = [end_day_by_key.get(key) for key in epic.depends_on]
+        if None in end_days:
+            result = ScheduleResult(
+                epic_schedule_status=EpicScheduleStatus.BLOCKED_BY_DEPENDENCY,
+                epic_key=epic.key,
+                epic_type=epic.epic_type,
+                epic_estimated_size=epic.estimated_size,
+                start_date=WILL_NOT_START,
+                end_date=WILL_NOT_COMPLETE,
+                epic_remaining=epic.estimated_size
+            )
+        else:
+            result = schedule_epic(epic, max(end_days, default=-1) + 1)
+        end_day_by_key[epic.key] = (
+            day_index[result.end_date] if result.epic_schedule_status == EpicScheduleStatus.OK else None)
+        schedule_results.append(result)
+    return schedule_results
+
+
+class CapacityConsumption(NamedTuple):
+    """Class representing capacity consumed from a person on a given day."""
+    day: str
+    person_name: str
+    category_of_work: str
+    capacity: float
+    epic_key: str | None = None
+
+
+class CapacityAuditLog:
+    """Class recording the capacity consumed while scheduling so that it can be replayed."""
+    def __init__(self) -> None:
+        self.entries: list[CapacityConsumption] = []
+
+    def record(self, consumption: CapacityConsumption) -> None:
+        """Records capacity consumed."""
+        self.entries.append(consumption)
+
+    def replay(self, team_scheduler: 'TeamScheduler') -> None:
+        """Consumes the recorded capacity from the given scheduler."""
+        for entry in self.entries:
+            team_scheduler.consume_capacity(entry.day, entry.person_name, entry.capacity)
+
+
 class TeamScheduler:
+    # pylint: disable=too-many-instance-attributes
     """Class for scheduling epics givwn the capacity for a team."""
-    def __init__(self, team_capacity: TeamCapacity, assigned_epics: set[Epic]):
-        # self.capacity_data = copy.deepcopy(team_capacity.total_capacity_data)
-        self.detailed_capacity_data = copy.deepcopy(
-            team_capacity.detailed_capacity_data)
+    def __init__(
+            self,
+            team_capacity: TeamCapacity,
+            assigned_epics: Iterable[Epic],
+            audit: bool = False,
+            instrumentation: Instrumentation | None = None):
+        self.days = team_capacity.daily_column_headings
+        self.day_index = team_capacity.day_index
+        self.person_names = [person.name for person in team_capacity.team.person_list]
+        self.person_index = team_capacity.person_index
+        self.skills = {
+            epic_type_name: team_capacity.skills[:, i].tolist()
+            for epic_type_name, i in team_capacity.epic_type_index.items()
+        }
+        self.categories_for_person = [
+            [epic_type_name for epic_type_name, has_skill in self.skills.items() if has_skill[person_index]]
+            for person_index in range(len(self.person_names))
+        ]
+        self.remaining_capacity = CapacityOverlay(team_capacity.get_daily_capacity_by_day())
+        self.days_with_capacity = DayBuckets({
+            epic_type_name: (
+                (team_capacity.daily_capacity > 0) & team_capacity.skills[:, [i]]).any(axis=0).nonzero()[0].tolist()
+            for epic_type_name, i in team_capacity.epic_type_index.items()
+        })
         self.assigned_epics = assigned_epics
+        self.audit_log = CapacityAuditLog() if audit else None
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
 
-    def build_schedule(self):
-        """Builds a schedule for the assigned epics."""
-        schedule_results: list[ScheduleResult] = []
-        for epic in self.assigned_epics:
-            result = self.schedule_epic(epic)
-            schedule_results.append(result)
+    def build_schedule(self) -> list[ScheduleResult]:
+        """Builds a schedule for the assigned epics in priority and dependency order."""
+        with self.instrumentation.phase('build_schedule'):
+            schedule_results = schedule_in_order(self.assigned_epics, self.schedule_epic, self.day_index)
+        self.instrumentation.emit('build_schedule')
         return schedule_results
 
+    def remaining_capacity_for(self, day, person_name) -> float:
+        """Returns the capacity the given person has left on the given day."""
+        return self.remaining_capacity.get(self.day_index[day], self.person_index[person_name])
+
+    def consume_capacity(self, day, person_name, capacity) -> None:
+        """Consumes capacity from the given person on the given day."""
+        day_index, person_index = self.day_index[day], self.person_index[person_name]
+        self.remaining_capacity.subtract(day_index, person_index, capacity)
+        self.update_days_with_capacity(day_index, person_index)
+
+    def update_days_with_capacity(self, day_index, person_index) -> None:
+        """Updates the days with capacity for the skills of the given person after
+        their capacity on the given day has changed."""
+        capacity_for_day = self.remaining_capacity.day(day_index)
+        for category_of_work in self.categories_for_person[person_index]:
+            if capacity_for_day[person_index] > 0:
+                self.days_with_capacity.add(category_of_work, day_index)
+            elif not any(
+                    has_skill and remaining_capacity > 0
+                    for has_skill, remaining_capacity in zip(self.skills[category_of_work], capacity_for_day)):
+                self.days_with_capacity.discard(category_of_work, day_index)
+
     def who_has_capacity(self, day, category_of_work):
         """Returns a list of persons who have capacity for the category of work on the given day."""
-        l = []
-        for person_name in self.detailed_capacity_data[day].keys():
-            remaining_capacity = sum(
-                self.detailed_capacity_data[day][person_name][category_of_work])
-            if remaining_capacity > 0:
-                l.append(person_name)
-        return l
-
-    def apply_capacity(self, day, category_of_work, person_name, epic_remaining):
+        return [
+            person_name
+            for person_name, has_skill, remaining_capacity in zip(
+                self.person_names, self.skills[category_of_work], self.remaining_capacity.day(self.day_index[day]))
+            if has_skill and remaining_capacity > 0
+        ]
+
+    def apply_capacity(self, day, category_of_work, person_name, epic_remaining, epic_key=None):
+        # pylint: disable=too-many-arguments
         """Applies capacity for the category of work on the given day for the given person."""
-        person_has_available = sum(
-            self.detailed_capacity_data[day][person_name][category_of_work])
+        person_has_available = self.remaining_capacity_for(day, person_name)
         if person_has_available > 0:
             subtract_capacity = min(epic_remaining, person_has_available)
             epic_remaining -= subtract_capacity
-            for c in EpicType:
-                self.detailed_capacity_data[day][person_name][c.name].append(
-                    -subtract_capacity)
+            self.consume_capacity(day, person_name, subtract_capacity)
+            if self.audit_log is not None:
+                self.audit_log.record(CapacityConsumption(
+                    day, person_name, category_of_work, subtract_capacity, epic_key))
         return epic_remaining
 
-    def schedule_epic(self, epic) -> ScheduleResult:
-        """Schedules an epic."""
-        epic_size = epic.estimated_size
-        epic_state = EpicStateDuringScheduling.NOT_STARTED
-        epic_remaining = epic_size
-        epic_start_date = "WILL NOT START"
-        epic_end_date = "WILL NOT COMPLETE IN TIME"
-        for day in self.detailed_capacity_data.keys():
-            if epic_state == EpicStateDuringScheduling.DONE:
-                break
-            list_of_persons = self.who_has_capacity(day, epic.epic_type.name)
-            for person in list_of_persons:
-                if epic_state == EpicStateDuringScheduling.NOT_STARTED:
-                    epic_start_date = day
-                    epic_state = EpicStateDuringScheduling.IN_PROGRESS
-                if epic_remaining > 0:
-                    epic_remaining = self.apply_capacity(
-                        day, epic.epic_type.name, person, epic_remaining)
-            if epic_remaining == 0:
-                epic_end_date = day
+    def schedule_epic(self, epic, from_day_index=0) -> ScheduleResult:
+        """Schedules an epic to start no earlier than the given day."""
+        who_has_capacity_calls = 0
+        capacity_applications = 0
+        with self.instrumentation.phase('schedule_epic'):
+            epic_size = epic.estimated_size
+            epic_state = EpicStateDuringScheduling.NOT_STARTED
+            epic_remaining = epic_size
+            epic_start_date = WILL_NOT_START
+            epic_end_date = WILL_NOT_COMPLETE
+            if epic_remaining == 0 and from_day_index < len(self.days):
+                # nothing to do, so the epic is done on the first day whether or not anyone has capacity
+                who_has_capacity_calls += 1
+                if self.who_has_capacity(self.days[from_day_index], epic.epic_type.name):
+                    epic_start_date = self.days[from_day_index]
+                epic_end_date = self.days[from_day_index]
                 epic_state = EpicStateDuringScheduling.DONE
-        epic_schedule_status = EpicScheduleStatus.OK
-        if epic_state == EpicStateDuringScheduling.NOT_STARTED:
-            epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_START
-        elif epic_state == EpicStateDuringScheduling.IN_PROGRESS:
-            epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_COMPLETE
+            day_index = self.days_with_capacity.next_day(epic.epic_type.name, from_day_index)
+            while day_index is not None:
+                if epic_state == EpicStateDuringScheduling.DONE:
+                    break
+                day = self.days[day_index]
+                who_has_capacity_calls += 1
+                list_of_persons = self.who_has_capacity(day, epic.epic_type.name)
+                for person in list_of_persons:
+                    if epic_state == EpicStateDuringScheduling.NOT_STARTED:
+                        epic_start_date = day
+                        epic_state = EpicStateDuringScheduling.IN_PROGRESS
+                    if epic_remaining > 0:
+                        capacity_applications += 1
+                        epic_remaining = self.apply_capacity(
+                            day, epic.epic_type.name, person, epic_remaining, epic.key)
+                if epic_remaining == 0:
+                    epic_end_date = day
+                    epic_state = EpicStateDuringScheduling.DONE
+                day_index = self.days_with_capacity.next_day(epic.epic_type.name, day_index + 1)
+            epic_schedule_status = EpicScheduleStatus.OK
+            if epic_state == EpicStateDuringScheduling.NOT_STARTED:
+                epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_START
+            elif epic_state == EpicStateDuringScheduling.IN_PROGRESS:
+                epic_schedule_status = EpicScheduleStatus.NO_CAPACITY_TO_COMPLETE
+        self.instrumentation.count('epics_scheduled')
+        self.instrumentation.count('who_has_capacity_calls', who_has_capacity_calls)
+        self.instrumentation.count('capacity_applications', capacity_applications)
         return ScheduleResult(
             epic_schedule_status=epic_schedule_status,
             epic_key=epic.key,
@@ -1,8 +1,13 @@
 """Team."""
+import glob
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from typing import Any
 import yaml
-from .person import Person
+from .person import Person, parse_out_of_office_dates
+from .yamlloader import load_yaml, load_cached
 
 class Team:
     """Class representing a team."""
@@ -19,17 +24,28 @@ class Team:
         """Adds a list of people to the team."""
         self.person_list += list_of_people
 
-    def load_from_yaml_as_string(self, yaml_string:str) -> 'Team':
+    def load_from_yaml_as_string(self, yaml_string:str | bytes) -> 'Team':
         """Loads a team from a yaml string."""
-        data = yaml.safe_load(yaml_string)
+        data = load_yaml(yaml_string)
         return self.load_yaml(data)
 
-    def load_from_yaml_file(self) -> 'Team':
-        """Loads a team from a yaml file."""
+    def load_from_yaml_file(self, cache_dir: str | None = None) -> 'Team':
+        """Loads a team from a yaml file.
+
+        If a cache directory is given, the persons parsed from the file are
+        cached there and reused until the file changes."""
+        if cache_dir is not None:
+            self.name, self.person_list = load_cached(self.file_path, cache_dir, self.parse_models)
+            return self
         with open(self.file_path, 'r', encoding='utf-8') as file:
-            data = yaml.safe_load(file)
+            data = load_yaml(file)
             return self.load_yaml(data)
 
+    def parse_models(self, content: bytes) -> tuple[str, list[Person]]:
+        """Parses the name of the team and its persons from yaml."""
+        team = Team(self.name, self.file_path).load_from_yaml_as_string(content)
+        return team.name, team.person_list
+
     def load_yaml(self,data:Any) -> 'Team':
         # pylint: disable=line-too-long
         """Loads a team from yaml."""
@@ -37,6 +53,7 @@ class Team:
         self.name = team_data['name']
         self.person_list = []
         for person_data in team_data['persons']:
+            out_of_office_dates, out_of_office_ranges = parse_out_of_office_dates(person_data['out_of_office_dates'])
             person = Person(
                 name=person_data['name'],
                 start_date=date.fromisoformat(person_data['start_date']),
@@ -48,11 +65,24 @@ class Team:
                 documentation=person_data['documentation'],
                 reserve_capacity=float(person_data['reserve_capacity']),
                 location=person_data['location'],
-                out_of_office_dates=[date.fromisoformat(d) for d in person_data['out_of_office_dates']],
+                out_of_office_dates=out_of_office_dates,
+                out_of_office_ranges=out_of_office_ranges,
             )
             self.person_list.append(person)
         return self
 
+    def validate(self) -> None:
+        """Raises a ValueError if the team is not valid."""
+        names: set[str] = set()
+        for person in self.person_list:
+            if person.name in names:
+                raise ValueError(f'{self.file_path}: duplicate person {person.name}')
+            names.add(person.name)
+            if person.start_date > person.end_date:
+                raise ValueError(f'{self.file_path}: {person.name} ends before they start')
+            if not 0.0 <= person.reserve_capacity <= 1.0:
+                raise ValueError(f'{self.file_path}: {person.name} has a reserve capacity outside 0..1')
+
     def to_yaml(self):
         """Writes the team to a yaml file."""
         persons_data:list[dict[str,Any]] = []
@@ -70,12 +100,79 @@ class Team:
     def __str__(self) -> str:
         return f'Team: {self.name} [ {self.person_list}]'
 
+def find_team_files(path: str) -> list[str]:
+    """Returns the sorted yaml files in a directory, or the files matching a glob pattern."""
+    if os.path.isdir(path):
+        file_paths = glob.glob(os.path.join(path, '*.yaml')) + glob.glob(os.path.join(path, '*.yml'))
+    else:
+        file_paths = glob.glob(path)
+    return sorted(file_paths)
+
+def load_team_file(file_path: str, cache_dir: str | None = None) -> Team:
+    """Loads and validates a team from a yaml file, raising a ValueError naming
+    the file if it is not a valid team."""
+    try:
+        team = Team('', file_path).load_from_yaml_file(cache_dir)
+    except (KeyError, TypeError, ValueError, yaml.YAMLError) as error:
+        raise ValueError(f'{file_path}: not a valid team file ({error!r})') from error
+    team.validate()
+    return team
+
 class Organization:
     """Class representing an organization."""
 
     def __init__(self, org_name:str) -> None:
         self.org_name = org_name
 
+    def load_teams(
+            self,
+            path: str,
+            max_workers: int | None = None,
+            cache_dir: str | None = None) -> list[Team]:
+        """
+        Loads the teams in a directory, or matching a glob pattern, parsing the
+        files across a pool of processes.
+
+        Args:
+            path (str): A directory of team yaml files or a glob pattern such as 'teams/*.yaml'.
+            max_workers (int | None): The number of processes to use. Defaults to the number of CPUs.
+            cache_dir (str | None): The directory in which to cache parsed teams, if any.
+
+        Returns:
+            list[Team]: The teams sorted by file path.
+
+        Raises:
+            ValueError: If no files are found, a file is not a valid team or the
+                same person is in more than one team.
+        """
+        file_paths = find_team_files(path)
+        if not file_paths:
+            raise ValueError(f'No team files found in {path}')
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            teams = list(executor.map(load_team_file, file_paths, [cache_dir] * len(file_paths)))
+        self.check_for_duplicate_persons(teams)
+        return teams
+
+    def load_org_team(
+            self,
+            path: str,
+            max_workers: int | None = None,
+            cache_dir: str | None = None) -> Team:
+        """Loads the teams in a directory, or matching a glob pattern, and generates
+        the single team that represents the organization."""
+        return self.generate_team(self.load_teams(path, max_workers, cache_dir))
+
+    def check_for_duplicate_persons(self, teams: list[Team]) -> None:
+        """Raises a ValueError if any person is in more than one team."""
+        file_paths_by_name: dict[str, list[str]] = defaultdict(list)
+        for team in teams:
+            for person in team.person_list:
+                file_paths_by_name[person.name].append(team.file_path)
+        duplicates = {name: file_paths for name, file_paths in file_paths_by_name.items() if len(file_paths) > 1}
+        if duplicates:
+            details = '; '.join(f'{name} in {", ".join(file_paths)}' for name, file_paths in sorted(duplicates.items()))
+            raise ValueError(f'Persons in more than one team: {details}')
+
     def generate_team(self,teams: list[Team]) -> Team:
         """Generates a single team from a list of teams that represent the organization."""
         org_team  = Team(self.org_name, "NONE")
@@ -1,15 +1,45 @@
 """TeamCapacity."""
+from collections.abc import Iterable
+from datetime import date
+import numpy as np
 import pandas as pd
 from .team import Team
-from .holiday import HolidaySchedulePort
+from .holiday import HolidaySchedulePort, CachingHolidaySchedule
+from .capacitycache import CapacityCache
+from .capacityquery import CapacityIndex, CapacityQuery
+from .instrumentation import Instrumentation, NULL_INSTRUMENTATION
 from .person import Person
 from .epic import EpicType
 from .timeperiod import TimePeriod
 
+# The column of the capacity sheet holding the flag for each skill.
+SKILL_COLUMNS = {
+    'Front End': EpicType.FRONTEND,
+    'Back End': EpicType.BACKEND,
+    'QE': EpicType.QE,
+    'DevOps': EpicType.DEVOPS,
+    'Documentation': EpicType.DOCUMENTATION,
+}
+
+SKILL_ATTRIBUTES = {
+    EpicType.FRONTEND: 'front_end',
+    EpicType.BACKEND: 'back_end',
+    EpicType.QE: 'qe',
+    EpicType.DEVOPS: 'devops',
+    EpicType.DOCUMENTATION: 'documentation',
+}
+
 class TeamCapacity():
     # pylint: disable=line-too-long, too-many-instance-attributes
-    """Class representing the capacity for a team."""
-    def __init__(self,  team: Team, time_period:TimePeriod, holiday_schedule:HolidaySchedulePort) -> None:
+    """Class representing the capacity for a team.
+
+    With sparse, capacity is only stored for the days on which someone is
+    available. days, daily_column_headings, day_index and the capacity arrays
+    then cover just those days, while the calendar attributes cover every day
+    of the time period. The dataframe and total_capacity_data always have
+    every day, with zeros for the days that are not stored."""
+    def __init__(self,  team: Team, time_period:TimePeriod, holiday_schedule:HolidaySchedulePort, instrumentation: Instrumentation | None = None, cache: CapacityCache | None = None, sparse: bool = False) -> None:
+        # pylint: disable=too-many-arguments
         if time_period.is_valid() is False:
             raise ValueError('Invalid time period')
         self.team = team
@@ -17,6 +47,9 @@ class TeamCapacity():
         self.end_date = time_period.end_date
         self.date_range = pd.date_range(time_period.start_date,time_period.end_date, freq="D")
         self.holiday_schedule = holiday_schedule
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        self.cache = cache
+        self.sparse = sparse
         self.total_capacity_data = {}
         self.leading_static_column_headings = [
             'Team',
@@ -31,17 +64,59 @@ class TeamCapacity():
             'DevOps',
             'Reserve Capacity'
         ]
-        self.daily_column_headings = [dt.strftime('%Y-%m-%d') for dt in self.date_range]
+        self.calendar_column_headings = [dt.strftime('%Y-%m-%d') for dt in self.date_range]
         self.trailing_static_column_headings = [
             'Total'
         ]
-        self.data = {}
-        all_column_headings = self.leading_static_column_headings + self.daily_column_headings + self.trailing_static_column_headings 
-        for column_heading in all_column_headings:
-            self.data[column_heading] = []
-        self.detailed_capacity_data = {}
+        self.calendar_day_index = {day: i for i, day in enumerate(self.calendar_column_headings)}
+        self.epic_type_index = {epic_type.name: i for i, epic_type in enumerate(EpicType)}
+        self.calendar_days = self.date_range.values.astype('datetime64[D]')
+        self.size_for_team()
+        self._daily_capacity_by_day = None
+        self._weekend_mask = None
+        self._holiday_masks = {}
+        self._out_of_office_days = {}
+        self._detailed_capacity_data = None
+        self._capacity_index = None
+        self._calculated = False
         self.df = None
 
+    def size_for_team(self) -> None:
+        """Sizes the capacity for the persons in the team and every day of the
+        time period, so persons added to the team since are calculated too."""
+        person_list = self.team.person_list
+        self.person_index = {person.name: i for i, person in enumerate(person_list)}
+        self.skills = np.array(
+            [[getattr(person, SKILL_ATTRIBUTES[epic_type]) for epic_type in EpicType] for person in person_list],
+            dtype=bool).reshape(len(person_list), len(EpicType))
+        self.stored_days = np.arange(len(self.calendar_days))
+        self.days = self.calendar_days
+        self.daily_column_headings = self.calendar_column_headings
+        self.day_index = self.calendar_day_index
+        self.daily_capacity = np.zeros((len(person_list), len(self.calendar_days)))
+        self.availability = np.zeros((len(person_list), len(self.calendar_days)), dtype=bool)
+        self.capacity_tensor = np.zeros((len(self.calendar_days), len(person_list), len(EpicType)))
+        self.daily_totals = np.zeros(len(self.calendar_days))
+        self.person_totals = np.zeros(len(person_list))
+        self.team_total = 0.0
+
+    def __getstate__(self) -> dict:
+        """Returns the state to pickle, such as for worker processes, leaving out
+        the holiday schedule, instrumentation and cache, which may not be
+        picklable, and the views that are rebuilt on first use."""
+        state = self.__dict__.copy()
+        state.update({
+            '_holiday_schedule': None,
+            'instrumentation': NULL_INSTRUMENTATION,
+            'cache': None,
+            'df': None,
+            '_detailed_capacity_data': None,
+            '_daily_capacity_by_day': None,
+            '_capacity_index': None,
+            '_out_of_office_days': {},
+        })
+        return state
+
     def is_person_unavailable(self,person):
         """Returns true if the person is unavailable for the time period."""
         if person.start_date > self.end_date:
@@ -50,41 +125,27 @@ class TeamCapacity():
             return True
         return False
 
-    def populate_leading_static_columns_for_person(self,person:Person):
-        """Populates the leading static columns for a person."""
-        self.data['Team'].append(self.team.name)
-        self.data['Person'].append(person.name)
-        self.data['Location'].append(person.location)
-        self.data['Start Date'].append(person.start_date.isoformat())
-        self.data['End Date'].append(person.end_date.isoformat())
-        self.data['Front End'].append('T' if person.front_end else 'F')
-        self.data['Back End'].append('T' if person.back_end else 'F')
-        self.data['QE'].append('T' if person.qe else 'F')
-        self.data['DevOps'].append('T' if person.devops else 'F')
-        self.data['Documentation'].append('T' if person.documentation else 'F')
-        self.data['Reserve Capacity'].append(person.reserve_capacity)
-
-    def populate_daily_columns_with_zeros_for_person(self,person):
+    def leading_static_columns_for_person(self,person:Person) -> dict:
+        """Returns the leading static columns for a person."""
+        return {
+            'Team': self.team.name,
+            'Person': person.name,
+            'Location': person.location,
+            'Start Date': person.start_date.isoformat(),
+            'End Date': person.end_date.isoformat(),
+            'Front End': 'T' if person.front_end else 'F',
+            'Back End': 'T' if person.back_end else 'F',
+            'QE': 'T' if person.qe else 'F',
+            'DevOps': 'T' if person.devops else 'F',
+            'Documentation': 'T' if person.documentation else 'F',
+            'Reserve Capacity': person.reserve_capacity,
+        }
+
+    def populate_daily_columns_with_zeros_for_person(self,person_index,person):
         """Populates the daily columns with zeros for a person."""
-        for daily_column in self.daily_column_headings:
-            self.data[daily_column].append(0)
-            self.populate_detailed_capacity(daily_column,person,0)
-        self.data['Total'].append(0)
-
-    def populate_detailed_capacity(self,for_day,person,capacity_for_person_for_this_day):
-        """Populates the detailed capacity for a person for a given day."""
-        detailed_capacity_data_for_day = self.detailed_capacity_data.setdefault(for_day, {})
-        detailed_capacity_data_for_day_for_person = detailed_capacity_data_for_day.setdefault(person.name, {}) 
-        detailed_capacity_data_for_day_for_person[EpicType.FRONTEND.name] = [
-            capacity_for_person_for_this_day if person.front_end else 0]
-        detailed_capacity_data_for_day_for_person[EpicType.BACKEND.name] = [
-            capacity_for_person_for_this_day if person.back_end else 0]
-        detailed_capacity_data_for_day_for_person[EpicType.QE.name] = [
-            capacity_for_person_for_this_day if person.qe else 0]
-        detailed_capacity_data_for_day_for_person[EpicType.DEVOPS.name] = [
-            capacity_for_person_for_this_day if person.devops else 0]
-        detailed_capacity_data_for_day_for_person[EpicType.DOCUMENTATION.name] = [
-            capacity_for_person_for_this_day if person.documentation else 0]
+        # pylint: disable=unused-argument
+        self.daily_capacity[person_index] = 0
+        self.availability[person_index] = False
 
     def its_the_weekend(self,dayofweek):
         """Returns true if the given day of the week is a weekend."""
@@ -94,51 +155,395 @@ class TeamCapacity():
         """Returns true if the given date is a holiday."""
         return self.holiday_schedule.falls_on_holiday(some_date,location)
 
-    def populate_daily_columns_for_person(self,person):
+    def weekend_mask(self) -> np.ndarray:
+        """Returns a mask of the days in the time period that fall on a weekend."""
+        if self._weekend_mask is None:
+            self._weekend_mask = np.asarray(self.its_the_weekend(self.date_range.dayofweek))
+        return self._weekend_mask
+
+    def holiday_mask(self, location, day_slice=slice(None)) -> np.ndarray:
+        """Returns a mask of the days in the time period that are holidays for the location."""
+        mask = self._holiday_masks.get(location)
+        if mask is None:
+            mask = self.look_up_holidays(location, slice(0, len(self.calendar_days)))
+            self._holiday_masks[location] = mask
+        return mask[day_slice]
+
+    def look_up_holidays(self, location, calendar_slice: slice) -> np.ndarray:
+        """Looks up which days of the calendar slice are holidays for the location.
+
+        Unless the holiday schedule looks up date ranges in bulk, only the days
+        that are not weekends are looked up, a day at a time, as weekends have no
+        capacity regardless. Each call to the holiday schedule is counted as a
+        holiday lookup."""
+        days = self.calendar_days[calendar_slice]
+        if self.holiday_schedule.bulk_lookups:
+            if len(days) == 0:
+                return np.zeros(0, dtype=bool)
+            holidays = self.holiday_schedule.holidays_between(location,days[0].astype(date),days[-1].astype(date))
+            self.instrumentation.count('holiday_lookups')
+            return np.isin(days, np.array(sorted(holidays), dtype='datetime64[D]'))
+        mask = np.zeros(len(days), dtype=bool)
+        weekdays = np.flatnonzero(~self.weekend_mask()[calendar_slice]).tolist()
+        for day_index in weekdays:
+            mask[day_index] = self.its_a_holiday(days[day_index].astype(date),location)
+        self.instrumentation.count('holiday_lookups', len(weekdays))
+        return mask
+
+    def out_of_office_days(self, person) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the sorted out of office dates of a person, and the starts and
+        ends of their out of office ranges, as arrays of days.
+
+        The arrays are kept until the person is replaced, so recalculating a few
+        days does not convert every person's out of office dates again."""
+        cached = self._out_of_office_days.get(person.name)
+        if cached is not None and cached[0] is person:
+            return cached[1]
+        range_starts, range_ends = (
+            np.array(dates, dtype='datetime64[D]') for dates in zip(*person.out_of_office_ranges)
+        ) if person.out_of_office_ranges else (np.array([], dtype='datetime64[D]'),) * 2
+        out_of_office_days = (np.array(sorted(person.out_of_office_dates), dtype='datetime64[D]'), range_starts, range_ends)
+        self._out_of_office_days[person.name] = (person, out_of_office_days)
+        return out_of_office_days
+
+    def not_available_mask(self, person, day_slice=slice(None)) -> np.ndarray:
+        """Returns a mask of the days in the time period the person is not active or out of office."""
+        days = self.calendar_days[day_slice]
+        not_active = (days < np.datetime64(person.start_date)) | (days > np.datetime64(person.end_date))
+        out_of_office_dates, range_starts, range_ends = self.out_of_office_days(person)
+        out_of_office = np.zeros(len(days), dtype=bool)
+        if len(days) > 0:
+            # The days are consecutive, so only the dates between the first and last are looked at.
+            first = np.searchsorted(out_of_office_dates, days[0], side='left')
+            last = np.searchsorted(out_of_office_dates, days[-1], side='right')
+            out_of_office[(out_of_office_dates[first:last] - days[0]).astype(np.int64)] = True
+        if len(range_starts) > 0:
+            range_index = np.searchsorted(range_starts, days, side='right') - 1
+            out_of_office |= (range_index >= 0) & (days <= range_ends[np.maximum(range_index, 0)])
+        return not_active | out_of_office
+
+    def availability_for_person(self, person, day_slice=slice(None)) -> np.ndarray:
+        """Returns a mask of the days in the time period the person is available."""
+        if self.is_person_unavailable(person):
+            return np.zeros(len(self.calendar_days[day_slice]), dtype=bool)
+        return ~(self.not_available_mask(person, day_slice) |
+                 self.weekend_mask()[day_slice] |
+                 self.holiday_mask(person.location, day_slice))
+
+    def capacity_for_availability(self, person, available) -> np.ndarray:
+        """Returns the capacity of a person for the days they are available."""
+        capacity_for_person_for_a_day = (1.0-person.reserve_capacity) * 1.0
+        return np.where(available, capacity_for_person_for_a_day, 0.0)
+
+    def daily_capacity_for_person(self, person, day_slice=slice(None)) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the capacity and the availability of a person for the days in the time period."""
+        available = self.availability_for_person(person, day_slice)
+        return self.capacity_for_availability(person, available), available
+
+    def populate_daily_columns_for_person(self,person_index,person):
         """Populates the daily columns for a person."""
-        total = 0
-        for dt in self.date_range:
-            daily_column = dt.strftime('%Y-%m-%d')
-            if (person.is_not_available(dt.date()) or
-                 self.its_the_weekend(dt.dayofweek) or
-                 self.its_a_holiday(dt.date(),person.location)):
-                self.data[daily_column].append(0)
-                self.populate_detailed_capacity(daily_column,person,0)
-            else:
-                capacity_for_person_for_this_day = (1.0-person.reserve_capacity) * 1.0
-                self.data[daily_column].append(capacity_for_person_for_this_day)
-                self.populate_detailed_capacity(daily_column,person,capacity_for_person_for_this_day)
-                total += capacity_for_person_for_this_day 
-        self.data['Total'].append(total)
-
-    def populate_total_row(self):
-        """Populates the total row."""
-        for leading_static_column in self.leading_static_column_headings:
-            if leading_static_column == 'Team':
-                self.data[leading_static_column].append(self.team.name)
-            elif leading_static_column == 'Person':
-                self.data[leading_static_column].append('Total')
-            else:
-                self.data[leading_static_column].append('-')
-        for dt in self.date_range:
-            daily_column = dt.strftime('%Y-%m-%d')
-            daily_total = sum(self.data[daily_column])
-            self.data[daily_column].append(daily_total)
-            self.total_capacity_data[daily_column] = [daily_total] 
-        team_total = sum(self.data['Total'])
-        self.data['Total'].append(team_total)
+        self.daily_capacity[person_index], self.availability[person_index] = self.daily_capacity_for_person(person)
+
+    def calculate_totals(self):
+        """Calculates the total capacity for each day, each person and the team.
+
+        The totals are summed a person or a day at a time, in order, so they are
+        identical to the totals of a sheet built a cell at a time."""
+        person_count, day_count = self.daily_capacity.shape
+        if person_count > 0:
+            self.daily_totals = np.add.accumulate(self.daily_capacity, axis=0)[-1]
+        else:
+            self.daily_totals = np.zeros(day_count)
+        if day_count > 0:
+            self.person_totals = np.add.accumulate(self.daily_capacity, axis=1)[:, -1]
+        else:
+            self.person_totals = np.zeros(person_count)
+        self.person_totals[~self.availability.any(axis=1)] = 0
+        self.team_total = float(np.add.accumulate(self.person_totals)[-1]) if len(self.person_totals) > 0 else 0.0
+        self.total_capacity_data = dict(zip(self.daily_column_headings, self.total_capacity_by_day()))
+        if len(self.stored_days) < len(self.calendar_days):
+            stored_total_capacity_data = self.total_capacity_data
+            self.total_capacity_data = {
+                day: stored_total_capacity_data.get(day) or [0] for day in self.calendar_column_headings}
+
+    def total_capacity_by_day(self, day_slice=slice(None)) -> list[list[float]]:
+        """Returns the total capacity for each day as a single item list, holding an
+        integer zero for a day on which nobody is available."""
+        return [
+            [total] if available else [0]
+            for total, available in zip(
+                self.daily_totals[day_slice].tolist(), self.availability[:, day_slice].any(axis=0).tolist())
+        ]
+
+    def cache_fingerprint(self) -> str:
+        """Returns the fingerprint of the persons, time period and holidays the
+        capacity is calculated from."""
+        holiday_masks = {
+            person.location: self.holiday_mask(person.location)
+            for person in self.team.person_list if not self.is_person_unavailable(person)
+        }
+        return self.cache.fingerprint(self.team.person_list, self.calendar_days, holiday_masks)
+
+    def load_from_cache(self, fingerprint: str) -> bool:
+        """Loads the daily capacity from the cache, returning false if it is not cached."""
+        arrays = self.cache.load(fingerprint, self.daily_capacity.shape)
+        if arrays is None:
+            return False
+        self.daily_capacity = np.asarray(arrays['daily_capacity'])
+        self.availability = np.asarray(arrays['availability'])
+        return True
+
+    def set_stored_days(self, day_indexes: np.ndarray) -> None:
+        """Sets the days of the time period that capacity is stored for."""
+        self.stored_days = day_indexes
+        self.days = self.calendar_days[day_indexes]
+        self.daily_column_headings = [self.calendar_column_headings[i] for i in day_indexes.tolist()]
+        self.day_index = {day: i for i, day in enumerate(self.daily_column_headings)}
+
+    def store_available_days(self) -> None:
+        """Drops the capacity of the days on which nobody is available."""
+        day_indexes = np.flatnonzero(self.availability.any(axis=0))
+        self.daily_capacity = self.daily_capacity[:, day_indexes]
+        self.availability = self.availability[:, day_indexes]
+        self.capacity_tensor = self.capacity_tensor[day_indexes]
+        self.daily_totals = self.daily_totals[day_indexes]
+        self.set_stored_days(self.stored_days[day_indexes])
 
     def calculate(self):
-        """Calculates the capacity for the team."""
-        for person in self.team.person_list:
-            self.populate_leading_static_columns_for_person(person)
-            if self.is_person_unavailable(person):
-                self.populate_daily_columns_with_zeros_for_person(person)
-            else:
-                self.populate_daily_columns_for_person(person)
-        self.populate_total_row()
-        self.df = pd.DataFrame(self.data)
+        """Calculates the capacity for the team.
+
+        With a cache, the daily capacity is loaded from the cache when the
+        persons, time period and holidays are unchanged since it was stored."""
+        instrumentation = self.instrumentation
+        with instrumentation.phase('calculate'):
+            self.size_for_team()
+            fingerprint = None
+            cached = False
+            if self.cache is not None:
+                with instrumentation.phase('calculate.cache'):
+                    fingerprint = self.cache_fingerprint()
+                    cached = self.load_from_cache(fingerprint)
+                instrumentation.count('cache_hits' if cached else 'cache_misses')
+            if not cached:
+                with instrumentation.phase('calculate.persons'):
+                    for person_index, person in enumerate(self.team.person_list):
+                        if self.is_person_unavailable(person):
+                            self.populate_daily_columns_with_zeros_for_person(person_index,person)
+                        else:
+                            self.populate_daily_columns_for_person(person_index,person)
+                            instrumentation.count('person_days_evaluated', len(self.calendar_days))
+                if fingerprint is not None:
+                    self.cache.store(fingerprint, {'daily_capacity': self.daily_capacity, 'availability': self.availability})
+            if self.sparse:
+                self.store_available_days()
+            with instrumentation.phase('calculate.totals'):
+                self.calculate_totals()
+            with instrumentation.phase('calculate.tensor'):
+                self.capacity_tensor = self.daily_capacity.T[:, :, np.newaxis] * self.skills[np.newaxis, :, :]
+                instrumentation.count('capacity_entries', self.daily_capacity.size)
+            self._detailed_capacity_data = None
+            self._daily_capacity_by_day = None
+            self._capacity_index = None
+            self._calculated = True
+            self.df = None
+        instrumentation.emit('calculate')
+
+    def update_person(self, person: Person) -> None:
+        """Replaces the person with the same name and recalculates only their capacity.
+
+        Only the person's total, the daily totals and the team total are summed
+        again, rather than every total of the team."""
+        if not self._calculated:
+            raise ValueError('Capacity has not been calculated')
+        person_index = self.person_index.get(person.name)
+        if person_index is None:
+            raise ValueError(f'Unknown person {person.name}')
+        self.team.person_list[person_index] = person
+        self.skills[person_index] = [getattr(person, SKILL_ATTRIBUTES[epic_type]) for epic_type in EpicType]
+        capacity, available = self.daily_capacity_for_person(person)
+        self.update_calendar_days([person_index], slice(0, len(self.calendar_days)), capacity[np.newaxis], available[np.newaxis])
+
+    def recalculate_days(self, start_date: date, end_date: date) -> None:
+        """Recalculates the capacity of every person from start_date to end_date inclusive.
+
+        Holidays are looked up again for those days, so a CachingHolidaySchedule
+        should be cleared first if the holiday calendar itself has changed."""
+        if not self._calculated:
+            raise ValueError('Capacity has not been calculated')
+        if start_date > end_date or end_date < self.start_date or start_date > self.end_date:
+            raise ValueError('Invalid date range')
+        start_date, end_date = max(start_date, self.start_date), min(end_date, self.end_date)
+        day_slice = slice(self.calendar_day_index[start_date.isoformat()], self.calendar_day_index[end_date.isoformat()] + 1)
+        for location, mask in self._holiday_masks.items():
+            mask[day_slice] = self.look_up_holidays(location, day_slice)
+        person_count = len(self.team.person_list)
+        capacity = np.zeros((person_count, day_slice.stop - day_slice.start))
+        available = np.zeros((person_count, day_slice.stop - day_slice.start), dtype=bool)
+        for person_index, person in enumerate(self.team.person_list):
+            capacity[person_index], available[person_index] = self.daily_capacity_for_person(person, day_slice)
+        self.update_calendar_days(list(range(person_count)), day_slice, capacity, available)
+
+    def update_calendar_days(self, person_indexes: list[int], calendar_slice: slice, capacity: np.ndarray, available: np.ndarray) -> None:
+        """Replaces the capacity of the given persons for the given days of the time
+        period. If someone is now available on a day that is not stored, the
+        capacity is calculated again, and if nobody is now available on a day
+        that is stored, the day is dropped."""
+        first_day, last_day = np.searchsorted(self.stored_days, [calendar_slice.start, calendar_slice.stop]).tolist()
+        stored_days = self.stored_days[first_day:last_day] - calendar_slice.start
+        if self.sparse and np.delete(available, stored_days, axis=1).any():
+            self.calculate()
+            return
+        self.update_daily_capacity(person_indexes, slice(first_day, last_day), capacity[:, stored_days], available[:, stored_days])
+        if self.sparse and not self.availability[:, first_day:last_day].any(axis=0).all():
+            self.store_available_days()
+
+    def update_daily_capacity(self, person_indexes: list[int], day_slice: slice, capacity: np.ndarray, available: np.ndarray) -> None:
+        """Replaces the capacity of the given persons for the given days and sums
+        the totals of those persons and days again.
+
+        The totals are summed in the same order as calculate_totals, so they are
+        identical to the totals of the capacity calculated afresh."""
+        self.daily_capacity[person_indexes, day_slice] = capacity
+        self.availability[person_indexes, day_slice] = available
+        self.capacity_tensor[day_slice, person_indexes] = capacity.T[:, :, np.newaxis] * self.skills[person_indexes][np.newaxis]
+        if len(self.team.person_list) > 0:
+            self.daily_totals[day_slice] = np.add.accumulate(self.daily_capacity[:, day_slice], axis=0)[-1]
+            if len(self.days) > 0:
+                self.person_totals[person_indexes] = np.add.accumulate(self.daily_capacity[person_indexes], axis=1)[:, -1]
+        self.person_totals[~self.availability.any(axis=1)] = 0
+        self.team_total = float(np.add.accumulate(self.person_totals)[-1]) if len(self.person_totals) > 0 else 0.0
+        self.total_capacity_data.update(zip(self.daily_column_headings[day_slice], self.total_capacity_by_day(day_slice)))
+        self._detailed_capacity_data = None
+        self._daily_capacity_by_day = None
+        self._capacity_index = None
+        self.df = None
+
+    def calendar_daily_capacity(self) -> np.ndarray:
+        """Returns the capacity as a persons x days array with every day of the
+        time period, including those that are not stored."""
+        if len(self.stored_days) == len(self.calendar_days):
+            return self.daily_capacity
+        daily_capacity = np.zeros((len(self.team.person_list), len(self.calendar_days)))
+        daily_capacity[:, self.stored_days] = self.daily_capacity
+        return daily_capacity
+
+    def get_capacity_tensor(self) -> np.ndarray:
+        """Returns the capacity as a days x persons x epic types array.
+
+        The axes are indexed by day_index, person_index and epic_type_index
+        respectively. A person only has capacity for the epic types that
+        match their skills."""
+        return self.capacity_tensor
+
+    def get_daily_capacity_by_day(self) -> list[list[float]]:
+        """Returns the capacity as a list holding the capacity per person for each day.
+
+        The lists are built once and shared with every caller, so they must
+        not be modified."""
+        if self._daily_capacity_by_day is None:
+            self._daily_capacity_by_day = self.daily_capacity.T.tolist()
+        return self._daily_capacity_by_day
+
+    @property
+    def holiday_schedule(self) -> CachingHolidaySchedule | None:
+        """Returns the holiday schedule, which remembers the holidays looked up."""
+        return self._holiday_schedule
+
+    @holiday_schedule.setter
+    def holiday_schedule(self, holiday_schedule: HolidaySchedulePort | None) -> None:
+        if holiday_schedule is not None and not isinstance(holiday_schedule, CachingHolidaySchedule):
+            holiday_schedule = CachingHolidaySchedule(holiday_schedule)
+        self._holiday_schedule = holiday_schedule
+
+    @property
+    def detailed_capacity_data(self) -> dict[str, dict[str, dict[str, list[float]]]]:
+        """Returns the capacity as nested day -> person -> epic type -> [capacity] dicts.
+
+        The view is built from the capacity tensor on first access and is
+        retained for code that still expects the dict layout."""
+        if not self._calculated:
+            return {}
+        if self._detailed_capacity_data is None:
+            self._detailed_capacity_data = self.build_detailed_capacity_data()
+        return self._detailed_capacity_data
+
+    @property
+    def capacity_index(self) -> CapacityIndex:
+        """Returns the index used to answer capacity queries.
+
+        The index is built on first access and rebuilt after the capacity changes."""
+        if self._capacity_index is None:
+            self._capacity_index = CapacityIndex(
+                self.days, self.team.person_list, self.skills, self.daily_capacity, self.epic_type_index,
+                self.calendar_days)
+        return self._capacity_index
+
+    def query_capacity(self, queries: Iterable[CapacityQuery]) -> list[float]:
+        """Returns the total capacity for each query, in the order given.
+
+        Raises:
+            ValueError: If a query names an unknown person, epic type or location.
+        """
+        if not self._calculated:
+            raise ValueError('Capacity has not been calculated')
+        return self.capacity_index.totals(queries).tolist()
+
+    def build_detailed_capacity_data(self) -> dict[str, dict[str, dict[str, list[float]]]]:
+        """Builds the nested dict view of the capacity tensor."""
+        epic_type_names = list(self.epic_type_index)
+        person_names = [person.name for person in self.team.person_list]
+        detailed_capacity_data = {}
+        if not person_names:
+            return detailed_capacity_data
+        for day, capacity_for_day in zip(self.daily_column_headings, self.capacity_tensor.tolist()):
+            detailed_capacity_data_for_day = detailed_capacity_data.setdefault(day, {})
+            for person_name, capacity_for_person in zip(person_names, capacity_for_day):
+                detailed_capacity_data_for_day[person_name] = {
+                    epic_type_name: [capacity]
+                    for epic_type_name, capacity in zip(epic_type_names, capacity_for_person)
+                }
+        return detailed_capacity_data
 
     def get_df(self) -> pd.DataFrame:
-        """Returns the capacity data as a pandas dataframe."""
+        """Returns the capacity data as a pandas dataframe.
+
+        The dataframe is built on first use and cached until the capacity changes."""
+        if self.df is None and self._calculated:
+            self.df = self.build_df()
         return self.df
+
+    def build_df(self) -> pd.DataFrame:
+        """Builds the capacity sheet as a dataframe with a row per person and a total row.
+
+        Columns with few distinct values, such as the skill flags, are
+        categorical. A day on which nobody is available, like the total of a
+        person who is never available, holds integer zeros."""
+        person_list = self.team.person_list
+        columns = {
+            'Team': pd.Categorical([self.team.name] * (len(person_list) + 1)),
+            'Person': [person.name for person in person_list] + ['Total'],
+            'Location': pd.Categorical([person.location for person in person_list] + ['-']),
+            'Start Date': [person.start_date.isoformat() for person in person_list] + ['-'],
+            'End Date': [person.end_date.isoformat() for person in person_list] + ['-'],
+        }
+        for heading, epic_type in SKILL_COLUMNS.items():
+            flags = np.where(self.skills[:, self.epic_type_index[epic_type.name]], 'T', 'F').tolist()
+            columns[heading] = pd.Categorical(flags + ['-'], categories=['F', 'T', '-'])
+        columns['Reserve Capacity'] = np.array(
+            [person.reserve_capacity for person in person_list] + ['-'], dtype=object)
+        capacity = np.empty((len(person_list) + 1, len(self.days)))
+        capacity[:-1] = self.daily_capacity
+        capacity[-1] = self.daily_totals
+        someone_available = self.availability.any(axis=0)
+        no_capacity = np.zeros(len(person_list) + 1, dtype=np.int64)
+        daily_columns = dict.fromkeys(self.calendar_column_headings, no_capacity)
+        for day, daily_column in enumerate(self.daily_column_headings):
+            if someone_available[day]:
+                daily_columns[daily_column] = capacity[:, day]
+        columns.update(daily_columns)
+        if self.availability.any():
+            columns['Total'] = np.append(self.person_totals, self.team_total)
+        else:
+            columns['Total'] = no_capacity
+        df = pd.DataFrame(columns)
+        return df[self.leading_static_column_headings + self.calendar_column_headings + self.trailing_static_column_headings]
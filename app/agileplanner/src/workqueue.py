@@ -0,0 +1,61 @@
+"""Functions for ordering epics by priority and dependency."""
+import heapq
+from collections.abc import Iterable
+from .epic import Epic
+
+
+def order_epics(epics: Iterable[Epic], ignore_unknown_dependencies: bool = False) -> list[Epic]:
+    """
+    Orders epics so that every epic comes after the epics it depends on and,
+    among the epics whose dependencies are satisfied, those with the lowest
+    priority value come first. Epics with the same priority keep their order.
+
+    Args:
+        epics (Iterable[Epic]): The epics to order.
+        ignore_unknown_dependencies (bool): Whether to order an epic that depends
+            on an epic that is not being ordered, such as one cut from scope, as
+            if it did not depend on it, rather than raising a ValueError.
+
+    Returns:
+        list[Epic]: The epics in the order they should be scheduled.
+
+    Raises:
+        ValueError: If an epic depends on an epic that is not being ordered or
+            whose key is duplicated, or the dependencies form a cycle.
+    """
+    epic_list = list(epics)
+    position_by_key: dict[str, int] = {}
+    duplicate_keys: set[str] = set()
+    for position, epic in enumerate(epic_list):
+        if epic.key in position_by_key:
+            duplicate_keys.add(epic.key)
+        position_by_key[epic.key] = position
+
+    dependency_count = [0] * len(epic_list)
+    dependents: list[list[int]] = [[] for _ in epic_list]
+    for position, epic in enumerate(epic_list):
+        for key in set(epic.depends_on):
+            if key not in position_by_key:
+                if ignore_unknown_dependencies:
+                    continue
+                raise ValueError(f'Epic {epic.key} depends on unknown epic {key}')
+            if key in duplicate_keys:
+                raise ValueError(f'Epic {epic.key} depends on duplicate epic {key}')
+            dependency_count[position] += 1
+            dependents[position_by_key[key]].append(position)
+
+    ready = [(epic.priority, position) for position, epic in enumerate(epic_list) if dependency_count[position] == 0]
+    heapq.heapify(ready)
+    ordered_epics: list[Epic] = []
+    while ready:
+        _, position = heapq.heappop(ready)
+        ordered_epics.append(epic_list[position])
+        for dependent in dependents[position]:
+            dependency_count[dependent] -= 1
+            if dependency_count[dependent] == 0:
+                heapq.heappush(ready, (epic_list[dependent].priority, dependent))
+
+    if len(ordered_epics) < len(epic_list):
+        keys = sorted(epic.key for position, epic in enumerate(epic_list) if dependency_count[position] > 0)
+        raise ValueError(f'Epics with circular dependencies: {", ".join(keys)}')
+    return ordered_epics
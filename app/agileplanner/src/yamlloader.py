@@ -0,0 +1,83 @@
+"""Functions for loading YAML quickly and caching the models parsed from YAML files."""
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, TypeVar
+import yaml
+
+# The libyaml based loader is much faster but is only available when PyYAML
+# was built against libyaml.
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Bump whenever the cached models change shape so that stale entries are ignored.
+CACHE_VERSION = 3
+
+T = TypeVar('T')
+
+def load_yaml(stream: Any) -> Any:
+    """Loads YAML from a string, bytes or file using the fastest safe loader available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+def _cache_file_for(file_path: str, cache_dir: str) -> str:
+    """Returns the cache file used for the given YAML file."""
+    key = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + '.pickle')
+
+def _read_cache_entry(cache_file: str) -> dict[str, Any] | None:
+    """Returns the cache entry in the given file, or None if there is no usable entry."""
+    try:
+        with open(cache_file, 'rb') as file:
+            entry = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != CACHE_VERSION:
+        return None
+    return entry
+
+def _write_cache_entry(cache_file: str, entry: dict[str, Any]) -> None:
+    """Writes the cache entry so that readers never see a partially written file."""
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    file_descriptor, temporary_file = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+    with os.fdopen(file_descriptor, 'wb') as file:
+        pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_file, cache_file)
+
+def load_cached(file_path: str, cache_dir: str, parse: Callable[[bytes], T]) -> T:
+    """
+    Returns the models parsed from a YAML file, reusing the models cached on disk
+    when the file has not changed.
+
+    The cache is keyed by the path of the file. An entry is used as is when the
+    modification time and size of the file are unchanged, and otherwise only
+    if the SHA-256 hash of the content still matches. Entries are pickled, so
+    the cache directory must only be writable by trusted users.
+
+    Args:
+        file_path (str): The YAML file to load.
+        cache_dir (str): The directory holding the cache entries.
+        parse (Callable[[bytes], T]): Parses the content of the file into models.
+
+    Returns:
+        T: The models parsed from the file.
+    """
+    cache_file = _cache_file_for(file_path, cache_dir)
+    entry = _read_cache_entry(cache_file)
+    stat = os.stat(file_path)
+    if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return entry['models']
+    with open(file_path, 'rb') as file:
+        content = file.read()
+    content_hash = hashlib.sha256(content).hexdigest()
+    if entry is not None and entry['content_hash'] == content_hash:
+        models = entry['models']
+    else:
+        models = parse(content)
+    _write_cache_entry(cache_file, {
+        'version': CACHE_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'content_hash': content_hash,
+        'models': models,
+    })
+    return models
@@ -0,0 +1,49 @@
+"""Unit tests for the benchmarks"""
+import os
+import tempfile
+import unittest
+from ..benchmarks.generators import generate_features, generate_team, generate_time_period
+from ..benchmarks.suite import BenchmarkResult, find_regressions, load_baseline, run_benchmarks, save_baseline
+from ..src.epic import EpicType
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests for the benchmark generators and suite"""
+
+    def test_generate_team(self):
+        """Tests teams are generated to size, with at least one skill each, and repeatably."""
+        time_period = generate_time_period(30)
+        team = generate_team('Team1', 20, time_period, skill_mix={EpicType.QE: 0.0}, out_of_office_density=0.5, seed=1)
+        self.assertEqual(len(team.person_list), 20)
+        for person in team.person_list:
+            self.assertTrue(person.front_end or person.back_end or person.qe or person.devops or person.documentation)
+            self.assertTrue(all(time_period.start_date <= d <= time_period.end_date for d in person.out_of_office_dates))
+        self.assertEqual(team.person_list, generate_team(
+            'Team1', 20, time_period, skill_mix={EpicType.QE: 0.0}, out_of_office_density=0.5, seed=1).person_list)
+
+    def test_generate_features(self):
+        """Tests backlogs are generated to size with only the epic types in the mix."""
+        features = generate_features(12, epics_per_feature=5, skill_mix={EpicType.QE: 1, EpicType.DEVOPS: 1})
+        self.assertEqual(len(features.feature_list), 3)
+        self.assertEqual(len(features.get_epics()), 12)
+        self.assertEqual({epic.epic_type for epic in features.iter_epics()}, {EpicType.QE, EpicType.DEVOPS})
+
+    def test_run_benchmarks_and_compare_to_baseline(self):
+        """Tests the benchmarks run and regressions against a saved baseline are found."""
+        results = run_benchmarks(persons=3, days=10, epics=5, repeats=1)
+        self.assertEqual([result.name for result in results], ['calculate', 'build_schedule', 'capacity_csv'])
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'baseline.json')
+            save_baseline(results, file_path, {'persons': 3})
+            self.assertEqual(load_baseline(file_path), ({'persons': 3}, results))
+        baseline = [BenchmarkResult('calculate', 1.0, 1000), BenchmarkResult('build_schedule', 1.0, 1000)]
+        self.assertEqual(find_regressions([
+            BenchmarkResult('calculate', 1.1, 1300),
+            BenchmarkResult('build_schedule', 1.5, 900),
+            BenchmarkResult('capacity_csv', 9.0, 9000),
+        ], baseline), [
+            'calculate peaked at 1300 bytes against 1000 bytes',
+            'build_schedule took 1.5000s against 1.0000s',
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
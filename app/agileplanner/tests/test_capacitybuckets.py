@@ -0,0 +1,88 @@
+"""Unit tests for capacitybuckets.py"""
+import unittest
+from datetime import date
+from ..src.capacitybuckets import CapacityBuckets, Granularity, schedule_at_granularity
+from ..src.cumulativescheduler import CumulativeTeamScheduler
+from ..src.epic import Epic, EpicType
+from ..src.holiday import HolidaySchedulePort
+from ..src.scheduler import EpicScheduleStatus, TeamScheduler
+from ..src.team import Team
+from ..src.teamcapacity import TeamCapacity
+from ..src.timeperiod import TimePeriod
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+class TestCapacityBuckets(unittest.TestCase):
+    """Test CapacityBuckets class"""
+
+    def setUp(self):
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: False
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,4),
+            end_date=date(2023,10,22)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        self.team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        self.team1_capacity.calculate()
+        self.epics = [
+            Epic('EPIC-1', 2, EpicType.FRONTEND),
+            Epic('EPIC-2', 4, EpicType.FRONTEND),
+            Epic('EPIC-3', 20, EpicType.FRONTEND),
+        ]
+
+    def test_buckets(self):
+        """Tests capacity is summed into working days, weeks and sprints"""
+        working_days = CapacityBuckets(self.team1_capacity, Granularity.WORKING_DAY)
+        self.assertEqual(len(working_days.daily_column_headings), 13)
+        self.assertEqual(working_days.daily_column_headings[3], '2023-10-09')
+        weeks = CapacityBuckets(self.team1_capacity, Granularity.WEEK)
+        self.assertEqual(weeks.daily_column_headings, ['2023-10-04', '2023-10-09', '2023-10-16'])
+        self.assertEqual(weeks.daily_capacity.tolist(), [[3.0, 5.0, 5.0]])
+        sprints = CapacityBuckets(self.team1_capacity, Granularity.SPRINT, sprint_days=10)
+        self.assertEqual(sprints.daily_column_headings, ['2023-10-04', '2023-10-14'])
+        self.assertEqual(sprints.daily_capacity.tolist(), [[8.0, 5.0]])
+        self.assertEqual(sprints.days_in_bucket(1).tolist(), list(range(10, 19)))
+        self.assertRaises(ValueError, CapacityBuckets, self.team1_capacity, Granularity.SPRINT, 0)
+
+    def test_schedule_weeks(self):
+        """Tests schedulers schedule a week at a time given weeks"""
+        weeks = CapacityBuckets(self.team1_capacity, Granularity.WEEK)
+        for team_scheduler in [TeamScheduler(weeks, self.epics), CumulativeTeamScheduler(weeks, self.epics)]:
+            schedule_results = team_scheduler.build_schedule()
+            self.assertEqual(
+                [(result.start_date, result.end_date) for result in schedule_results[:2]],
+                [('2023-10-04', '2023-10-04'), ('2023-10-04', '2023-10-09')])
+            self.assertEqual(schedule_results[2].epic_schedule_status, EpicScheduleStatus.NO_CAPACITY_TO_COMPLETE)
+            self.assertEqual(schedule_results[2].start_date, '2023-10-09')
+
+    def test_refined_schedule(self):
+        """Tests refining a schedule by week gives the days epics start and end on"""
+        daily_schedule_results = TeamScheduler(self.team1_capacity, self.epics).build_schedule()
+        for granularity in Granularity:
+            schedule_results = schedule_at_granularity(self.team1_capacity, self.epics, granularity)
+            self.assertEqual(schedule_results, daily_schedule_results)
+        schedule_results = schedule_at_granularity(self.team1_capacity, self.epics, Granularity.WEEK, refine=False)
+        self.assertEqual(schedule_results[1].end_date, '2023-10-09')
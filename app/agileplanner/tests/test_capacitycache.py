@@ -0,0 +1,113 @@
+"""Unit tests for capacitycache.py"""
+import os
+import tempfile
+import unittest
+from datetime import date
+from ..src.capacitycache import CapacityCache
+from ..src.holiday import HolidaySchedulePort
+from ..src.instrumentation import Instrumentation
+from ..src.team import Team
+from ..src.teamcapacity import TeamCapacity
+from ..src.timeperiod import TimePeriod
+
+TEAM_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: False
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.25
+    location: US
+    out_of_office_dates:
+    - '2023-12-27'
+  - name: Bobby BackendDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: False
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: UK
+    out_of_office_dates: []
+"""
+
+class ChristmasHolidaySchedule(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing with a holiday on Christmas day."""
+    def __init__(self, locations: tuple[str, ...] = ('US', 'UK')) -> None:
+        self.locations = locations
+
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return location in self.locations and some_date.month == 12 and some_date.day == 25
+
+class TestCapacityCache(unittest.TestCase):
+    """Tests for caching calculated capacity on disk"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.time_period = TimePeriod('test_period', date(2023,12,18), date(2023,12,31))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def calculate(self, team: Team, holiday_schedule: HolidaySchedulePort = None, max_bytes: int = 1024 * 1024):
+        """Calculates the capacity with the cache, returning it and the counters recorded."""
+        records = []
+        team_capacity = TeamCapacity(
+            team,
+            self.time_period,
+            holiday_schedule or ChristmasHolidaySchedule(),
+            instrumentation=Instrumentation([records.append]),
+            cache=CapacityCache(self.directory.name, max_bytes=max_bytes))
+        team_capacity.calculate()
+        return team_capacity, records[0]['counters']
+
+    def test_reuses_cached_capacity(self):
+        """Tests the capacity is only calculated again when an input changes"""
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM_DOCUMENT)
+        calculated, counters = self.calculate(team1)
+        self.assertEqual(counters['cache_misses'], 1)
+        cached, counters = self.calculate(team1)
+        self.assertEqual(counters['cache_hits'], 1)
+        self.assertNotIn('person_days_evaluated', counters)
+        self.assertTrue(calculated.get_df().equals(cached.get_df()))
+        self.assertEqual(cached.total_capacity_data, calculated.total_capacity_data)
+        _, counters = self.calculate(team1, ChristmasHolidaySchedule(('US',)))
+        self.assertEqual(counters['cache_misses'], 1)
+        team1.person_list[0] = team1.person_list[0]._replace(out_of_office_dates=frozenset())
+        _, counters = self.calculate(team1)
+        self.assertEqual(counters['cache_misses'], 1)
+
+    def test_updates_do_not_change_the_cache(self):
+        """Tests updating capacity loaded from the cache leaves the cached capacity unchanged"""
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM_DOCUMENT)
+        self.calculate(team1)
+        cached, _ = self.calculate(team1)
+        cached.recalculate_days(date(2023,12,18), date(2023,12,31))
+        cached.daily_capacity[0, 0] = 0.5
+        self.assertEqual(cached.daily_capacity[0, 0], 0.5)
+        cached_again, counters = self.calculate(team1)
+        self.assertEqual(counters['cache_hits'], 1)
+        self.assertEqual(cached_again.daily_capacity[0, 0], 0.75)
+
+    def test_evicts_least_recently_used(self):
+        """Tests the least recently used entries are removed once the cache is too big"""
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM_DOCUMENT)
+        cache = CapacityCache(self.directory.name)
+        self.calculate(team1)
+        entry_size = sum(size for _, size, _ in cache.entry_sizes())
+        first_entry = os.listdir(self.directory.name)[0]
+        os.utime(os.path.join(self.directory.name, first_entry), (0, 0))
+        self.calculate(team1, ChristmasHolidaySchedule(('US',)), max_bytes=entry_size)
+        self.assertEqual(len(cache.entry_sizes()), 1)
+        self.assertNotIn(first_entry, os.listdir(self.directory.name))
+        cache.clear()
+        self.assertEqual(cache.entry_sizes(), [])
@@ -0,0 +1,128 @@
+"""Unit tests for capacityquery.py"""
+import unittest
+from datetime import date
+from ..src.team import Team
+from ..src.teamcapacity import TeamCapacity
+from ..src.capacityquery import CapacityQuery
+from ..src.holiday import HolidaySchedulePort
+from ..src.timeperiod import TimePeriod
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+class TestCapacityQuery(unittest.TestCase):
+    """Test CapacityIndex class"""
+
+    def setUp(self):
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+          - name: Bobby BackendDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: True
+            qe: True
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: UK
+            out_of_office_dates:
+            - '2023-10-26'
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        self.team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        self.team1_capacity = TeamCapacity(
+            self.team1,
+            time_period,
+            HolidayScheduleForTesting())
+        self.team1_capacity.calculate()
+
+    def test_query_capacity(self):
+        """Tests range sums by person, epic type and location"""
+        totals = self.team1_capacity.query_capacity([
+            CapacityQuery(),
+            CapacityQuery('2023-10-25', '2023-10-27'),
+            CapacityQuery(date(2023,10,25), date(2023,10,27), epic_type='BACKEND'),
+            CapacityQuery('2023-10-25', '2023-10-27', epic_type='QE'),
+            CapacityQuery('2023-10-25', '2023-10-27', location='US'),
+            CapacityQuery('2023-10-25', '2023-10-27', person='Bobby BackendDev'),
+            CapacityQuery('2023-10-25', '2023-10-27', person='Freddy UIDev', epic_type='QE'),
+            CapacityQuery('2023-10-28', '2023-10-29'),
+            CapacityQuery('2023-01-01', '2023-10-25'),
+            CapacityQuery('2023-10-27', '2023-10-25'),
+        ])
+        self.assertEqual(totals, [16.5, 4.25, 4.25, 2.0, 2.25, 2.0, 0.0, 0.0, 1.75, 0.0])
+
+    def test_weekly_totals(self):
+        """Tests weeks start on a Monday and are cut to the time period"""
+        weekly_totals = self.team1_capacity.capacity_index.weekly_totals(location='UK')
+        self.assertEqual(weekly_totals, {'2023-10-25': 2.0, '2023-10-30': 5.0, '2023-11-06': 2.0})
+
+    def test_weekly_totals_sparse(self):
+        """Tests weeks are of the calendar when only the days someone is available are stored"""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates:
+            - '2023-10-23'
+            - '2023-10-30..2023-11-03'
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,23),
+            end_date=date(2023,11,12)
+        )
+        weekly_totals = []
+        for sparse in (False, True):
+            team1_capacity = TeamCapacity(
+                Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document),
+                time_period,
+                HolidayScheduleForTesting(),
+                sparse=sparse)
+            team1_capacity.calculate()
+            weekly_totals.append(team1_capacity.capacity_index.weekly_totals())
+        self.assertEqual(weekly_totals[0], {'2023-10-23': 4.0, '2023-10-30': 0.0, '2023-11-06': 5.0})
+        self.assertEqual(weekly_totals[1], weekly_totals[0])
+
+    def test_unknown_names(self):
+        """Tests queries for unknown persons, epic types and locations raise an exception"""
+        for query in [CapacityQuery(person='Nobody'), CapacityQuery(epic_type='UX'), CapacityQuery(location='FR')]:
+            self.assertRaises(ValueError, self.team1_capacity.query_capacity, [query])
+
+    def test_query_after_update(self):
+        """Tests the index is rebuilt when the capacity changes"""
+        self.assertEqual(self.team1_capacity.query_capacity([CapacityQuery(location='US')]), [7.5])
+        freddy = self.team1.person_list[0]
+        self.team1_capacity.update_person(freddy._replace(reserve_capacity=0.5))
+        self.assertEqual(self.team1_capacity.query_capacity([CapacityQuery(location='US')]), [5.0])
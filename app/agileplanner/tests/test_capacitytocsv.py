@@ -0,0 +1,149 @@
+"""Unit tests for capacitytocsv.py"""
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import date
+import pandas as pd
+from ..src.capacitytocsv import (
+    CapacitySheetLayout, ExportFormat, generate_capacity_sheet_for_team, stream_capacity_sheet_for_org,
+    generate_capacity_export_for_org, generate_schedule_export)
+from ..src.scheduler import TeamScheduler
+from ..src.epic import Epic, EpicType
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return some_date == date(2023,10,26) and location == 'UK'
+
+TEAM1_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.25
+    location: US
+    out_of_office_dates: []
+"""
+
+TEAM2_DOCUMENT = """
+team:
+  name: Team2
+  persons:
+  - name: Bobby BackendDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: False
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: UK
+    out_of_office_dates:
+    - '2023-10-25'
+"""
+
+class TestCapacityToCsv(unittest.TestCase):
+    """Tests for writing capacity sheets"""
+
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        os.chdir(self.directory.name)
+        self.teams = [
+            Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM1_DOCUMENT),
+            Team('Team2', 'team2.yaml').load_from_yaml_as_string(TEAM2_DOCUMENT),
+        ]
+        self.time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,29)
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_stream_wide_capacity_sheet(self):
+        """Tests the streamed wide sheet is the same as the generated one."""
+        csv_name = stream_capacity_sheet_for_org(
+            'Org', self.teams, self.time_period, HolidayScheduleForTesting())
+        self.assertEqual(csv_name, 'Org_test_period.csv')
+        with open(csv_name, encoding='utf-8') as file:
+            streamed = file.read()
+        org_team = Team('Org', 'NONE')
+        for team in self.teams:
+            org_team.add_list(team.person_list)
+        generate_capacity_sheet_for_team(org_team, self.time_period, HolidayScheduleForTesting())
+        with open(csv_name, encoding='utf-8') as file:
+            self.assertEqual(streamed, file.read())
+
+    def test_stream_long_capacity_sheet(self):
+        """Tests the streamed long sheet has a row per person and day."""
+        csv_name = stream_capacity_sheet_for_org(
+            'Org', self.teams, self.time_period, HolidayScheduleForTesting(),
+            layout=CapacitySheetLayout.LONG)
+        self.assertEqual(csv_name, 'Org_test_period_long.csv')
+        with open(csv_name, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        self.assertEqual(len(lines), 1 + 2 * 5)
+        self.assertEqual(lines[0], 'Person,Date,Capacity')
+        self.assertEqual(lines[1], 'Freddy UIDev,2023-10-25,0.75')
+        self.assertEqual(lines[6], 'Bobby BackendDev,2023-10-25,0.0')
+        self.assertEqual(lines[8], 'Bobby BackendDev,2023-10-27,1.0')
+        self.assertEqual(lines[9], 'Bobby BackendDev,2023-10-28,0.0')
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_capacity_export(self):
+        """Tests the capacity is exported with a row per person and day and typed columns."""
+        for export_format, compression, file_name in [
+                (ExportFormat.PARQUET, None, 'Org_test_period.parquet'),
+                (ExportFormat.PARQUET, 'zstd', 'Org_test_period.parquet'),
+                (ExportFormat.FEATHER, None, 'Org_test_period.feather')]:
+            org_capacity = generate_capacity_export_for_org(
+                'Org', self.teams, self.time_period, HolidayScheduleForTesting(),
+                export_format=export_format, compression=compression)
+            if export_format == ExportFormat.FEATHER:
+                df = pd.read_feather(file_name)
+            else:
+                df = pd.read_parquet(file_name)
+            self.assertEqual(list(df.columns), ['Team', 'Person', 'Location', 'Date', 'Capacity'])
+            self.assertEqual(len(df), 2 * 5)
+            self.assertEqual(df['Date'].dtype.kind, 'M')
+            self.assertEqual(df['Capacity'].dtype, 'float64')
+            self.assertEqual(df['Date'][1], pd.Timestamp('2023-10-26'))
+            self.assertEqual(list(df['Capacity']), [0.75, 0.75, 0.75, 0, 0, 0, 0, 1.0, 0, 0])
+            self.assertEqual(df['Capacity'].sum(), org_capacity.get_df()['Total'].iloc[-1])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_schedule_export(self):
+        """Tests schedule results are exported with typed columns."""
+        org_capacity = generate_capacity_export_for_org(
+            'Org', self.teams, self.time_period, HolidayScheduleForTesting())
+        schedule_results = TeamScheduler(org_capacity, [
+            Epic(key='csesc-1050', estimated_size=1, epic_type=EpicType.FRONTEND),
+            Epic(key='csesc-1051', estimated_size=5, epic_type=EpicType.BACKEND),
+            Epic(key='csesc-1052', estimated_size=1, epic_type=EpicType.QE),
+        ]).build_schedule()
+        file_name = generate_schedule_export('schedule', schedule_results)
+        self.assertEqual(file_name, 'schedule.parquet')
+        df = pd.read_parquet(file_name)
+        self.assertEqual(list(df['epic_key']), ['csesc-1050', 'csesc-1051', 'csesc-1052'])
+        self.assertEqual(list(df['epic_schedule_status']), ['OK', 'NO_CAPACITY_TO_COMPLETE', 'NO_CAPACITY_TO_START'])
+        self.assertEqual(df['start_date'][0], pd.Timestamp('2023-10-25'))
+        self.assertEqual(df['end_date'][0], pd.Timestamp('2023-10-26'))
+        self.assertTrue(pd.isna(df['end_date'][1]))
+        self.assertTrue(pd.isna(df['start_date'][2]))
+        self.assertEqual(list(df['epic_remaining']), [0.0, 2.75, 1.0])
@@ -0,0 +1,147 @@
+"""Unit tests for cumulativescheduler.py"""
+import unittest
+from datetime import date
+from ..src.cumulativescheduler import CumulativeTeamScheduler
+from ..src.scheduler import TeamScheduler, EpicScheduleStatus
+from ..src.epic import Epic, EpicType
+from ..src.teamcapacity import TeamCapacity
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+TEAM1_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: US
+    out_of_office_dates: []
+  - name: Bobby BackendDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: False
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.5
+    location: US
+    out_of_office_dates:
+    - '2023-10-27'
+"""
+
+class TestCumulativeTeamScheduler(unittest.TestCase):
+    """Tests for CumulativeTeamScheduler"""
+
+    def calculate_capacity(self, end_date: date) -> TeamCapacity:
+        """Calculates the capacity for Team1 from 2023-10-25 to the given end date."""
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=end_date
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM1_DOCUMENT)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        return team1_capacity
+
+    def test_schedule_epics(self):
+        """Tests scheduling epics that fit, share people across skills and won't fit."""
+        epics = [
+            Epic(key='csesc-1050', estimated_size=2, epic_type=EpicType.FRONTEND),
+            Epic(key='csesc-1051', estimated_size=3, epic_type=EpicType.BACKEND),
+            Epic(key='csesc-1052', estimated_size=2, epic_type=EpicType.DOCUMENTATION),
+            Epic(key='csesc-1053', estimated_size=10, epic_type=EpicType.FRONTEND),
+        ]
+        scheduler = CumulativeTeamScheduler(self.calculate_capacity(date(2023,11,7)), epics)
+        schedule_results = scheduler.build_schedule()
+        self.assertEqual(len(schedule_results), 4)
+        self.assertEqual(schedule_results[0].start_date, '2023-10-25')
+        self.assertEqual(schedule_results[0].end_date, '2023-10-26')
+        self.assertEqual(schedule_results[0].epic_schedule_status, EpicScheduleStatus.OK)
+        self.assertEqual(schedule_results[1].start_date, '2023-10-25')
+        self.assertEqual(schedule_results[1].end_date, '2023-10-30')
+        self.assertEqual(schedule_results[1].epic_remaining, 0)
+        self.assertEqual(schedule_results[1].epic_schedule_status, EpicScheduleStatus.OK)
+        self.assertEqual(schedule_results[2].start_date, 'WILL NOT START')
+        self.assertEqual(schedule_results[2].epic_schedule_status, EpicScheduleStatus.NO_CAPACITY_TO_START)
+        self.assertEqual(schedule_results[3].start_date, '2023-10-31')
+        self.assertEqual(schedule_results[3].end_date, 'WILL NOT COMPLETE IN TIME')
+        self.assertEqual(schedule_results[3].epic_remaining, 4)
+        self.assertEqual(schedule_results[3].epic_schedule_status, EpicScheduleStatus.NO_CAPACITY_TO_COMPLETE)
+
+    def test_schedule_matches_team_scheduler(self):
+        """Tests the schedule is the same as the one built by TeamScheduler."""
+        team1_capacity = self.calculate_capacity(date(2023,12,31))
+        epic_types = [EpicType.FRONTEND, EpicType.BACKEND, EpicType.BACKEND, EpicType.QE]
+        epics = [
+            Epic(key=f'csesc-{1050+i}', estimated_size=1 + (i * 7) % 5, epic_type=epic_types[i % 4])
+            for i in range(30)
+        ]
+        self.assertEqual(
+            CumulativeTeamScheduler(team1_capacity, epics).build_schedule(),
+            TeamScheduler(team1_capacity, epics).build_schedule())
+
+    def test_fractional_reserve_capacity(self):
+        """Tests an epic ends on the day its running total falls a rounding error short of its size."""
+        team_document = """
+        team:
+          name: Team2
+          persons:
+          - name: Alice
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: False
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.2
+            location: US
+            out_of_office_dates: []
+          - name: Sue
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: False
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.7
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,2),
+            end_date=date(2023,10,31)
+        )
+        team2 = Team('Team2', 'team2.yaml').load_from_yaml_as_string(team_document)
+        team2_capacity = TeamCapacity(
+            team2,
+            time_period,
+            HolidayScheduleForTesting())
+        team2_capacity.calculate()
+        epics = [Epic(key='csesc-1100', estimated_size=11, epic_type=EpicType.FRONTEND)]
+        team_scheduler = CumulativeTeamScheduler(team2_capacity, epics)
+        self.assertEqual(team_scheduler.estimate_days(epics[0]), (0, 11))
+        schedule_results = team_scheduler.build_schedule()
+        self.assertEqual(schedule_results[0].end_date, '2023-10-13')
+        self.assertEqual(schedule_results, TeamScheduler(team2_capacity, epics).build_schedule())
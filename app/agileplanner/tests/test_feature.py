@@ -0,0 +1,84 @@
+"""Unit tests for feature.py"""
+import unittest
+from ..src.epic import Epic, EpicType
+from ..src.feature import Feature, Features
+
+FEATURES_DOCUMENT = """
+features:
+- key: FEAT-1
+  epics:
+  - key: EPIC-1
+    estimated_size: 5
+    epic_type: FRONTEND
+  - key: EPIC-2
+    estimated_size: 3
+    epic_type: QE
+- key: FEAT-2
+  epics:
+  - key: EPIC-3
+    estimated_size: 8
+    epic_type: FRONTEND
+    priority: 1
+    depends_on:
+    - EPIC-1
+    min_size: 6
+    max_size: 12.5
+"""
+
+class TestFeatures(unittest.TestCase):
+    """Tests for Features"""
+
+    def setUp(self) -> None:
+        self.features = Features('features.yaml').load_from_yaml_as_string(FEATURES_DOCUMENT)
+
+    def test_iter_epics(self):
+        """Tests iterating over all epics and filtering by type and feature."""
+        self.assertEqual([epic.key for epic in self.features.get_epics()], ['EPIC-1', 'EPIC-2', 'EPIC-3'])
+        self.assertEqual(
+            [epic.key for epic in self.features.iter_epics(epic_type=EpicType.FRONTEND)], ['EPIC-1', 'EPIC-3'])
+        self.assertEqual([epic.key for epic in self.features.iter_epics(feature_key='FEAT-2')], ['EPIC-3'])
+        self.assertEqual(list(self.features.iter_epics(EpicType.QE, 'FEAT-2')), [])
+
+    def test_epic_index(self):
+        """Tests looking up epics and their features by key."""
+        self.assertEqual(self.features.get_epic('EPIC-2'), Epic('EPIC-2', 3, EpicType.QE))
+        self.assertEqual(self.features.get_feature_for_epic('EPIC-3').key, 'FEAT-2')
+        self.assertRaises(KeyError, self.features.get_epic, 'EPIC-4')
+
+        feature = Feature('FEAT-3')
+        feature.add_epic(Epic('EPIC-4', 1, EpicType.DEVOPS))
+        self.features.add_feature(feature)
+        self.assertEqual(self.features.get_feature_for_epic('EPIC-4').key, 'FEAT-3')
+        feature.add_epic(Epic('EPIC-5', 2, EpicType.DEVOPS))
+        self.assertEqual(self.features.get_epic('EPIC-5').estimated_size, 2)
+
+        feature.epic_list[1] = Epic('EPIC-6', 3, EpicType.DEVOPS)
+        self.features.invalidate_epic_index()
+        self.assertEqual(self.features.get_epic('EPIC-6').estimated_size, 3)
+        self.assertRaises(KeyError, self.features.get_epic, 'EPIC-5')
+
+        feature.add_epic(Epic('EPIC-1', 2, EpicType.DEVOPS))
+        self.assertRaises(ValueError, self.features.get_epic, 'EPIC-1')
+
+    def test_load_priority_and_dependencies(self):
+        """Tests priority, dependencies and size ranges are loaded and written back only when set."""
+        epic = self.features.get_epic('EPIC-3')
+        self.assertEqual((epic.priority, epic.depends_on), (1, ('EPIC-1',)))
+        self.assertEqual((epic.min_size, epic.max_size), (6, 12.5))
+        self.assertEqual(epic.to_yaml(), {
+            'key': 'EPIC-3', 'estimated_size': 8, 'epic_type': 'FRONTEND', 'priority': 1, 'depends_on': ['EPIC-1'],
+            'min_size': 6, 'max_size': 12.5})
+        self.assertEqual(self.features.get_epic('EPIC-1').to_yaml(), {
+            'key': 'EPIC-1', 'estimated_size': 5, 'epic_type': 'FRONTEND'})
+
+    def test_load_single_dependency(self):
+        """Tests a single epic key is loaded as a dependency on that epic and anything else is rejected."""
+        document = FEATURES_DOCUMENT.replace('    depends_on:\n    - EPIC-1\n', '    depends_on: EPIC-1\n')
+        features = Features('features.yaml').load_from_yaml_as_string(document)
+        self.assertEqual(features.get_epic('EPIC-3').depends_on, ('EPIC-1',))
+        document = FEATURES_DOCUMENT.replace('    depends_on:\n    - EPIC-1\n', '    depends_on: {EPIC-1: true}\n')
+        with self.assertRaisesRegex(ValueError, 'Epic EPIC-3 depends_on must be'):
+            Features('features.yaml').load_from_yaml_as_string(document)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Unit tests for forecast.py"""
+import unittest
+from datetime import date
+import numpy as np
+from ..src.forecast import BatchScheduleSimulator, forecast_schedule, sample_epic_sizes
+from ..src.cumulativescheduler import CumulativeTeamScheduler
+from ..src.epic import Epic, EpicType
+from ..src.teamcapacity import TeamCapacity
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+TEAM1_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.25
+    location: US
+    out_of_office_dates: ['2023-10-30']
+  - name: Bobby BackendDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: False
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.5
+    location: US
+    out_of_office_dates: []
+"""
+
+class TestForecast(unittest.TestCase):
+    """Tests for forecasting schedules"""
+
+    def setUp(self) -> None:
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM1_DOCUMENT)
+        self.team1_capacity = TeamCapacity(
+            team1,
+            TimePeriod(name='test_period', start_date=date(2023,10,25), end_date=date(2023,11,30)),
+            HolidayScheduleForTesting())
+        self.team1_capacity.calculate()
+        self.epics = [
+            Epic('e1', 3, EpicType.FRONTEND, min_size=2, max_size=6),
+            Epic('e2', 4, EpicType.BACKEND, priority=1, min_size=3, max_size=8),
+            Epic('e3', 2, EpicType.BACKEND, depends_on=('e1',)),
+            Epic('e4', 30, EpicType.FRONTEND, min_size=10, max_size=40),
+            Epic('e5', 1, EpicType.QE),
+        ]
+
+    def test_simulation_matches_scheduler(self):
+        """Tests simulating the estimated sizes gives the same dates as CumulativeTeamScheduler."""
+        simulator = BatchScheduleSimulator(self.team1_capacity, self.epics)
+        sizes = np.array([[epic.estimated_size for epic in simulator.epics]] * 3, dtype=float)
+        start_days, end_days = simulator.simulate(sizes)
+        days = simulator.days + ['WILL NOT START']
+        for i, result in enumerate(CumulativeTeamScheduler(self.team1_capacity, self.epics).build_schedule()):
+            self.assertEqual(result.epic_key, simulator.epics[i].key)
+            self.assertEqual(days[start_days[0, i]], result.start_date)
+            self.assertEqual(
+                days[end_days[0, i]] if end_days[0, i] < len(simulator.days) else 'WILL NOT COMPLETE IN TIME',
+                result.end_date)
+        self.assertTrue((start_days == start_days[0]).all())
+
+    def test_forecast_schedule(self):
+        """Tests forecast dates are ordered by percentile and repeatable."""
+        forecasts = forecast_schedule(self.team1_capacity, self.epics, simulations=2000, batch_size=300, seed=42)
+        self.assertEqual([forecast.epic_key for forecast in forecasts], ['e1', 'e3', 'e4', 'e5', 'e2'])
+        for forecast in (forecasts[0], forecasts[2]):
+            self.assertEqual(list(forecast.end_dates), [50, 85, 95])
+            self.assertLessEqual(forecast.end_dates[50], forecast.end_dates[85])
+            self.assertLessEqual(forecast.end_dates[85], forecast.end_dates[95])
+        self.assertEqual(forecasts[0].start_dates[95], '2023-10-25')
+        self.assertEqual(forecasts[0].completion_probability, 1.0)
+        self.assertLess(forecasts[2].completion_probability, 1.0)
+        self.assertGreater(forecasts[2].completion_probability, 0.0)
+        self.assertEqual(forecasts[2].end_dates[95], 'WILL NOT COMPLETE IN TIME')
+        self.assertEqual(forecasts[3].start_dates[50], 'WILL NOT START')
+        self.assertEqual(forecasts[3].completion_probability, 0.0)
+        self.assertEqual(forecasts, forecast_schedule(
+            self.team1_capacity, self.epics, simulations=2000, batch_size=1000, seed=42))
+        forecasts = forecast_schedule(self.team1_capacity, self.epics[1:], simulations=100, seed=42)
+        self.assertEqual(forecasts[0].epic_key, 'e3')
+        self.assertEqual(forecasts[0].start_dates[95], 'WILL NOT START')
+        self.assertEqual(forecasts[0].completion_probability, 0.0)
+
+    def test_sample_epic_sizes(self):
+        """Tests sizes are sampled within each epic's range."""
+        sizes = sample_epic_sizes(self.epics, 1000, np.random.default_rng(1))
+        self.assertEqual(sizes.shape, (1000, 5))
+        self.assertTrue(((sizes[:, 0] >= 2) & (sizes[:, 0] <= 6)).all())
+        self.assertTrue((sizes[:, 2] == 2).all())
+        self.assertRaises(ValueError, sample_epic_sizes,
+            [Epic('e1', 3, EpicType.FRONTEND, min_size=4, max_size=6)], 10, np.random.default_rng(1))
+
+if __name__ == '__main__':
+    unittest.main()
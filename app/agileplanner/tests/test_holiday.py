@@ -0,0 +1,95 @@
+"""Unit tests for holiday.py"""
+import unittest
+from datetime import date
+from ..src.holiday import HolidaySchedulePort, CachingHolidaySchedule
+
+class ChristmasHolidaySchedule(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing that counts lookups."""
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        self.lookups += 1
+        return location == 'US' and some_date.month == 12 and some_date.day in (25, 26)
+
+class BulkHolidaySchedule(ChristmasHolidaySchedule):
+    """HolidaySchedulePort implementation for testing that looks up date ranges in bulk."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.ranges = 0
+
+    def holidays_between(self, location: str, start_date: date, end_date: date) -> frozenset[date]:
+        self.ranges += 1
+        return frozenset(
+            some_date for some_date in (date(start_date.year, 12, 25), date(end_date.year, 12, 25))
+            if location == 'US' and start_date <= some_date <= end_date)
+
+class TestHolidaySchedule(unittest.TestCase):
+    """Tests for HolidaySchedulePort and CachingHolidaySchedule"""
+
+    def test_holidays_between(self):
+        """Tests the default bulk lookup is built on falls_on_holiday."""
+        holiday_schedule = ChristmasHolidaySchedule()
+        self.assertEqual(
+            holiday_schedule.holidays_between('US', date(2023,12,20), date(2023,12,31)),
+            {date(2023,12,25), date(2023,12,26)})
+        self.assertEqual(holiday_schedule.lookups, 12)
+        self.assertEqual(
+            holiday_schedule.holidays_between('UK', date(2023,12,20), date(2023,12,31)),
+            set())
+
+    def test_caching_holiday_schedule(self):
+        """Tests lookups are only passed on the first time they are made."""
+        holiday_schedule = ChristmasHolidaySchedule()
+        caching_holiday_schedule = CachingHolidaySchedule(holiday_schedule)
+        for _ in range(3):
+            self.assertTrue(caching_holiday_schedule.falls_on_holiday(date(2023,12,25), 'US'))
+            self.assertFalse(caching_holiday_schedule.falls_on_holiday(date(2023,12,25), 'UK'))
+            self.assertEqual(
+                caching_holiday_schedule.holidays_between('US', date(2023,12,1), date(2023,12,31)),
+                {date(2023,12,25), date(2023,12,26)})
+        # Christmas day in the US was already looked up, so is not looked up again for the range.
+        self.assertEqual(holiday_schedule.lookups, 2 + 30)
+        caching_holiday_schedule.cache_clear()
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,25), 'US')
+        self.assertEqual(holiday_schedule.lookups, 2 + 30 + 1)
+
+    def test_caching_holiday_schedule_overlapping_ranges(self):
+        """Tests overlapping date ranges only look up each date once."""
+        holiday_schedule = ChristmasHolidaySchedule()
+        caching_holiday_schedule = CachingHolidaySchedule(holiday_schedule)
+        self.assertFalse(caching_holiday_schedule.bulk_lookups)
+        caching_holiday_schedule.holidays_between('US', date(2023,10,1), date(2023,12,30))
+        self.assertEqual(holiday_schedule.lookups, 91)
+        self.assertEqual(
+            caching_holiday_schedule.holidays_between('US', date(2023,10,1), date(2023,12,31)),
+            {date(2023,12,25), date(2023,12,26)})
+        caching_holiday_schedule.holidays_between('US', date(2023,12,20), date(2024,1,9))
+        self.assertEqual(holiday_schedule.lookups, 91 + 1 + 9)
+
+    def test_caching_holiday_schedule_bulk_lookups(self):
+        """Tests a schedule that looks up date ranges in bulk is asked once per range."""
+        holiday_schedule = BulkHolidaySchedule()
+        caching_holiday_schedule = CachingHolidaySchedule(holiday_schedule)
+        self.assertTrue(caching_holiday_schedule.bulk_lookups)
+        for _ in range(3):
+            self.assertEqual(
+                caching_holiday_schedule.holidays_between('US', date(2023,12,1), date(2023,12,31)),
+                {date(2023,12,25)})
+        self.assertEqual(holiday_schedule.ranges, 1)
+        self.assertEqual(holiday_schedule.lookups, 0)
+
+    def test_caching_holiday_schedule_evicts_least_recently_used(self):
+        """Tests the cache is bounded by maxsize."""
+        holiday_schedule = ChristmasHolidaySchedule()
+        caching_holiday_schedule = CachingHolidaySchedule(holiday_schedule, maxsize=2)
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,24), 'US')
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,25), 'US')
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,24), 'US')
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,26), 'US')
+        self.assertEqual(holiday_schedule.lookups, 3)
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,24), 'US')
+        self.assertEqual(holiday_schedule.lookups, 3)
+        caching_holiday_schedule.falls_on_holiday(date(2023,12,25), 'US')
+        self.assertEqual(holiday_schedule.lookups, 4)
@@ -0,0 +1,106 @@
+"""Unit tests for instrumentation.py"""
+import json
+import logging
+import os
+import tempfile
+import unittest
+from datetime import date
+from ..src.instrumentation import Instrumentation, JsonLinesSink, logging_sink
+from ..src.scheduler import TeamScheduler
+from ..src.epic import Epic, EpicType
+from ..src.teamcapacity import TeamCapacity
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+TEAM1_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: US
+    out_of_office_dates: []
+  - name: Gone Already
+    start_date: '2022-01-01'
+    end_date: '2022-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: UK
+    out_of_office_dates: []
+"""
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests for Instrumentation"""
+
+    def test_capacity_and_scheduler_instrumentation(self):
+        """Tests phases and counters are collected and emitted to a callback."""
+        records = []
+        instrumentation = Instrumentation([records.append])
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM1_DOCUMENT)
+        team1_capacity = TeamCapacity(
+            team1,
+            TimePeriod(name='test_period', start_date=date(2023,10,25), end_date=date(2023,11,7)),
+            HolidayScheduleForTesting(),
+            instrumentation=instrumentation)
+        team1_capacity.calculate()
+        self.assertEqual(records[0]['event'], 'calculate')
+        self.assertEqual(records[0]['counters'], {
+            'person_days_evaluated': 14, 'holiday_lookups': 10, 'capacity_entries': 28})
+        self.assertEqual(set(records[0]['timings']), {
+            'calculate', 'calculate.persons', 'calculate.totals', 'calculate.tensor'})
+
+        instrumentation.reset()
+        epics = [Epic('e1', 2, EpicType.FRONTEND), Epic('e2', 2, EpicType.QE)]
+        TeamScheduler(team1_capacity, epics, instrumentation=instrumentation).build_schedule()
+        self.assertEqual(records[1]['event'], 'build_schedule')
+        self.assertEqual(records[1]['counters'], {
+            'epics_scheduled': 2, 'who_has_capacity_calls': 2, 'capacity_applications': 2})
+        self.assertGreaterEqual(records[1]['timings']['build_schedule'], records[1]['timings']['schedule_epic'])
+
+    def test_instrumentation_is_off_by_default(self):
+        """Tests nothing is collected without instrumentation."""
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(TEAM1_DOCUMENT)
+        team1_capacity = TeamCapacity(
+            team1,
+            TimePeriod(name='test_period', start_date=date(2023,10,25), end_date=date(2023,11,7)),
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        self.assertEqual(team1_capacity.instrumentation.snapshot(), {'timings': {}, 'counters': {}})
+
+    def test_sinks(self):
+        """Tests records are written to a JSON lines file and logged."""
+        instrumentation = Instrumentation()
+        instrumentation.count('holiday_lookups', 3)
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'instrumentation.jsonl')
+            instrumentation.sinks.append(JsonLinesSink(file_path))
+            instrumentation.sinks.append(logging_sink(logging.getLogger('test_instrumentation')))
+            with self.assertLogs('test_instrumentation', logging.INFO) as logs:
+                instrumentation.emit('first')
+                instrumentation.emit('second')
+            with open(file_path, 'r', encoding='utf-8') as file:
+                records = [json.loads(line) for line in file]
+        self.assertEqual([record['event'] for record in records], ['first', 'second'])
+        self.assertEqual(records[0]['counters'], {'holiday_lookups': 3})
+        self.assertEqual(logs.records[0].instrumentation, records[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Unit tests for person.py"""
+import unittest
+from datetime import date
+from ..src.person import Person, parse_out_of_office_dates
+from ..src.team import Team
+
+class TestPerson(unittest.TestCase):
+    """Tests for Person"""
+
+    def test_parse_out_of_office_dates(self):
+        """Tests single dates and ranges are parsed and overlapping ranges merged."""
+        out_of_office_dates, out_of_office_ranges = parse_out_of_office_dates([
+            '2023-10-03',
+            '2023-12-01..2023-12-10',
+            '2023-10-03',
+            '2023-11-01..2023-11-05',
+            '2023-12-05 .. 2023-12-22',
+        ])
+        self.assertEqual(out_of_office_dates, {date(2023,10,3)})
+        self.assertEqual(out_of_office_ranges, (
+            (date(2023,11,1), date(2023,11,5)),
+            (date(2023,12,1), date(2023,12,22)),
+        ))
+        self.assertRaises(ValueError, parse_out_of_office_dates, ['2023-12-22..2023-12-01'])
+
+    def test_is_out_of_office(self):
+        """Tests out of office dates and ranges."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates:
+            - '2023-10-03'
+            - '2023-11-01..2023-11-05'
+            - '2024-01-01..2024-03-31'
+        """
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        person: Person = team1.person_list[0]
+        self.assertTrue(person.is_out_of_office(date(2023,10,3)))
+        self.assertFalse(person.is_out_of_office(date(2023,10,4)))
+        self.assertFalse(person.is_out_of_office(date(2023,10,31)))
+        self.assertTrue(person.is_out_of_office(date(2023,11,1)))
+        self.assertTrue(person.is_out_of_office(date(2023,11,5)))
+        self.assertFalse(person.is_out_of_office(date(2023,11,6)))
+        self.assertTrue(person.is_out_of_office(date(2024,2,29)))
+        self.assertFalse(person.is_out_of_office(date(2024,4,1)))
+        self.assertEqual(person.to_yaml()['out_of_office_dates'], [
+            '2023-10-03', '2023-11-01..2023-11-05', '2024-01-01..2024-03-31'])
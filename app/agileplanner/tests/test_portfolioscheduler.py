@@ -0,0 +1,103 @@
+"""Unit tests for portfolioscheduler.py"""
+import unittest
+from datetime import date
+from ..src.portfolioscheduler import PortfolioScheduler
+from ..src.scheduler import EpicScheduleStatus
+from ..src.epic import Epic, EpicType
+from ..src.teamcapacity import TeamCapacity
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+TEAM_TEMPLATE = """
+team:
+  name: {team_name}
+  persons:
+  - name: {team_name} UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: False
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.0
+    location: US
+    out_of_office_dates: {out_of_office_dates}
+"""
+
+class TestPortfolioScheduler(unittest.TestCase):
+    """Tests for PortfolioScheduler"""
+
+    def setUp(self) -> None:
+        self.time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+
+    def team_capacity(self, team_name: str, out_of_office_dates: str = '[]', sparse: bool = False) -> TeamCapacity:
+        """Returns the calculated capacity of a team with a single front end developer."""
+        team = Team(team_name, f'{team_name}.yaml').load_from_yaml_as_string(
+            TEAM_TEMPLATE.format(team_name=team_name, out_of_office_dates=out_of_office_dates))
+        team_capacity = TeamCapacity(team, self.time_period, HolidayScheduleForTesting(), sparse=sparse)
+        team_capacity.calculate()
+        return team_capacity
+
+    def test_assign_epics_to_team_finishing_earliest(self):
+        """Tests each epic goes to the team that completes it first."""
+        team_capacities = [self.team_capacity('Team1'), self.team_capacity('Team2', "['2023-10-25']")]
+        backlog = [
+            Epic('e1', 2, EpicType.FRONTEND),
+            Epic('e2', 2, EpicType.FRONTEND),
+            Epic('e3', 1, EpicType.QE),
+            Epic('e4', 1, EpicType.FRONTEND, depends_on=('e2',)),
+            Epic('e5', 1, EpicType.FRONTEND, depends_on=('e3',)),
+        ]
+        results = PortfolioScheduler(team_capacities, backlog).build_schedule()
+        self.assertEqual([
+            (team_name, result.epic_key, result.epic_schedule_status, result.start_date, result.end_date)
+            for team_name, result in results
+        ], [
+            ('Team1', 'e1', EpicScheduleStatus.OK, '2023-10-25', '2023-10-26'),
+            ('Team2', 'e2', EpicScheduleStatus.OK, '2023-10-26', '2023-10-27'),
+            (None, 'e3', EpicScheduleStatus.NO_CAPACITY_TO_START, 'WILL NOT START', 'WILL NOT COMPLETE IN TIME'),
+            ('Team1', 'e4', EpicScheduleStatus.OK, '2023-10-30', '2023-10-30'),
+            (None, 'e5', EpicScheduleStatus.BLOCKED_BY_DEPENDENCY, 'WILL NOT START', 'WILL NOT COMPLETE IN TIME'),
+        ])
+
+    def test_sparse_team_capacities(self):
+        """Tests teams that only store the days someone is available are scheduled as if they stored every day."""
+        backlog = [
+            Epic('e1', 2, EpicType.FRONTEND),
+            Epic('e2', 3, EpicType.FRONTEND),
+            Epic('e3', 1, EpicType.FRONTEND, depends_on=('e2',)),
+            Epic('e4', 8, EpicType.FRONTEND),
+            Epic('e5', 1, EpicType.FRONTEND, depends_on=('e4',)),
+        ]
+        out_of_office_dates = "['2023-10-25', '2023-10-30']"
+        dense_results = PortfolioScheduler(
+            [self.team_capacity('Team1'), self.team_capacity('Team2', out_of_office_dates)], backlog).build_schedule()
+        for sparse in ((True, False), (False, True), (True, True)):
+            team_capacities = [
+                self.team_capacity('Team1', sparse=sparse[0]),
+                self.team_capacity('Team2', out_of_office_dates, sparse=sparse[1])]
+            self.assertEqual(PortfolioScheduler(team_capacities, backlog).build_schedule(), dense_results)
+        self.assertEqual([team_name for team_name, _ in dense_results], ['Team1', 'Team2', 'Team1', 'Team1', None])
+
+    def test_invalid_team_capacities(self):
+        """Tests teams must be distinct and cover the same time period."""
+        self.assertRaises(ValueError, PortfolioScheduler, [], [])
+        self.assertRaises(ValueError, PortfolioScheduler, [self.team_capacity('Team1'), self.team_capacity('Team1')], [])
+        other_capacity = self.team_capacity('Team2')
+        self.time_period = TimePeriod(name='other', start_date=date(2023,10,25), end_date=date(2023,10,31))
+        self.assertRaises(ValueError, PortfolioScheduler, [other_capacity, self.team_capacity('Team1')], [])
+
+if __name__ == '__main__':
+    unittest.main()
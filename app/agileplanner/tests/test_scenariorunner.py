@@ -0,0 +1,85 @@
+"""Unit tests for scenariorunner.py"""
+import unittest
+from datetime import date
+from ..src.scenariorunner import run_scenarios
+from ..src.scheduler import EpicScheduleStatus, TeamScheduler
+from ..src.cumulativescheduler import CumulativeTeamScheduler
+from ..src.epic import Epic, EpicType
+from ..src.teamcapacity import TeamCapacity
+from ..src.team import Team
+from ..src.timeperiod import TimePeriod
+from ..src.holiday import HolidaySchedulePort
+
+class HolidayScheduleForTesting(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing."""
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        return False
+
+class TestRunScenarios(unittest.TestCase):
+    """Tests for run_scenarios"""
+
+    def test_run_scenarios(self):
+        """Tests each scenario is scheduled against its own copy of the capacity."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        e1 = Epic(
+            key='csesc-1050',
+            estimated_size=2,
+            epic_type=EpicType.FRONTEND
+        )
+        e2 = Epic(
+            key='csesc-1051',
+            estimated_size=2,
+            epic_type=EpicType.BACKEND
+        )
+        e3 = Epic(
+            key='csesc-1052',
+            estimated_size=1,
+            epic_type=EpicType.FRONTEND,
+            depends_on=('csesc-1051',)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        scenarios = {
+            'frontend first': [e1, e2],
+            'backend first': [e2, e1],
+            'backend only': [e2],
+            'backend cut': [e1, e3],
+        }
+        for scheduler_class in [TeamScheduler, CumulativeTeamScheduler]:
+            schedule_results = run_scenarios(
+                team1_capacity, scenarios, max_workers=2, scheduler_class=scheduler_class)
+            self.assertEqual(list(schedule_results.keys()), list(scenarios.keys()))
+            for scenario_name, epics in scenarios.items():
+                self.assertEqual(
+                    schedule_results[scenario_name],
+                    scheduler_class(team1_capacity, epics).build_schedule())
+            self.assertEqual(schedule_results['frontend first'][1].start_date, '2023-10-27')
+            self.assertEqual(schedule_results['backend first'][0].start_date, '2023-10-25')
+            self.assertEqual(schedule_results['backend only'][0].end_date, '2023-10-26')
+            self.assertEqual(
+                schedule_results['backend cut'][1].epic_schedule_status, EpicScheduleStatus.BLOCKED_BY_DEPENDENCY)
@@ -1,7 +1,8 @@
 """Unit tests for scheduler.py"""
 import unittest
 from datetime import date
-from ..src.scheduler import TeamScheduler, EpicScheduleStatus
+from ..src.scheduler import TeamScheduler, EpicScheduleStatus, CapacityConsumption
+from ..src.cumulativescheduler import CumulativeTeamScheduler
 from ..src.epic import Epic, EpicType
 from ..src.teamcapacity import TeamCapacity
 from ..src.team import Team
@@ -461,4 +462,202 @@ class TestTeamScheduler(unittest.TestCase):
         self.assertEqual(schedule_results[2].start_date, 'WILL NOT START')
         self.assertEqual(schedule_results[2].end_date, 'WILL NOT COMPLETE IN TIME')
         self.assertEqual(schedule_results[2].epic_remaining, 2)
-        self.assertEqual(schedule_results[2].epic_schedule_status, EpicScheduleStatus.NO_CAPACITY_TO_START)
\ No newline at end of file
+        self.assertEqual(schedule_results[2].epic_schedule_status, EpicScheduleStatus.NO_CAPACITY_TO_START)
+
+    def test_audit_log_replay(self):
+        """Tests the audit log records consumed capacity and can be replayed."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        e1 = Epic(
+            key='csesc-1050',
+            estimated_size=1,
+            epic_type=EpicType.FRONTEND
+        )
+        e2 = Epic(
+            key='csesc-1051',
+            estimated_size=1,
+            epic_type=EpicType.BACKEND
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        self.assertIsNone(TeamScheduler(team1_capacity,[e1,e2]).audit_log)
+        scheduler = TeamScheduler(team1_capacity,[e1,e2],audit=True)
+        scheduler.build_schedule()
+        self.assertEqual(scheduler.audit_log.entries, [
+            CapacityConsumption('2023-10-25', 'Freddy UIDev', 'FRONTEND', 0.75, 'csesc-1050'),
+            CapacityConsumption('2023-10-26', 'Freddy UIDev', 'FRONTEND', 0.25, 'csesc-1050'),
+            CapacityConsumption('2023-10-26', 'Freddy UIDev', 'BACKEND', 0.5, 'csesc-1051'),
+            CapacityConsumption('2023-10-27', 'Freddy UIDev', 'BACKEND', 0.5, 'csesc-1051'),
+        ])
+        self.assertEqual(scheduler.remaining_capacity_for('2023-10-26', 'Freddy UIDev'), 0)
+        self.assertEqual(scheduler.remaining_capacity_for('2023-10-27', 'Freddy UIDev'), 0.25)
+        replayed_scheduler = TeamScheduler(team1_capacity,[])
+        scheduler.audit_log.replay(replayed_scheduler)
+        self.assertEqual(replayed_scheduler.remaining_capacity.changed_days, scheduler.remaining_capacity.changed_days)
+
+
+    def test_schedulers_share_team_capacity(self):
+        """Tests schedulers built from the same capacity do not affect each other."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: False
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        e1 = Epic(
+            key='csesc-1050',
+            estimated_size=2,
+            epic_type=EpicType.FRONTEND
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        scheduler1 = TeamScheduler(team1_capacity,[e1])
+        scheduler2 = TeamScheduler(team1_capacity,[e1])
+        self.assertEqual(scheduler1.build_schedule(), scheduler2.build_schedule())
+        self.assertIs(scheduler1.remaining_capacity.base, scheduler2.remaining_capacity.base)
+        self.assertEqual(sorted(scheduler1.remaining_capacity.changed_days), [0, 1])
+        self.assertEqual(team1_capacity.get_daily_capacity_by_day()[0], [1.0])
+
+    def test_days_with_capacity(self):
+        """Tests days are dropped from the skills of a person once their capacity is consumed."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        e1 = Epic(
+            key='csesc-1050',
+            estimated_size=2,
+            epic_type=EpicType.FRONTEND
+        )
+        e2 = Epic(
+            key='csesc-1051',
+            estimated_size=0,
+            epic_type=EpicType.BACKEND
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        scheduler = TeamScheduler(team1_capacity,[e1,e2])
+        self.assertEqual(scheduler.days_with_capacity.days_by_category['FRONTEND'], [0, 1, 2, 5, 6, 7, 8, 9, 12, 13])
+        self.assertEqual(scheduler.days_with_capacity.days_by_category['QE'], [])
+        results = scheduler.build_schedule()
+        self.assertEqual(scheduler.days_with_capacity.next_day('FRONTEND', 0), 2)
+        self.assertEqual(scheduler.days_with_capacity.next_day('BACKEND', 3), 5)
+        self.assertIsNone(scheduler.days_with_capacity.next_day('BACKEND', 14))
+        self.assertEqual((results[0].start_date, results[0].end_date), ('2023-10-25', '2023-10-26'))
+        self.assertEqual(results[1].epic_schedule_status, EpicScheduleStatus.OK)
+        self.assertEqual((results[1].start_date, results[1].end_date), ('WILL NOT START', '2023-10-25'))
+        scheduler.consume_capacity('2023-10-25', 'Freddy UIDev', -0.5)
+        self.assertEqual(scheduler.days_with_capacity.next_day('FRONTEND', 0), 0)
+
+    def test_schedule_epics_with_dependencies(self):
+        """Tests epics do not start before the epics they depend on end."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,11,7)
+        )
+        epics = [
+            Epic('e1', 1, EpicType.FRONTEND, depends_on=('e2',)),
+            Epic('e2', 2, EpicType.BACKEND),
+            Epic('e3', 1, EpicType.QE),
+            Epic('e4', 1, EpicType.FRONTEND, depends_on=('e3',)),
+        ]
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        for scheduler_class in (TeamScheduler, CumulativeTeamScheduler):
+            results = scheduler_class(team1_capacity, epics).build_schedule()
+            self.assertEqual([(r.epic_key, r.epic_schedule_status, r.start_date, r.end_date) for r in results], [
+                ('e2', EpicScheduleStatus.OK, '2023-10-25', '2023-10-26'),
+                ('e1', EpicScheduleStatus.OK, '2023-10-27', '2023-10-27'),
+                ('e3', EpicScheduleStatus.NO_CAPACITY_TO_START, 'WILL NOT START', 'WILL NOT COMPLETE IN TIME'),
+                ('e4', EpicScheduleStatus.BLOCKED_BY_DEPENDENCY, 'WILL NOT START', 'WILL NOT COMPLETE IN TIME'),
+            ])
+            # e2 is cut from scope, so e1 is blocked rather than rejected.
+            results = scheduler_class(team1_capacity, [epics[0], epics[2]]).build_schedule()
+            self.assertEqual([(r.epic_key, r.epic_schedule_status) for r in results], [
+                ('e1', EpicScheduleStatus.BLOCKED_BY_DEPENDENCY),
+                ('e3', EpicScheduleStatus.NO_CAPACITY_TO_START),
+            ])
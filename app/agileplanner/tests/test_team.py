@@ -0,0 +1,79 @@
+"""Unit tests for team.py"""
+import os
+import tempfile
+import unittest
+from ..src.team import Organization, find_team_files
+
+TEAM_TEMPLATE = """
+team:
+  name: {team_name}
+  persons:
+  - name: {person_name}
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: True
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: {reserve_capacity}
+    location: US
+    out_of_office_dates: []
+"""
+
+class TestOrganization(unittest.TestCase):
+    """Tests for loading organizations"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write_team(self, file_name: str, team_name: str, person_name: str, reserve_capacity: float = 0.0) -> None:
+        """Writes a team file with a single person into the temporary directory."""
+        with open(os.path.join(self.directory.name, file_name), 'w', encoding='utf-8') as file:
+            file.write(TEAM_TEMPLATE.format(
+                team_name=team_name, person_name=person_name, reserve_capacity=reserve_capacity))
+
+    def test_load_org_team(self):
+        """Tests all team files in a directory are merged into the org team."""
+        for i in range(5):
+            self.write_team(f'team{i}.yaml', f'Team{i}', f'Person{i}')
+        with open(os.path.join(self.directory.name, 'notes.txt'), 'w', encoding='utf-8') as file:
+            file.write('not a team')
+
+        org_team = Organization('Org').load_org_team(self.directory.name, max_workers=2)
+        self.assertEqual(org_team.name, 'Org')
+        self.assertEqual([person.name for person in org_team.person_list], [f'Person{i}' for i in range(5)])
+
+        pattern = os.path.join(self.directory.name, 'team[12].yaml')
+        self.assertEqual(len(find_team_files(pattern)), 2)
+        teams = Organization('Org').load_teams(pattern, max_workers=2)
+        self.assertEqual([team.name for team in teams], ['Team1', 'Team2'])
+
+    def test_load_teams_rejects_duplicate_persons(self):
+        """Tests a person in more than one team is reported."""
+        self.write_team('team1.yaml', 'Team1', 'Freddy')
+        self.write_team('team2.yaml', 'Team2', 'Freddy')
+        with self.assertRaisesRegex(ValueError, 'Freddy in .*team1.yaml, .*team2.yaml'):
+            Organization('Org').load_teams(self.directory.name, max_workers=2)
+
+    def test_load_teams_rejects_invalid_files(self):
+        """Tests invalid team files and empty directories are reported."""
+        with self.assertRaisesRegex(ValueError, 'No team files found'):
+            Organization('Org').load_teams(self.directory.name)
+        self.write_team('team1.yaml', 'Team1', 'Freddy', reserve_capacity=1.5)
+        with self.assertRaisesRegex(ValueError, 'team1.yaml: Freddy has a reserve capacity'):
+            Organization('Org').load_teams(self.directory.name, max_workers=1)
+        with open(os.path.join(self.directory.name, 'team1.yaml'), 'w', encoding='utf-8') as file:
+            file.write('team:\n  name: Team1\n')
+        with self.assertRaisesRegex(ValueError, 'team1.yaml: not a valid team file'):
+            Organization('Org').load_teams(self.directory.name, max_workers=1)
+        with open(os.path.join(self.directory.name, 'team1.yaml'), 'w', encoding='utf-8') as file:
+            file.write('team:\n  name: [Team1\n')
+        with self.assertRaisesRegex(ValueError, 'team1.yaml: not a valid team file'):
+            Organization('Org').load_teams(self.directory.name, max_workers=2)
+
+if __name__ == '__main__':
+    unittest.main()
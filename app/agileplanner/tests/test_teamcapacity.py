@@ -1,10 +1,14 @@
 """Unit tests for teamcapacity.py"""
+import pickle
 import unittest
 from datetime import date
 from ..src.team import Team
+from ..src.person import Person
 from ..src.teamcapacity import TeamCapacity
+from ..src.capacityquery import CapacityQuery
 from ..src.holiday import HolidaySchedulePort
 from ..src.timeperiod import TimePeriod
+from ..src.instrumentation import Instrumentation, NullInstrumentation
 
 class HolidayScheduleForTesting(HolidaySchedulePort):
     """HolidaySchedulePort implementation for testing."""
@@ -12,6 +16,23 @@ class HolidayScheduleForTesting(HolidaySchedulePort):
     def falls_on_holiday(self,some_date: date,location: str) -> bool:
         return False
 
+class ChristmasHolidaySchedule(HolidaySchedulePort):
+    """HolidaySchedulePort implementation for testing with a US only holiday."""
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    # overriding abstract method
+    def falls_on_holiday(self,some_date: date,location: str) -> bool:
+        self.lookups += 1
+        return location == 'US' and some_date.month == 12 and some_date.day == 25
+
+class BulkChristmasHolidaySchedule(ChristmasHolidaySchedule):
+    """HolidaySchedulePort implementation for testing that looks up date ranges in bulk."""
+    def holidays_between(self, location: str, start_date: date, end_date: date) -> frozenset[date]:
+        self.lookups += 1
+        christmas = date(start_date.year, 12, 25)
+        return frozenset([christmas]) if location == 'US' and start_date <= christmas <= end_date else frozenset()
+
 class TestTeamCapacity(unittest.TestCase):
     """Test TeamCapacity class"""
 
@@ -104,3 +125,486 @@ class TestTeamCapacity(unittest.TestCase):
         #team1_capacity.calculate()
         #df = team1_capacity.get_df()
         #self.assertEqual(df.shape[0],1) 
+
+    def test_capacity_tensor(self):
+        """Tests the capacity tensor is indexed by day, person and epic type."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+          - name: Quincy QE
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: False
+            qe: True
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates:
+            - '2023-10-26'
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        tensor = team1_capacity.get_capacity_tensor()
+        self.assertEqual(tensor.shape, (4, 2, 5))
+        day = team1_capacity.day_index['2023-10-25']
+        freddy = team1_capacity.person_index['Freddy UIDev']
+        quincy = team1_capacity.person_index['Quincy QE']
+        self.assertEqual(tensor[day, freddy, team1_capacity.epic_type_index['FRONTEND']], 0.75)
+        self.assertEqual(tensor[day, freddy, team1_capacity.epic_type_index['QE']], 0)
+        self.assertEqual(tensor[day, quincy, team1_capacity.epic_type_index['QE']], 1.0)
+        self.assertEqual(tensor[team1_capacity.day_index['2023-10-26'], quincy].sum(), 0)
+        self.assertEqual(tensor[team1_capacity.day_index['2023-10-28']].sum(), 0)
+
+    def test_detailed_capacity_data_view(self):
+        """Tests the nested dict view is built from the capacity tensor."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: False
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        self.assertEqual(team1_capacity.detailed_capacity_data, {})
+        team1_capacity.calculate()
+        detailed_capacity_data = team1_capacity.detailed_capacity_data
+        self.assertEqual(list(detailed_capacity_data.keys()), ['2023-10-25','2023-10-26','2023-10-27','2023-10-28'])
+        self.assertEqual(detailed_capacity_data['2023-10-25']['Freddy UIDev']['FRONTEND'], [0.75])
+        self.assertEqual(detailed_capacity_data['2023-10-25']['Freddy UIDev']['BACKEND'], [0])
+        self.assertEqual(detailed_capacity_data['2023-10-28']['Freddy UIDev']['FRONTEND'], [0])
+        self.assertIs(team1_capacity.detailed_capacity_data, detailed_capacity_data)
+
+    def test_daily_capacity_masks(self):
+        """Tests weekends, holidays, out of office and inactive days have no capacity."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2023-12-27'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates:
+            - '2023-12-26'
+          - name: Ursula UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+          - name: Bobby BackendDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: UK
+            out_of_office_dates:
+            - '2023-12-20..2023-12-21'
+            - '2023-12-27..2024-01-05'
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,12,22),
+            end_date=date(2023,12,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        holiday_schedule = ChristmasHolidaySchedule()
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            holiday_schedule)
+        team1_capacity.calculate()
+        df = team1_capacity.get_df()
+        self.assertEqual(df.shape, (4, 11 + 7 + 1))
+        self.assertEqual(list(df['2023-12-22']), [0.75, 0.75, 1.0, 2.5])
+        self.assertEqual(list(df['2023-12-23']), [0, 0, 0, 0])
+        self.assertEqual(df['2023-12-23'].dtype, 'int64')
+        self.assertEqual(list(df['2023-12-25']), [0, 0, 1.0, 1.0])
+        self.assertEqual(list(df['2023-12-26']), [0, 0.75, 1.0, 1.75])
+        self.assertEqual(list(df['2023-12-27']), [0.75, 0.75, 0, 1.5])
+        self.assertEqual(list(df['2023-12-28']), [0, 0.75, 0, 0.75])
+        self.assertEqual(list(df['Total']), [1.5, 3.0, 3.0, 7.5])
+        self.assertEqual(holiday_schedule.lookups, 10)
+        bulk_holiday_schedule = BulkChristmasHolidaySchedule()
+        bulk_capacity = TeamCapacity(team1, time_period, bulk_holiday_schedule)
+        bulk_capacity.calculate()
+        self.assertTrue(bulk_capacity.get_df().equals(df))
+        self.assertEqual(bulk_holiday_schedule.lookups, 2)
+
+    def test_update_person(self):
+        """Tests updating one person only changes their capacity and the totals."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+          - name: Bobby BackendDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        bobby = team1.person_list[1]
+        team1_capacity.update_person(bobby._replace(
+            reserve_capacity=0.5, qe=True, out_of_office_dates=frozenset([date(2023,10,26)])))
+        df = team1_capacity.get_df()
+        self.assertEqual(list(df['Reserve Capacity']), [0.25, 0.5, '-'])
+        self.assertEqual(list(df['QE']), ['F', 'T', '-'])
+        self.assertEqual(list(df['2023-10-25']), [0.75, 0.5, 1.25])
+        self.assertEqual(list(df['2023-10-26']), [0.75, 0, 0.75])
+        self.assertEqual(list(df['2023-10-28']), [0, 0, 0])
+        self.assertEqual(list(df['Total']), [2.25, 1.0, 3.25])
+        self.assertEqual(team1_capacity.total_capacity_data['2023-10-27'], [1.25])
+        tensor = team1_capacity.get_capacity_tensor()
+        self.assertEqual(tensor[0, 1, team1_capacity.epic_type_index['QE']], 0.5)
+        self.assertRaises(ValueError, team1_capacity.update_person, bobby._replace(name='Nobody'))
+
+    def test_updates_match_calculate(self):
+        """Tests the capacity after updates is identical to calculating it afresh."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+          - name: Bobby BackendDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.35
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,23),
+            end_date=date(2023,11,5)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        freddy, bobby = team1.person_list
+        for reserve_capacity in (0.1, 0.7, 0.3):
+            team1_capacity.update_person(freddy._replace(reserve_capacity=reserve_capacity))
+            team1_capacity.update_person(bobby._replace(reserve_capacity=reserve_capacity / 3))
+        team1_capacity.update_person(freddy)
+        team1_capacity.update_person(bobby._replace(out_of_office_dates=frozenset([date(2023,10,26)])))
+        team1_capacity.recalculate_days(date(2023,10,26), date(2023,10,27))
+        team1_capacity.recalculate_days(date(2023,10,24), date(2023,10,26))
+        calculated_capacity = TeamCapacity(
+            Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document),
+            time_period,
+            HolidayScheduleForTesting())
+        calculated_capacity.team.person_list[1] = team1.person_list[1]
+        calculated_capacity.calculate()
+        self.assertTrue(team1_capacity.get_df().equals(calculated_capacity.get_df()))
+        self.assertEqual(team1_capacity.total_capacity_data, calculated_capacity.total_capacity_data)
+        self.assertEqual(team1_capacity.team_total, calculated_capacity.team_total)
+
+    def test_person_added_after_construction(self):
+        """Tests persons added to the team before calculating are included."""
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,28)
+        )
+        team1 = Team('Team1', 'team1.yaml')
+        team1_capacity = TeamCapacity(team1, time_period, HolidayScheduleForTesting())
+        team1.add_person(Person(
+            'Freddy UIDev', date(2023,1,1), date(2030,12,31), True, False, False, False, False, 0.25, 'US', frozenset()))
+        team1_capacity.calculate()
+        self.assertEqual(list(team1_capacity.get_df()['Total']), [2.25, 2.25])
+        self.assertEqual(team1_capacity.person_index, {'Freddy UIDev': 0})
+        self.assertEqual(team1_capacity.get_capacity_tensor().shape, (4, 1, 5))
+
+    def test_lazy_df(self):
+        """Tests the dataframe is only built when asked for and is rebuilt after an update."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,10,25),
+            end_date=date(2023,10,26)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            HolidayScheduleForTesting())
+        team1_capacity.calculate()
+        self.assertIsNone(team1_capacity.df)
+        df = team1_capacity.get_df()
+        self.assertIs(team1_capacity.get_df(), df)
+        self.assertEqual(df['Front End'].dtype, 'category')
+        self.assertEqual(list(df['Front End'].cat.categories), ['F', 'T', '-'])
+        self.assertEqual(df['2023-10-25'].dtype, 'float64')
+        team1_capacity.update_person(team1.person_list[0]._replace(reserve_capacity=0.5))
+        self.assertEqual(list(team1_capacity.get_df()['Total']), [1.0, 1.0])
+
+    def test_sparse(self):
+        """Tests only days on which someone is available are stored in sparse mode."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates:
+            - '2023-12-26'
+          - name: Bobby BackendDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: False
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates:
+            - '2023-12-26'
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,12,22),
+            end_date=date(2023,12,27)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        dense_capacity = TeamCapacity(team1, time_period, ChristmasHolidaySchedule())
+        dense_capacity.calculate()
+        team1_capacity = TeamCapacity(team1, time_period, ChristmasHolidaySchedule(), sparse=True)
+        team1_capacity.calculate()
+        self.assertEqual(team1_capacity.daily_column_headings, ['2023-12-22', '2023-12-27'])
+        self.assertEqual(team1_capacity.daily_capacity.shape, (2, 2))
+        self.assertTrue(team1_capacity.get_df().equals(dense_capacity.get_df()))
+        self.assertEqual(team1_capacity.total_capacity_data, dense_capacity.total_capacity_data)
+        freddy = team1.person_list[0]
+        team1_capacity.update_person(freddy._replace(out_of_office_dates=frozenset()))
+        self.assertEqual(team1_capacity.daily_column_headings, ['2023-12-22', '2023-12-26', '2023-12-27'])
+        self.assertEqual(list(team1_capacity.get_df()['2023-12-26']), [0.75, 0, 0.75])
+        self.assertEqual(list(team1_capacity.get_df()['2023-12-25']), [0, 0, 0])
+        team1_capacity.update_person(freddy)
+        self.assertEqual(team1_capacity.daily_column_headings, ['2023-12-22', '2023-12-27'])
+        self.assertEqual(team1_capacity.get_capacity_tensor().shape, (2, 2, 5))
+        self.assertTrue(team1_capacity.get_df().equals(dense_capacity.get_df()))
+        self.assertEqual(team1_capacity.query_capacity([CapacityQuery()]), dense_capacity.query_capacity([CapacityQuery()]))
+
+    def test_sparse_empty_team(self):
+        """Tests a team with nobody in it has only a total row in sparse mode too."""
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,12,22),
+            end_date=date(2023,12,28)
+        )
+        dense_capacity = TeamCapacity(Team('Team1', 'team1.yaml'), time_period, ChristmasHolidaySchedule())
+        dense_capacity.calculate()
+        team1_capacity = TeamCapacity(Team('Team1', 'team1.yaml'), time_period, ChristmasHolidaySchedule(), sparse=True)
+        team1_capacity.calculate()
+        self.assertEqual(team1_capacity.daily_column_headings, [])
+        df = team1_capacity.get_df()
+        self.assertEqual(list(df['Person']), ['Total'])
+        self.assertTrue(df.equals(dense_capacity.get_df()))
+        self.assertEqual(team1_capacity.total_capacity_data, dense_capacity.total_capacity_data)
+
+    def test_pickle(self):
+        """Tests pickling leaves out the holiday schedule, instrumentation and derived views."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.25
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,12,22),
+            end_date=date(2023,12,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            ChristmasHolidaySchedule(),
+            instrumentation=Instrumentation([lambda record: None]))
+        team1_capacity.calculate()
+        df = team1_capacity.get_df()
+        daily_capacity_by_day = team1_capacity.get_daily_capacity_by_day()
+        self.assertIsNotNone(team1_capacity.capacity_index)
+        self.assertIsNotNone(team1_capacity.detailed_capacity_data)
+        unpickled_capacity = pickle.loads(pickle.dumps(team1_capacity))
+        self.assertIsNone(unpickled_capacity.holiday_schedule)
+        self.assertIsNone(unpickled_capacity.df)
+        for view in ('_daily_capacity_by_day', '_capacity_index', '_detailed_capacity_data'):
+            self.assertIsNone(getattr(unpickled_capacity, view))
+        self.assertEqual(unpickled_capacity.get_daily_capacity_by_day(), daily_capacity_by_day)
+        self.assertIsInstance(unpickled_capacity.instrumentation, NullInstrumentation)
+        self.assertTrue(unpickled_capacity.get_df().equals(df))
+        self.assertIsNotNone(team1_capacity.holiday_schedule)
+
+    def test_recalculate_days(self):
+        """Tests recalculating a range of days picks up a new holiday."""
+        team1_document = """
+        team:
+          name: Team1
+          persons:
+          - name: Freddy UIDev
+            start_date: '2023-01-01'
+            end_date: '2030-12-31'
+            front_end: True
+            back_end: True
+            qe: False
+            devops: False
+            documentation: False
+            reserve_capacity: 0.0
+            location: US
+            out_of_office_dates: []
+        """
+        time_period = TimePeriod(
+            name='test_period',
+            start_date=date(2023,12,20),
+            end_date=date(2023,12,28)
+        )
+        team1 = Team('Team1', 'team1.yaml').load_from_yaml_as_string(team1_document)
+        holiday_schedule = HolidayScheduleForTesting()
+        team1_capacity = TeamCapacity(
+            team1,
+            time_period,
+            holiday_schedule)
+        team1_capacity.calculate()
+        self.assertEqual(team1_capacity.get_df()['Total'][1], 7.0)
+        team1_capacity.holiday_schedule = ChristmasHolidaySchedule()
+        team1_capacity.recalculate_days(date(2023,12,25), date(2024,1,31))
+        df = team1_capacity.get_df()
+        self.assertEqual(list(df['2023-12-25']), [0, 0])
+        self.assertEqual(df['2023-12-25'].dtype, 'int64')
+        self.assertEqual(list(df['Total']), [6.0, 6.0])
@@ -0,0 +1,58 @@
+"""Unit tests for workqueue.py"""
+import unittest
+from ..src.epic import Epic, EpicType
+from ..src.workqueue import order_epics
+
+class TestWorkQueue(unittest.TestCase):
+    """Tests for ordering epics"""
+
+    def test_order_by_priority(self):
+        """Tests epics are ordered by priority, keeping the order of epics with the same priority."""
+        epics = [
+            Epic('e1', 1, EpicType.QE, priority=2),
+            Epic('e2', 1, EpicType.QE),
+            Epic('e3', 1, EpicType.QE, priority=1),
+            Epic('e4', 1, EpicType.QE),
+        ]
+        self.assertEqual([epic.key for epic in order_epics(epics)], ['e2', 'e4', 'e3', 'e1'])
+
+    def test_order_by_dependency(self):
+        """Tests epics come after the epics they depend on whatever their priority."""
+        epics = [
+            Epic('e1', 1, EpicType.QE, priority=0, depends_on=('e3',)),
+            Epic('e2', 1, EpicType.QE, priority=5),
+            Epic('e3', 1, EpicType.QE, priority=9, depends_on=('e2',)),
+            Epic('e4', 1, EpicType.QE, priority=1, depends_on=('e2', 'e3')),
+        ]
+        self.assertEqual([epic.key for epic in order_epics(epics)], ['e2', 'e3', 'e1', 'e4'])
+
+    def test_order_deep_dependency_chain(self):
+        """Tests a long chain of dependencies listed in reverse."""
+        epics = [Epic(f'e{i}', 1, EpicType.QE, depends_on=(f'e{i+1}',)) for i in range(5000)]
+        epics.append(Epic('e5000', 1, EpicType.QE))
+        self.assertEqual([epic.key for epic in order_epics(epics)], [f'e{i}' for i in range(5000, -1, -1)])
+
+    def test_order_invalid_dependencies(self):
+        """Tests unknown, duplicate and circular dependencies are rejected."""
+        self.assertRaisesRegex(ValueError, 'unknown epic e9', order_epics, [
+            Epic('e1', 1, EpicType.QE, depends_on=('e9',))])
+        self.assertRaisesRegex(ValueError, 'duplicate epic e2', order_epics, [
+            Epic('e1', 1, EpicType.QE, depends_on=('e2',)), Epic('e2', 1, EpicType.QE), Epic('e2', 1, EpicType.QE)])
+        self.assertRaisesRegex(ValueError, 'circular dependencies: e1, e2', order_epics, [
+            Epic('e1', 1, EpicType.QE, depends_on=('e2',)),
+            Epic('e2', 1, EpicType.QE, depends_on=('e1',)),
+            Epic('e3', 1, EpicType.QE)])
+        self.assertEqual(len(order_epics([Epic('e1', 1, EpicType.QE), Epic('e1', 2, EpicType.QE)])), 2)
+
+    def test_order_ignoring_unknown_dependencies(self):
+        """Tests dependencies on epics that are not being ordered can be ignored."""
+        epics = [
+            Epic('e1', 1, EpicType.QE, priority=2, depends_on=('e9', 'e2')),
+            Epic('e2', 1, EpicType.QE, priority=1, depends_on=('e9',)),
+            Epic('e3', 1, EpicType.QE, priority=3),
+        ]
+        self.assertEqual(
+            [epic.key for epic in order_epics(epics, ignore_unknown_dependencies=True)], ['e2', 'e1', 'e3'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for yamlloader.py"""
+import os
+import tempfile
+import unittest
+from datetime import date
+from ..src.yamlloader import load_yaml, load_cached
+from ..src.epic import Epic, EpicType
+from ..src.feature import Features
+from ..src.team import Team
+
+TEAM_DOCUMENT = """
+team:
+  name: Team1
+  persons:
+  - name: Freddy UIDev
+    start_date: '2023-01-01'
+    end_date: '2030-12-31'
+    front_end: True
+    back_end: False
+    qe: False
+    devops: False
+    documentation: False
+    reserve_capacity: 0.1
+    location: US
+    out_of_office_dates:
+    - '2023-10-03'
+    - '2023-11-01..2023-11-05'
+"""
+
+FEATURES_DOCUMENT = """
+features:
+- key: FEAT-1
+  epics:
+  - key: EPIC-1
+    estimated_size: 5
+    epic_type: FRONTEND
+  - key: EPIC-2
+    estimated_size: 3
+    epic_type: QE
+"""
+
+class TestYamlLoader(unittest.TestCase):
+    """Tests for loading yaml and caching parsed models"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        self.parse_count = 0
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        """Writes a file into the temporary directory and returns its path."""
+        file_path = os.path.join(self.directory.name, name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return file_path
+
+    def parse(self, content: bytes):
+        """Counts the calls to parse."""
+        self.parse_count += 1
+        return load_yaml(content)
+
+    def test_load_yaml(self):
+        """Tests loading yaml from strings and bytes."""
+        self.assertEqual(load_yaml('a: [1, 2]'), {'a': [1, 2]})
+        self.assertEqual(load_yaml(b'a: b'), {'a': 'b'})
+
+    def test_load_cached(self):
+        """Tests the parsed models are reused until the file changes."""
+        file_path = self.write('data.yaml', 'a: 1')
+        self.assertEqual(load_cached(file_path, self.cache_dir, self.parse), {'a': 1})
+        self.assertEqual(load_cached(file_path, self.cache_dir, self.parse), {'a': 1})
+        self.assertEqual(self.parse_count, 1)
+
+        # touching the file does not change its content so the models are reused
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(load_cached(file_path, self.cache_dir, self.parse), {'a': 1})
+        self.assertEqual(self.parse_count, 1)
+
+        self.write('data.yaml', 'a: 22')
+        self.assertEqual(load_cached(file_path, self.cache_dir, self.parse), {'a': 22})
+        self.assertEqual(self.parse_count, 2)
+
+    def test_load_cached_ignores_corrupt_entries(self):
+        """Tests a corrupt cache entry is replaced."""
+        file_path = self.write('data.yaml', 'a: 1')
+        load_cached(file_path, self.cache_dir, self.parse)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'wb') as file:
+                file.write(b'not a pickle')
+        self.assertEqual(load_cached(file_path, self.cache_dir, self.parse), {'a': 1})
+        self.assertEqual(self.parse_count, 2)
+
+    def test_load_team_and_features_with_cache(self):
+        """Tests teams and features loaded through the cache are the same as those loaded directly."""
+        team_file = self.write('team1.yaml', TEAM_DOCUMENT)
+        features_file = self.write('features.yaml', FEATURES_DOCUMENT)
+        for _ in range(2):
+            team = Team('Team1', team_file).load_from_yaml_file(cache_dir=self.cache_dir)
+            self.assertEqual(team.name, 'Team1')
+            self.assertEqual(team.person_list, Team('Team1', team_file).load_from_yaml_file().person_list)
+            person = team.person_list[0]
+            self.assertTrue(person.is_out_of_office(date(2023,11,3)))
+            self.assertEqual(person.reserve_capacity, 0.1)
+
+            features = Features(features_file).load_from_yaml_file(cache_dir=self.cache_dir)
+            self.assertEqual([feature.key for feature in features.feature_list], ['FEAT-1'])
+            self.assertEqual(features.get_epics(), [
+                Epic('EPIC-1', 5, EpicType.FRONTEND),
+                Epic('EPIC-2', 3, EpicType.QE),
+            ])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
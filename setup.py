@@ -40,9 +40,10 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Office/Business :: Scheduling"
     ],
-    install_requires=["pandas >= 2.1.1", "pyYAML >= 6.0.1"],
+    install_requires=["numpy >= 1.23", "pandas >= 2.1.1", "pyYAML >= 6.0.1"],
     extras_require={
-        "dev": ["twine>=4.0.2"]
+        "dev": ["twine>=4.0.2"],
+        "arrow": ["pyarrow>=14.0.1"]
     },
     python_requires=">=3.10",
     cmdclass={